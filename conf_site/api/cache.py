@@ -0,0 +1,91 @@
+"""
+Caching of API responses.
+
+Every model that API responses contain has a version in the cache,
+which is replaced once a change to one of its objects is committed.
+Each response has a strong ETag derived from its request and the
+versions of its models. Requests whose If-None-Match header contains
+that ETag are answered with 304 Not Modified, and the serialized data
+of other responses is cached under their ETag, so unchanged responses
+are served without querying their data.
+"""
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def model_version_key(model):
+    return "api_version_{}".format(model._meta.label_lower)
+
+
+def get_model_versions(models):
+    """Return the current version of each model."""
+    keys = [model_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            version = uuid.uuid4().hex
+            # Another process may have stored a version in the meantime.
+            if not cache.add(key, version, None):
+                version = cache.get(key, version)
+            versions[key] = version
+    return [versions[key] for key in keys]
+
+
+def bump_model_version(model):
+    """Replace a model's version, which changes the ETags of responses."""
+    cache.set(model_version_key(model), uuid.uuid4().hex, None)
+
+
+def get_response_etag(request, models):
+    """Return the ETag of a response to this request."""
+    # Responses contain absolute URLs, and their format can be
+    # chosen by the Accept header as well as by the URL.
+    parts = [
+        request.build_absolute_uri(),
+        request.accepted_renderer.format,
+    ] + get_model_versions(models)
+    return '"{}"'.format(
+        hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+    )
+
+
+def etag_matches(request, etag):
+    """Check whether a request's If-None-Match header includes an ETag."""
+    etags = parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+    # If-None-Match uses the weak comparison function.
+    return "*" in etags or etag in [
+        request_etag[2:] if request_etag.startswith("W/") else request_etag
+        for request_etag in etags
+    ]
+
+
+def get_cached_response(request, models, get_response):
+    """
+    Return a response to a request, calling get_response() to create
+    it only if it has not been cached since any of models changed.
+    """
+    etag = get_response_etag(request, models)
+    cache_key = "api_response_{}".format(etag.strip('"'))
+    if etag_matches(request, etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        data = cache.get(cache_key)
+        if data is not None:
+            response = Response(data)
+        else:
+            response = get_response()
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            cache.set(cache_key, response.data, settings.CACHE_TIMEOUT_LONG)
+    response["ETag"] = etag
+    # Clients must check that their copies are still current.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
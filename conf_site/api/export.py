@@ -0,0 +1,130 @@
+"""
+Streaming export of the conference's data as newline-delimited JSON.
+
+Each line is the record of one object, containing its type, primary
+key, time of last modification and its data as returned by the API.
+Objects are exported one type at a time in primary key order. They are
+loaded in batches that start after the previous batch's last primary
+key, so neither the server nor the client holds the whole export in
+memory. The last line of a complete export is an "end" record, whose
+timestamp can be passed as the `since` parameter of the next export
+to only receive objects that have been modified since then.
+"""
+import json
+
+from django.utils import timezone
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+from symposion.conference.models import Conference, Section
+from symposion.schedule.models import Day, Presentation, Room, Slot
+from symposion.speakers.models import Speaker
+from symposion.sponsorship.models import Sponsor
+
+from .serializers import (
+    ConferenceSerializer,
+    DaySerializer,
+    PresentationSerializer,
+    RoomSerializer,
+    SectionSerializer,
+    SlotSerializer,
+    SpeakerSerializer,
+    SponsorSerializer,
+)
+
+
+EXPORT_BATCH_SIZE = 500
+
+# Exported types, in the order that they are exported.
+EXPORT_TYPES = [
+    ('conference', Conference.objects.all(), ConferenceSerializer),
+    ('section', Section.objects.all(), SectionSerializer),
+    ('day', Day.objects.all(), DaySerializer),
+    ('room', Room.objects.all(), RoomSerializer),
+    (
+        'slot',
+        Slot.objects.select_related('day', 'kind'),
+        SlotSerializer,
+    ),
+    (
+        'presentation',
+        Presentation.objects.select_related(
+            'section__conference',
+            'slot__day',
+            'slot__kind',
+            'speaker__user',
+        ).prefetch_related('additional_speakers'),
+        PresentationSerializer,
+    ),
+    ('speaker', Speaker.objects.select_related('user'), SpeakerSerializer),
+    ('sponsor', Sponsor.objects.select_related('level'), SponsorSerializer),
+]
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Renders data (such as error messages) as a single line of JSON."""
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return (encode_record(data) + '\n').encode('utf-8')
+
+
+def encode_record(record):
+    return json.dumps(record, cls=JSONEncoder, ensure_ascii=False)
+
+
+def iterate_in_batches(queryset, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Yield the objects of a queryset in primary key order.
+
+    Unlike QuerySet.iterator(), this applies the queryset's
+    prefetch_related() lookups to each batch.
+    """
+    queryset = queryset.order_by('pk')
+    last_pk = None
+    while True:
+        batch_queryset = queryset
+        if last_pk is not None:
+            batch_queryset = queryset.filter(pk__gt=last_pk)
+        batch = list(batch_queryset[:batch_size])
+        for obj in batch:
+            yield obj
+        if len(batch) < batch_size:
+            return
+        last_pk = batch[-1].pk
+
+
+def export_records(request, since=None):
+    """Yield the records of objects modified since `since` (or all)."""
+    # Objects changed during the export are exported again next time.
+    started = timezone.now()
+    context = {'request': request}
+    for record_type, queryset, serializer_class in EXPORT_TYPES:
+        # One serializer is reused so that its fields are only built once.
+        serializer = serializer_class(context=context)
+        if since is not None:
+            queryset = queryset.filter(date_last_modified__gte=since)
+        for obj in iterate_in_batches(queryset):
+            yield {
+                'type': record_type,
+                'id': obj.pk,
+                'modified': obj.date_last_modified,
+                'data': serializer.to_representation(obj),
+            }
+    yield {'type': 'end', 'timestamp': started}
+
+
+def export_lines(records, batch_size=EXPORT_BATCH_SIZE):
+    """Yield chunks of newline-delimited JSON for a sequence of records."""
+    lines = []
+    for record in records:
+        lines.append(encode_record(record) + '\n')
+        if len(lines) == batch_size:
+            yield ''.join(lines).encode('utf-8')
+            lines = []
+    if lines:
+        yield ''.join(lines).encode('utf-8')
@@ -0,0 +1,25 @@
+from rest_framework.pagination import CursorPagination
+
+
+class OptionalCursorPagination(CursorPagination):
+    """
+    Paginates results with a cursor when a page is requested.
+
+    Clients request the first page with the `page_size` parameter and
+    follow each response's `next` link. Requests without a `cursor`
+    or `page_size` parameter receive every result, unpaginated.
+    """
+    ordering = 'pk'
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if (
+            self.cursor_query_param not in request.query_params
+            and self.page_size_query_param not in request.query_params
+        ):
+            return None
+        return super(OptionalCursorPagination, self).paginate_queryset(
+            queryset, request, view
+        )
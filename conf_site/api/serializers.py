@@ -1,23 +1,96 @@
+from collections import OrderedDict
+
 from rest_framework import serializers
-from rest_framework.reverse import reverse_lazy
+from rest_framework.reverse import reverse
 
-from symposion.conference.models import Conference
+from symposion.conference.models import Conference, Section
 from symposion.speakers.models import Speaker
-from symposion.schedule.models import Presentation, Slot
+from symposion.schedule.models import Day, Presentation, Room, Slot
 from symposion.sponsorship.models import Sponsor, SponsorLevel
 
 
-class SpeakerSerializer(serializers.ModelSerializer):
-    username = serializers.StringRelatedField(source='user')
-    absolute_url = serializers.SerializerMethodField()
+# Reversed in place of URL arguments to find where they appear in URLs.
+URL_PLACEHOLDER = 7340000000
+
+
+class AbsoluteURLField(serializers.ReadOnlyField):
+    """
+    Returns the absolute URL of an object's page.
+
+    The page's URL is reversed once per request with placeholder
+    arguments, and each object's URL is built by replacing them with
+    the object's attributes named in `url_args`.
+    """
+
+    def __init__(self, view_name, url_args, **kwargs):
+        self.view_name = view_name
+        self.url_args = url_args
+        self.url_template = None
+        kwargs['source'] = '*'
+        super(AbsoluteURLField, self).__init__(**kwargs)
+
+    def get_url_template(self):
+        if self.url_template is None:
+            placeholders = [
+                str(URL_PLACEHOLDER + index)
+                for index in range(len(self.url_args))
+            ]
+            url = reverse(
+                self.view_name,
+                args=placeholders,
+                request=self.context['request'],
+            )
+            url = url.replace('{', '{{').replace('}', '}}')
+            for index, placeholder in enumerate(placeholders):
+                url = url.replace(placeholder, '{%d}' % index)
+            self.url_template = url
+        return self.url_template
+
+    def to_representation(self, obj):
+        return self.get_url_template().format(
+            *[getattr(obj, url_arg) for url_arg in self.url_args]
+        )
+
 
-    def get_absolute_url(self, obj):
-        return reverse_lazy(
-            'speaker_profile',
-            kwargs={"pk": obj.pk, "slug": obj.slug},
-            request=self.context['request'],
+class SparseFieldsetSerializer(serializers.ModelSerializer):
+    """
+    Only includes the fields named in the request's `fields` parameter.
+
+    Fields are limited for the requested objects, not for the objects
+    nested in them. Requests without `fields` include every field.
+    """
+
+    def get_requested_fields(self):
+        # Objects nested in the requested objects have other fields.
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        request = self.context.get('request')
+        if parent is not None or request is None:
+            return None
+        requested_fields = request.query_params.get('fields')
+        if not requested_fields:
+            return None
+        return set(
+            field_name.strip() for field_name in requested_fields.split(',')
         )
 
+    def get_fields(self):
+        fields = super(SparseFieldsetSerializer, self).get_fields()
+        requested_fields = self.get_requested_fields()
+        if requested_fields is None:
+            return fields
+        return OrderedDict(
+            (field_name, field)
+            for field_name, field in fields.items()
+            if field_name in requested_fields
+        )
+
+
+class SpeakerSerializer(SparseFieldsetSerializer):
+    username = serializers.StringRelatedField(source='user')
+    absolute_url = AbsoluteURLField('speaker_profile', ['pk', 'slug'])
+
     class Meta:
         model = Speaker
         fields = (
@@ -32,7 +105,28 @@ class ConferenceSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Conference
-        exclude = ('id',)
+        exclude = ('id', 'date_last_modified')
+
+
+class SectionSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = Section
+        exclude = ('id', 'date_last_modified')
+
+
+class DaySerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = Day
+        exclude = ('id', 'date_last_modified')
+
+
+class RoomSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = Room
+        exclude = ('id', 'date_last_modified')
 
 
 class SlotSerializer(serializers.ModelSerializer):
@@ -41,25 +135,31 @@ class SlotSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Slot
-        exclude = ('id', 'content_override', 'content_override_html')
+        exclude = (
+            'id',
+            'content_override',
+            'content_override_html',
+            'date_last_modified',
+        )
 
 
-class PresentationSerializer(serializers.ModelSerializer):
+class PresentationSerializer(SparseFieldsetSerializer):
     speaker = SpeakerSerializer()
     slot = SlotSerializer()
     section = serializers.StringRelatedField()
-    absolute_url = serializers.SerializerMethodField()
-
-    def get_absolute_url(self, obj):
-        return reverse_lazy(
-            'schedule_presentation_detail',
-            args=[obj.pk, obj.slug],
-            request=self.context['request'],
-        )
+    absolute_url = AbsoluteURLField(
+        'schedule_presentation_detail', ['pk', 'slug']
+    )
 
     class Meta:
         model = Presentation
-        exclude = ('id', 'description_html', 'abstract_html', 'proposal_base')
+        exclude = (
+            'id',
+            'description_html',
+            'abstract_html',
+            'proposal_base',
+            'date_last_modified',
+        )
 
 
 class SponsorLevelSerializer(serializers.ModelSerializer):
@@ -69,16 +169,9 @@ class SponsorLevelSerializer(serializers.ModelSerializer):
         fields = ('name', 'cost')
 
 
-class SponsorSerializer(serializers.ModelSerializer):
+class SponsorSerializer(SparseFieldsetSerializer):
     level = SponsorLevelSerializer()
-    absolute_url = serializers.SerializerMethodField()
-
-    def get_absolute_url(self, obj):
-        return reverse_lazy(
-            'sponsor_detail',
-            kwargs={'pk': obj.pk},
-            request=self.context['request'],
-        )
+    absolute_url = AbsoluteURLField('sponsor_detail', ['pk'])
 
     class Meta:
         model = Sponsor
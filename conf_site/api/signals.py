@@ -0,0 +1,53 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from symposion.conference.models import Conference, Section
+from symposion.schedule.models import Day, Presentation, Slot, SlotKind
+from symposion.speakers.models import Speaker
+from symposion.sponsorship.models import Sponsor, SponsorLevel
+
+from .cache import bump_model_version
+
+
+# Models that API responses contain.
+API_MODELS = [
+    Conference,
+    Day,
+    Presentation,
+    Section,
+    Slot,
+    SlotKind,
+    Speaker,
+    Sponsor,
+    SponsorLevel,
+    User,
+]
+
+
+def bump_api_model_version(sender, **kwargs):
+    # Users are saved whenever they log in, which does not
+    # change the data of any response.
+    if kwargs.get("update_fields") == frozenset(["last_login"]):
+        return
+    # Until the change is committed, other requests would cache
+    # responses containing the old data under the new version.
+    transaction.on_commit(lambda: bump_model_version(sender))
+
+
+for model in API_MODELS:
+    post_save.connect(
+        bump_api_model_version,
+        sender=model,
+        dispatch_uid="api_post_save_{}".format(model._meta.label_lower),
+    )
+    post_delete.connect(
+        bump_api_model_version,
+        sender=model,
+        dispatch_uid="api_post_delete_{}".format(model._meta.label_lower),
+    )
+m2m_changed.connect(
+    bump_api_model_version,
+    sender=Presentation.additional_speakers.through,
+    dispatch_uid="api_m2m_changed_presentation_speakers",
+)
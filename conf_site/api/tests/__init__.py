@@ -1,4 +1,5 @@
 from django.contrib.auth.models import User
+from django.core.cache import cache
 
 from rest_framework.test import APITestCase
 from symposion.schedule.tests.factories import ConferenceFactory
@@ -13,3 +14,8 @@ class ConferenceSiteAPITestCase(APITestCase):
             password='admin',
         )
         cls.conference = ConferenceFactory.create()
+
+    def setUp(self):
+        super(ConferenceSiteAPITestCase, self).setUp()
+        # Cached responses would outlive the objects of other tests.
+        cache.clear()
@@ -0,0 +1,139 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+
+from conf_site.api.tests import ConferenceSiteAPITestCase
+from conf_site.schedule.tests.factories import PresentationFactory
+from symposion.tests.utils import run_on_commit_callbacks
+
+
+class ConferenceSiteAPICachingTestCase(ConferenceSiteAPITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super(ConferenceSiteAPICachingTestCase, cls).setUpTestData()
+        cls.presentation = PresentationFactory.create()
+
+    def setUp(self):
+        super(ConferenceSiteAPICachingTestCase, self).setUp()
+        self.client.login(username='admin@pydata.org', password='admin')
+
+    def _get_presentations(self, **headers):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('presentation-list'), **headers)
+        presentation_queries = [
+            query for query in queries
+            if 'symposion_schedule_presentation' in query['sql']
+        ]
+        return response, presentation_queries
+
+    def test_not_modified(self):
+        response, queries = self._get_presentations()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        self.assertTrue(queries)
+
+        for if_none_match in [etag, 'W/' + etag, '"other", ' + etag]:
+            response, queries = self._get_presentations(
+                HTTP_IF_NONE_MATCH=if_none_match
+            )
+            self.assertEqual(
+                response.status_code, status.HTTP_304_NOT_MODIFIED
+            )
+            self.assertEqual(response['ETag'], etag)
+            self.assertEqual(queries, [])
+
+    def test_cached_data(self):
+        first_response, queries = self._get_presentations()
+        response, queries = self._get_presentations(
+            HTTP_IF_NONE_MATCH='"other"'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), first_response.json())
+        self.assertEqual(queries, [])
+
+    def test_changes_replace_etag(self):
+        etag = self._get_presentations()[0]['ETag']
+        self.presentation.title = 'A new title'
+        with run_on_commit_callbacks():
+            self.presentation.save()
+        response, queries = self._get_presentations(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()[0]['title'], 'A new title')
+
+        etag = response['ETag']
+        self.presentation.speaker.name = 'A new name'
+        with run_on_commit_callbacks():
+            self.presentation.speaker.save()
+        response = self._get_presentations(HTTP_IF_NONE_MATCH=etag)[0]
+        self.assertEqual(response.json()[0]['speaker']['name'], 'A new name')
+
+    def test_changes_replace_etag_on_commit(self):
+        etag = self._get_presentations()[0]['ETag']
+        with run_on_commit_callbacks():
+            self.presentation.title = 'A new title'
+            self.presentation.save()
+            # Until the change is committed, other requests would
+            # read the old data, so they must keep the old ETag.
+            response = self._get_presentations(HTTP_IF_NONE_MATCH=etag)[0]
+            self.assertEqual(
+                response.status_code, status.HTTP_304_NOT_MODIFIED
+            )
+            self.assertEqual(response['ETag'], etag)
+            # Data read before the commit is cached under the old ETag.
+            response = self._get_presentations(
+                HTTP_IF_NONE_MATCH='"other"'
+            )[0]
+            self.assertEqual(response['ETag'], etag)
+        response = self._get_presentations(HTTP_IF_NONE_MATCH=etag)[0]
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()[0]['title'], 'A new title')
+
+    def test_logging_in_keeps_etag(self):
+        etag = self._get_presentations()[0]['ETag']
+        self.client.login(username='admin@pydata.org', password='admin')
+        response = self._get_presentations(HTTP_IF_NONE_MATCH=etag)[0]
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_depends_on_request(self):
+        etag = self._get_presentations()[0]['ETag']
+        response = self.client.get(
+            reverse('presentation-list'),
+            {'fields': 'title'},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.json()[0]), ['title'])
+
+    def test_forbidden_responses_are_not_cached(self):
+        self._get_presentations()
+        self.client.logout()
+        response = self.client.get(reverse('presentation-list'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertNotIn('ETag', response)
+
+    def test_conference_not_modified(self):
+        self.client.logout()
+        etag = self.client.get(reverse('conference-detail'))['ETag']
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse('conference-detail'), HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse(
+            [
+                query for query in queries
+                if 'symposion_conference' in query['sql']
+            ]
+        )
+        self.conference.title = 'A new title'
+        with run_on_commit_callbacks():
+            self.conference.save()
+        response = self.client.get(
+            reverse('conference-detail'), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.json()['title'], 'A new title')
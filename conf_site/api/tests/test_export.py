@@ -0,0 +1,119 @@
+import gzip
+import json
+
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+
+from conf_site.api.export import iterate_in_batches
+from conf_site.api.tests import ConferenceSiteAPITestCase
+from conf_site.schedule.tests.factories import PresentationFactory
+from conf_site.sponsorship.tests import SponsorFactory
+from symposion.schedule.models import Presentation, Room
+
+
+class ConferenceSiteAPIExportTestCase(ConferenceSiteAPITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super(ConferenceSiteAPIExportTestCase, cls).setUpTestData()
+        cls.presentations = PresentationFactory.create_batch(size=3)
+        cls.sponsor = SponsorFactory.create()
+        Room.objects.create(
+            schedule=cls.presentations[0].slot.day.schedule,
+            name='Main Hall',
+            order=1,
+        )
+
+    def _export(self, **parameters):
+        self.client.login(username='admin@pydata.org', password='admin')
+        return self.client.get(reverse('export'), parameters)
+
+    def _records(self, response):
+        content = b''.join(response.streaming_content)
+        if response.get('Content-Encoding') == 'gzip':
+            content = gzip.decompress(content)
+        return [json.loads(line) for line in content.decode().splitlines()]
+
+    def test_export_anonymous_user(self):
+        response = self.client.get(reverse('export'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_export(self):
+        response = self._export()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        records = self._records(response)
+        record_types = [record['type'] for record in records]
+        # Records are grouped by type, in the order that they are exported.
+        self.assertEqual(
+            sorted(set(record_types), key=record_types.index),
+            [
+                'conference',
+                'section',
+                'day',
+                'room',
+                'slot',
+                'presentation',
+                'speaker',
+                'sponsor',
+                'end',
+            ],
+        )
+        presentation_records = [
+            record for record in records if record['type'] == 'presentation'
+        ]
+        self.assertEqual(
+            [record['id'] for record in presentation_records],
+            [presentation.pk for presentation in self.presentations],
+        )
+        self.assertEqual(
+            presentation_records[0]['data']['title'],
+            self.presentations[0].title,
+        )
+        self.assertEqual(
+            presentation_records[0]['data']['speaker']['name'],
+            self.presentations[0].speaker.name,
+        )
+        self.assertEqual(records[-1]['type'], 'end')
+
+    def test_export_since(self):
+        since = timezone.now()
+        presentation = self.presentations[1]
+        presentation.title = 'A new title'
+        presentation.save()
+        records = self._records(self._export(since=since.isoformat()))
+        self.assertEqual(
+            [(record['type'], record['id']) for record in records[:-1]],
+            [('presentation', presentation.pk)],
+        )
+        self.assertEqual(records[0]['data']['title'], 'A new title')
+
+        # Nothing has been modified since the last export started.
+        records = self._records(self._export(since=records[-1]['timestamp']))
+        self.assertEqual([record['type'] for record in records], ['end'])
+
+    def test_export_invalid_since(self):
+        response = self._export(since='yesterday')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_gzip(self):
+        self.client.login(username='admin@pydata.org', password='admin')
+        response = self.client.get(
+            reverse('export'), HTTP_ACCEPT_ENCODING='gzip, deflate'
+        )
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        records = self._records(response)
+        self.assertEqual(records[0]['type'], 'conference')
+        self.assertEqual(records[-1]['type'], 'end')
+
+    def test_iterate_in_batches(self):
+        presentations = Presentation.objects.prefetch_related(
+            'additional_speakers'
+        )
+        with self.assertNumQueries(4):
+            self.assertEqual(
+                list(iterate_in_batches(presentations, batch_size=2)),
+                self.presentations,
+            )
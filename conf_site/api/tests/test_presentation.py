@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from rest_framework import status
@@ -16,6 +18,8 @@ class ConferenceSiteAPISponsorTestCase(ConferenceSiteAPITestCase):
         cls.speaker = SpeakerFactory.create()
         cls.schedule = ScheduleFactory.create()
         cls.presentation = PresentationFactory.create()
+        cls.presentation.additional_speakers.add(SpeakerFactory.create())
+        cls.other_presentations = PresentationFactory.create_batch(size=4)
 
     def test_presentation_list_api_anonymous_user(self):
         response = self.client.get(reverse('presentation-list'))
@@ -38,3 +42,71 @@ class ConferenceSiteAPISponsorTestCase(ConferenceSiteAPITestCase):
             reverse('presentation-detail', args=[self.presentation.pk])
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_presentation_list_is_unpaginated_by_default(self):
+        self.client.login(username='admin@pydata.org', password='admin')
+        response = self.client.get(reverse('presentation-list'))
+        self.assertEqual(len(response.json()), 5)
+
+    def test_presentation_list_pagination(self):
+        self.client.login(username='admin@pydata.org', password='admin')
+        url = reverse('presentation-list') + '?page_size=2'
+        titles = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            page = response.json()
+            self.assertLessEqual(len(page['results']), 2)
+            titles.extend(result['title'] for result in page['results'])
+            url = page['next']
+        self.assertEqual(
+            titles,
+            [self.presentation.title] + [
+                presentation.title
+                for presentation in self.other_presentations
+            ],
+        )
+
+    def test_presentation_list_queries(self):
+        """Verify that pages do not use more queries for more results."""
+        self.client.login(username='admin@pydata.org', password='admin')
+        query_counts = []
+        for page_size in [1, 5]:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(
+                    reverse('presentation-list'), {'page_size': page_size}
+                )
+            self.assertEqual(len(response.json()['results']), page_size)
+            query_counts.append(len(queries))
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_presentation_sparse_fieldsets(self):
+        self.client.login(username='admin@pydata.org', password='admin')
+        response = self.client.get(
+            reverse('presentation-detail', args=[self.presentation.pk]),
+            {'fields': 'title,speaker,absolute_url,unknown'},
+        )
+        presentation = response.json()
+        self.assertEqual(
+            set(presentation), {'title', 'speaker', 'absolute_url'}
+        )
+        self.assertEqual(presentation['title'], self.presentation.title)
+        self.assertEqual(
+            presentation['absolute_url'],
+            'http://testserver' + reverse(
+                'schedule_presentation_detail',
+                args=[self.presentation.pk, self.presentation.slug],
+            ),
+        )
+        # Nested objects keep all of their fields.
+        self.assertEqual(
+            presentation['speaker']['absolute_url'],
+            'http://testserver' + reverse(
+                'speaker_profile',
+                args=[
+                    self.presentation.speaker.pk,
+                    self.presentation.speaker.slug,
+                ],
+            ),
+        )
+        self.assertIn('name', presentation['speaker'])
@@ -13,4 +13,5 @@ router.register(r'sponsor', views.SponsorViewSet)
 urlpatterns = [
     url(r'^', include(router.urls)),
     url(r'^$', views.ConferenceDetail.as_view(), name='conference-detail'),
+    url(r'^export/$', views.ExportView.as_view(), name='export'),
 ]
@@ -1,12 +1,25 @@
+import re
+
+from django.contrib.auth.models import User
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.dateparse import parse_datetime
+from django.utils.text import compress_sequence
 from rest_framework import viewsets
 from rest_framework import views
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser
-from symposion.conference.models import Conference
+from symposion.conference.models import Conference, Section
 from symposion.speakers.models import Speaker
-from symposion.schedule.models import Presentation
-from symposion.sponsorship.models import Sponsor
+from symposion.schedule.models import Day, Presentation, Slot, SlotKind
+from symposion.sponsorship.models import Sponsor, SponsorLevel
 
+from .cache import get_cached_response
+from .export import NDJSONRenderer, export_lines, export_records
+from .pagination import OptionalCursorPagination
 from .serializers import (
     ConferenceSerializer,
     SpeakerSerializer,
@@ -16,17 +29,43 @@ from .serializers import (
 
 
 class BaseViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Lists can be paginated with the `page_size` and `cursor`
+    parameters, and the `fields` parameter selects which fields
+    of each object are returned.
+
+    Responses are cached until any of `cache_models` change.
+    """
+    cache_models = ()
+    pagination_class = OptionalCursorPagination
 
     def get_serializer_context(self):
         '''Pass request variable to obtain absolute URLs.'''
         return {'request': self.request}
 
+    def list(self, request, *args, **kwargs):
+        return get_cached_response(
+            request,
+            self.cache_models,
+            lambda: super(BaseViewSet, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return get_cached_response(
+            request,
+            self.cache_models,
+            lambda: super(BaseViewSet, self).retrieve(
+                request, *args, **kwargs
+            ),
+        )
+
 
 class SpeakerViewSet(BaseViewSet):
     """
     Returns a the list of all speaker profiles.
     Allows lookups through the `id` parameter.
     """
+    cache_models = (Speaker, User)
     permission_classes = (IsAdminUser,)
     queryset = Speaker.objects.select_related(
         'user',
@@ -42,7 +81,12 @@ class ConferenceDetail(views.APIView):
     Conference model.
     """
 
-    def get(request, *args, **kwargs):
+    def get(self, request, *args, **kwargs):
+        return get_cached_response(
+            request, (Conference,), self.get_conference_response
+        )
+
+    def get_conference_response(self):
         conference = Conference.objects.first()
         serializer = ConferenceSerializer(conference)
         return Response(serializer.data)
@@ -53,8 +97,26 @@ class PresentationViewSet(BaseViewSet):
     Returns a the list of all presentations within the conference.
     Allows lookups through the `id` parameter.
     """
+    cache_models = (
+        Conference,
+        Day,
+        Presentation,
+        Presentation.additional_speakers.through,
+        Section,
+        Slot,
+        SlotKind,
+        Speaker,
+        User,
+    )
     permission_classes = (IsAdminUser,)
-    queryset = Presentation.objects.select_related('slot').all()
+    queryset = Presentation.objects.select_related(
+        'section__conference',
+        'slot__day',
+        'slot__kind',
+        'speaker__user',
+    ).prefetch_related(
+        'additional_speakers',
+    )
     serializer_class = PresentationSerializer
 
 
@@ -63,6 +125,57 @@ class SponsorViewSet(BaseViewSet):
     Returns a the list of all sponsors for the conference.
     Allows lookups through the `id` parameter.
     """
+    cache_models = (Sponsor, SponsorLevel)
     permission_classes = (IsAdminUser,)
-    queryset = Sponsor.objects.defer('annotation').all()
+    queryset = Sponsor.objects.select_related('level')
     serializer_class = SponsorSerializer
+
+
+ACCEPTS_GZIP_RE = re.compile(r'\bgzip\b')
+
+
+class ExportView(views.APIView):
+    """
+    Streams the conference's sections, days, rooms, slots, presentations,
+    speakers and sponsors as newline-delimited JSON.
+
+    The `since` parameter (an ISO 8601 date and time) limits the export
+    to objects modified since then. Deleted objects are not exported.
+    Responses are compressed for clients that accept gzip encoding.
+    """
+    permission_classes = (IsAdminUser,)
+    renderer_classes = (NDJSONRenderer, JSONRenderer)
+
+    def get_since(self):
+        since = self.request.query_params.get('since')
+        if since is None:
+            return None
+        try:
+            since = parse_datetime(since)
+        except ValueError:
+            since = None
+        if since is None:
+            raise ValidationError(
+                {'since': ['Enter a valid ISO 8601 date and time.']}
+            )
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        return since
+
+    def get(self, request, *args, **kwargs):
+        content = export_lines(export_records(request, self.get_since()))
+        accepts_gzip = ACCEPTS_GZIP_RE.search(
+            request.META.get('HTTP_ACCEPT_ENCODING', '')
+        )
+        if accepts_gzip:
+            content = compress_sequence(content)
+        response = StreamingHttpResponse(
+            content, content_type=NDJSONRenderer.media_type
+        )
+        if accepts_gzip:
+            response['Content-Encoding'] = 'gzip'
+        patch_vary_headers(response, ('Accept-Encoding',))
+        response['Content-Disposition'] = (
+            'attachment; filename="conference.ndjson"'
+        )
+        return response
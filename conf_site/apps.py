@@ -9,3 +9,4 @@ class AppConfig(BaseAppConfig):
 
     def ready(self):
         import_module("conf_site.receivers")
+        import_module("conf_site.api.signals")
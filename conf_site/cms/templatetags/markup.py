@@ -3,7 +3,7 @@ from django.template.defaultfilters import stringfilter
 from django.utils.encoding import force_str
 from django.utils.safestring import mark_safe
 
-import markdown as markdown_library
+from symposion.markdown_parser import parse
 
 
 register = template.Library()
@@ -15,9 +15,4 @@ def markdown(value):
     """<https://www.dominicrodger.com/2013/01/16/django-markdown/>"""
     extensions = ["nl2br", ]
 
-    return mark_safe(
-        markdown_library.markdown(
-            force_str(value),
-            extensions=extensions,
-        )
-    )
+    return mark_safe(parse(force_str(value), extensions=extensions))
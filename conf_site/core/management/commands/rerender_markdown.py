@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from conf_site.reviews.models import ProposalFeedback, ProposalVote
+from symposion.markdown_parser import render_many
+from symposion.proposals.models import ProposalBase
+from symposion.schedule.models import Presentation, Slot
+from symposion.schedule.pagecache import invalidate_schedule_pages
+from symposion.speakers.models import Speaker
+
+
+# Each model's Markdown fields and the fields that store their HTML.
+MARKDOWN_FIELDS = [
+    (
+        ProposalBase,
+        [
+            ("abstract", "abstract_html"),
+            ("additional_notes", "additional_notes_html"),
+        ],
+    ),
+    (
+        Presentation,
+        [("description", "description_html"), ("abstract", "abstract_html")],
+    ),
+    (Speaker, [("biography", "biography_html")]),
+    (Slot, [("content_override", "content_override_html")]),
+    (ProposalVote, [("comment", "comment_html")]),
+    (ProposalFeedback, [("comment", "comment_html")]),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-renders the stored HTML of every Markdown field "
+        "without saving objects individually."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of rows to render and update at a time.",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count(),
+            help="Number of worker processes (1 renders in this process).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        # Limit the number of batches held in memory at once.
+        self.max_pending = options["processes"] * 2
+        executor = None
+        if options["processes"] > 1:
+            executor = ProcessPoolExecutor(max_workers=options["processes"])
+        try:
+            total_updated = 0
+            for model, fields in MARKDOWN_FIELDS:
+                total_updated += self.rerender_model(
+                    model, fields, batch_size, executor
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        # Cached schedule pages include rendered HTML, but bulk
+        # updates do not send the signals that purge them.
+        if total_updated:
+            invalidate_schedule_pages()
+
+    def _batches(self, model, fields, batch_size):
+        """Yield lists of (pk, texts, current HTML) tuples."""
+        source_fields = [source for source, html in fields]
+        html_fields = [html for source, html in fields]
+        rows = (
+            model.objects.order_by("pk")
+            .values_list("pk", *(source_fields + html_fields))
+            .iterator(chunk_size=batch_size)
+        )
+        batch = []
+        for row in rows:
+            batch.append(
+                (
+                    row[0],
+                    [text or "" for text in row[1:len(fields) + 1]],
+                    list(row[len(fields) + 1:]),
+                )
+            )
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _update(self, model, fields, batch, rendered):
+        """Save HTML that differs from the stored HTML of each row."""
+        html_fields = [html for source, html in fields]
+        objs = []
+        for index, (pk, texts, current_html) in enumerate(batch):
+            new_html = rendered[index * len(fields):(index + 1) * len(fields)]
+            if new_html != current_html:
+                objs.append(model(pk=pk, **dict(zip(html_fields, new_html))))
+        if objs:
+            model.objects.bulk_update(objs, html_fields)
+        return len(objs)
+
+    def rerender_model(self, model, fields, batch_size, executor):
+        start_time = time.monotonic()
+        rendered_count = updated_count = 0
+        pending = deque()
+
+        def finish_oldest():
+            batch, future = pending.popleft()
+            return self._update(model, fields, batch, future.result())
+
+        for batch in self._batches(model, fields, batch_size):
+            texts = [text for pk, row_texts, _ in batch for text in row_texts]
+            rendered_count += len(batch)
+            if executor is None:
+                updated_count += self._update(
+                    model, fields, batch, render_many(texts)
+                )
+                continue
+            # Rows are read and written in this process while
+            # workers render the previous batches.
+            pending.append((batch, executor.submit(render_many, texts)))
+            if len(pending) > self.max_pending:
+                updated_count += finish_oldest()
+        while pending:
+            updated_count += finish_oldest()
+
+        elapsed = time.monotonic() - start_time
+        self.stdout.write(
+            "Rendered {} {} rows ({} updated) in {:.2f} seconds "
+            "({:.0f} rows per second).".format(
+                rendered_count,
+                model._meta.verbose_name,
+                updated_count,
+                elapsed,
+                rendered_count / elapsed if elapsed else 0,
+            )
+        )
+        return updated_count
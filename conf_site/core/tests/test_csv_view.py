@@ -1,3 +1,4 @@
+from django.http import HttpResponse
 from django.test import TestCase
 from django.urls import reverse
 
@@ -8,6 +9,13 @@ from conf_site.core.views import CsvView
 class CsvViewTestCase(TestCase):
     view_class = CsvView
 
+    def _get_csv_response(self, view_class=None):
+        """Return a view's response with all of its rows streamed."""
+        response = (view_class or self.view_class)().get()
+        return HttpResponse(
+            response.getvalue(), content_type=response["Content-Type"]
+        )
+
     def test_status_code(self):
         response = self.view_class().get()
         self.assertEqual(response.status_code, 200)
@@ -24,7 +32,7 @@ class CsvViewTestCase(TestCase):
         if not header_row:
             return
 
-        response = self.view_class().get()
+        response = self._get_csv_response()
         # Some formatting needs to be done so that the header row
         # is compliant with the CSV dialect - all fields need
         # to be quoted.
@@ -51,3 +59,9 @@ class StaffOnlyCsvViewTestCase(AccountsTestCase, CsvViewTestCase):
         self.client.login(username=self.user.email, password=self.password)
         response = self.client.get(reverse(self.view_name))
         self.assertEqual(response.status_code, 200)
+
+    def test_response_is_streamed(self):
+        """Verify that rows are produced as the response is read."""
+        response = self.view_class().get()
+        self.assertTrue(response.streaming)
+        self.assertFalse(response.has_header("Content-Length"))
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from conf_site.proposals.tests.factories import ProposalFactory
+from conf_site.speakers.tests.factories import SpeakerFactory
+from symposion.proposals.models import ProposalBase
+from symposion.speakers.models import Speaker
+
+
+class RerenderMarkdownTestCase(TestCase):
+    def _rerender(self, **options):
+        output = StringIO()
+        call_command("rerender_markdown", stdout=output, **options)
+        return output.getvalue()
+
+    def test_stale_html_is_updated(self):
+        speakers = SpeakerFactory.create_batch(size=3, biography="*Hello*")
+        proposal = ProposalFactory(abstract="**Abstract**")
+        Speaker.objects.update(biography_html="stale")
+        ProposalBase.objects.update(abstract_html="stale")
+
+        output = self._rerender(processes=1, batch_size=2)
+        for speaker in speakers:
+            speaker.refresh_from_db()
+            self.assertEqual(speaker.biography_html, "<p><em>Hello</em></p>")
+        proposal.refresh_from_db()
+        self.assertEqual(
+            proposal.abstract_html, "<p><strong>Abstract</strong></p>"
+        )
+        self.assertIn("({} updated)".format(Speaker.objects.count()), output)
+
+    def test_current_html_is_not_updated(self):
+        SpeakerFactory(biography="*Hello*")
+        output = self._rerender(processes=1)
+        self.assertIn("Rendered 1 Speaker rows (0 updated)", output)
+
+    def test_worker_processes(self):
+        speaker = SpeakerFactory(biography="*Hello*")
+        Speaker.objects.update(biography_html="stale")
+        self._rerender(processes=2, batch_size=1)
+        speaker.refresh_from_db()
+        self.assertEqual(speaker.biography_html, "<p><em>Hello</em></p>")
@@ -1,14 +1,13 @@
 import csv
 import os
 from tempfile import mkstemp
-from wsgiref.util import FileWrapper
 
 from django.contrib.auth.mixins import UserPassesTestMixin
 from django.http import (
     Http404,
-    HttpResponse,
     HttpResponseRedirect,
     HttpResponsePermanentRedirect,
+    StreamingHttpResponse,
 )
 from django.shortcuts import redirect
 from django.template.response import TemplateResponse
@@ -33,8 +32,21 @@ def csrf_failure(request, reason=""):
     return response
 
 
+class _Echo(object):
+    """A file-like object that returns what is written to it."""
+
+    def write(self, value):
+        return value
+
+
 class CsvView(View):
-    """A abstract view that returns a CSV file as a response."""
+    """
+    A abstract view that streams a CSV file as a response.
+
+    Inherited views provide rows by overriding get_rows(). Rows are
+    written to the response as they are produced, so large exports
+    start downloading immediately and use a constant amount of memory.
+    """
 
     http_method_names = ["get"]
 
@@ -43,33 +55,24 @@ class CsvView(View):
     csv_filename = "export.csv"
     header_row = None
 
-    def __init__(self, **kwargs):
-        super(CsvView, self).__init__(**kwargs)
-
-        self.temp_filename = mkstemp()[1]
-        self.temp_file = open(
-            file=self.temp_filename, mode="w", encoding="utf-8"
-        )
+    def get_rows(self):
+        """Return an iterable of rows. This should be overwritten."""
+        return []
 
-        # Initialize CSV file.
-        self.csv_writer = csv.writer(self.temp_file, dialect=csv.unix_dialect)
+    def _stream_rows(self, rows):
+        csv_writer = csv.writer(_Echo(), dialect=csv.unix_dialect)
         if self.header_row:
-            self.csv_writer.writerow(self.header_row)
+            yield csv_writer.writerow(self.header_row)
+        for row in rows:
+            yield csv_writer.writerow(row)
 
     def get(self, *args, **kwargs):
-        # Make sure that everything has been saved.
-        self.temp_file.flush()
-        os.fsync(self.temp_file.fileno())
-        self.temp_file.close()
-        # Push CSV to user.
-        wrapper = FileWrapper(open(self.temp_filename))
-        response = HttpResponse(wrapper, content_type="text/csv")
+        response = StreamingHttpResponse(
+            self._stream_rows(self.get_rows()), content_type="text/csv"
+        )
         response["Content-Disposition"] = (
             "attachment; filename=%s" % self.csv_filename
         )
-        # Sending a Content-Length header gives the user better information
-        # about the progress of their download.
-        response["Content-Length"] = os.path.getsize(self.temp_filename)
         return response
 
 
@@ -105,7 +108,10 @@ class SlugDetailView(DetailView):
     def get_object(self, queryset=None):
         # Use a custom queryset if provided.
         if queryset is None:
-            queryset = self.get_queryset()
+            # The default object is only loaded once per request.
+            if getattr(self, "_object", None) is None:
+                self._object = self.get_object(self.get_queryset())
+            return self._object
 
         pk = self.kwargs.get(self.pk_url_kwarg)
 
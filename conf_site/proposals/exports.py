@@ -0,0 +1,87 @@
+"""
+Data for proposal exports.
+
+Proposals are loaded in chunks together with everything that the
+exports print, so an export runs a constant number of queries per
+chunk no matter how many speakers each proposal has. Each function
+yields flat tuples that can be written to a CSV file or serialized.
+"""
+from django.db.models import Prefetch
+
+from conf_site.proposals.models import Proposal
+from conf_site.reviews.models import ProposalResult
+from symposion.proposals.models import prefetch_accepted_speakers
+from symposion.speakers.models import Speaker
+from symposion.utils.db import iterate_in_chunks
+
+
+EXPORT_CHUNK_SIZE = 500
+
+
+def _proposal_status(proposal):
+    if proposal.cancelled:
+        return "Cancelled"
+    try:
+        return proposal.review_result.get_status_display()
+    except ProposalResult.DoesNotExist:
+        return dict(ProposalResult.RESULT_STATUSES).get(
+            ProposalResult.RESULT_UNDECIDED
+        )
+
+
+def proposal_rows(chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield a tuple for each proposal, ordered by number.
+
+    Tuples contain the proposal's number, title, primary speaker's
+    name and email address, all accepted speakers' email addresses,
+    kind, audience level, status, and creation and modification dates.
+    """
+    proposals = (
+        Proposal.objects.order_by("pk")
+        .select_related("kind", "review_result", "speaker__user")
+        .prefetch_related(prefetch_accepted_speakers())
+    )
+    for proposal in iterate_in_chunks(proposals, chunk_size):
+        yield (
+            proposal.number,
+            proposal.title,
+            proposal.speaker.name,
+            proposal.speaker.email,
+            ", ".join(speaker.email for speaker in proposal.speakers()),
+            proposal.kind.name,
+            proposal.get_audience_level_display(),
+            _proposal_status(proposal),
+            proposal.date_created,
+            proposal.date_last_modified,
+        )
+
+
+def proposal_submitter_rows(chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield a tuple for each speaker of each proposal, ordered by title.
+
+    Tuples contain the speaker's name and email address and the
+    proposal's title and kind. Additional speakers are included
+    whether or not they have accepted their invitations.
+    """
+    proposals = (
+        Proposal.objects.order_by("title", "pk")
+        .select_related("kind", "speaker__user")
+        .prefetch_related(
+            Prefetch(
+                "additional_speakers",
+                queryset=Speaker.objects.select_related("user"),
+            )
+        )
+    )
+    for proposal in iterate_in_chunks(proposals, chunk_size):
+        for submitter in [proposal.speaker] + list(
+            proposal.additional_speakers.all()
+        ):
+            yield (
+                submitter.name,
+                submitter.email,
+                proposal.title,
+                proposal.kind.name,
+            )
@@ -1,8 +1,11 @@
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.db import models
+from django.db.models import Count, F, Q
 
 from constance import config
+from model_utils.managers import InheritanceManager, InheritanceQuerySet
 from symposion.proposals.models import ProposalBase, ProposalSection
 from taggit.managers import TaggableManager
 from taggit.models import TagBase, GenericTaggedItemBase
@@ -10,6 +13,78 @@ from taggit.models import TagBase, GenericTaggedItemBase
 from conf_site.reviews.models import ProposalVote
 
 
+# Names and scores of each type of vote, as used in cache keys,
+# queryset annotations, and Proposal properties.
+VOTE_COUNT_FIELDS = [
+    ("plus_one", ProposalVote.PLUS_ONE),
+    ("plus_zero", ProposalVote.PLUS_ZERO),
+    ("minus_zero", ProposalVote.MINUS_ZERO),
+    ("minus_one", ProposalVote.MINUS_ONE),
+]
+
+
+def vote_count_cache_key(proposal_pk, vote_name):
+    """Return the cache key for a proposal's count of one type of vote."""
+    return "proposal_{}_{}".format(proposal_pk, vote_name)
+
+
+class ProposalQuerySet(InheritanceQuerySet):
+    def with_vote_tallies(self):
+        """
+        Annotate proposals with their vote and feedback counts.
+
+        Each type of vote is counted in an annotation named after
+        it (e.g. plus_one_votes). total_vote_count contains the number
+        of votes, vote_score contains the sum of all votes' scores,
+        and review_feedback_count contains the number of feedback
+        messages. Proposal properties like plus_one use these
+        annotations instead of the cache when they are available.
+        """
+        annotations = {
+            "{}_votes".format(vote_name): Count(
+                "review_votes",
+                distinct=True,
+                filter=Q(review_votes__score=vote_score),
+            )
+            for vote_name, vote_score in VOTE_COUNT_FIELDS
+        }
+        annotations["review_feedback_count"] = Count(
+            "review_feedback", distinct=True
+        )
+        return self.annotate(**annotations).annotate(
+            total_vote_count=(
+                F("plus_one_votes")
+                + F("plus_zero_votes")
+                + F("minus_zero_votes")
+                + F("minus_one_votes")
+            ),
+            vote_score=(
+                F("plus_one_votes") * ProposalVote.PLUS_ONE
+                + F("plus_zero_votes") * ProposalVote.PLUS_ZERO
+                + F("minus_zero_votes") * ProposalVote.MINUS_ZERO
+                + F("minus_one_votes") * ProposalVote.MINUS_ONE
+            ),
+        )
+
+    def with_keyword(self, keyword):
+        """
+        Filter proposals tagged with a keyword in any way.
+
+        Editor, official and user keywords are checked in a single
+        query, and proposals with more than one kind of the same
+        keyword are only included once.
+        """
+        content_type = ContentType.objects.get_for_model(Proposal)
+        query = Q()
+        for through_model in KEYWORD_THROUGH_MODELS:
+            query |= Q(
+                pk__in=through_model.objects.filter(
+                    tag=keyword, content_type=content_type
+                ).values("object_id")
+            )
+        return self.filter(query)
+
+
 class ProposalKeyword(TagBase):
     official = models.BooleanField(default=False)
 
@@ -42,6 +117,14 @@ class UserTaggedProposal(GenericTaggedItemBase):
     )
 
 
+# Through models of the ways that proposals can be tagged with keywords.
+KEYWORD_THROUGH_MODELS = [
+    EditorTaggedProposal,
+    TaggedProposal,
+    UserTaggedProposal,
+]
+
+
 class Proposal(ProposalBase):
 
     AUDIENCE_LEVEL_NOVICE = 1
@@ -64,6 +147,8 @@ class Proposal(ProposalBase):
         (YES_NO_OTHER_BARTLEBY, "Prefer not to say"),
     )
 
+    objects = InheritanceManager.from_queryset(ProposalQuerySet)()
+
     audience_level = models.IntegerField(choices=AUDIENCE_LEVELS)
 
     slides_url = models.URLField(
@@ -162,6 +247,17 @@ class Proposal(ProposalBase):
         cache.set(cache_key, vote_count, settings.CACHE_TIMEOUT_LONG)
         return vote_count
 
+    def _get_vote_count(self, vote_name, vote_score):
+        """Helper method to retrieve annotated or cached vote counts."""
+        annotated_vote_count = getattr(
+            self, "{}_votes".format(vote_name), None
+        )
+        if annotated_vote_count is not None:
+            return annotated_vote_count
+        return self._get_cached_vote_count(
+            vote_count_cache_key(self.pk, vote_name), vote_score
+        )
+
     def _refresh_feedback_count(self):
         """Helper method to manually refresh a proposal's feedback count."""
         cache_key = self._feedback_count_cache_key()
@@ -171,17 +267,45 @@ class Proposal(ProposalBase):
 
     def _refresh_vote_counts(self):
         """Helper method to manually refresh a proposal's vote counts."""
-        vote_count_dict = {
-            "proposal_{}_plus_one".format(self.pk): ProposalVote.PLUS_ONE,
-            "proposal_{}_plus_zero".format(self.pk): ProposalVote.PLUS_ZERO,
-            "proposal_{}_minus_zero".format(self.pk): ProposalVote.MINUS_ZERO,
-            "proposal_{}_minus_one".format(self.pk): ProposalVote.MINUS_ONE,
-        }
-        for cache_key, vote_score in vote_count_dict.items():
-            vote_count = ProposalVote.objects.filter(
-                proposal=self, score=vote_score
-            ).count()
-            cache.set(cache_key, vote_count, settings.CACHE_TIMEOUT_LONG)
+        vote_counts = dict(
+            ProposalVote.objects.filter(proposal=self)
+            .values_list("score")
+            .annotate(Count("pk"))
+        )
+        cache.set_many(
+            {
+                vote_count_cache_key(self.pk, vote_name): vote_counts.get(
+                    vote_score, 0
+                )
+                for vote_name, vote_score in VOTE_COUNT_FIELDS
+            },
+            settings.CACHE_TIMEOUT_LONG,
+        )
+
+    def _update_vote_counts(self, old_score, new_score):
+        """
+        Helper method to incrementally update cached vote counts.
+
+        If any count is missing from the cache, all of this proposal's
+        vote counts are refreshed from the database.
+        """
+        vote_names = dict(
+            (vote_score, vote_name)
+            for vote_name, vote_score in VOTE_COUNT_FIELDS
+        )
+        deltas = {}
+        if old_score is not None:
+            cache_key = vote_count_cache_key(self.pk, vote_names[old_score])
+            deltas[cache_key] = deltas.get(cache_key, 0) - 1
+        if new_score is not None:
+            cache_key = vote_count_cache_key(self.pk, vote_names[new_score])
+            deltas[cache_key] = deltas.get(cache_key, 0) + 1
+        try:
+            for cache_key, delta in deltas.items():
+                if delta:
+                    cache.incr(cache_key, delta)
+        except ValueError:
+            self._refresh_vote_counts()
 
     def can_edit(self):
         if config.PROPOSAL_EDITING_WHEN_CFP_IS_CLOSED:
@@ -193,6 +317,11 @@ class Proposal(ProposalBase):
 
     def feedback_count(self):
         """Helper method to retrieve feedback count."""
+        annotated_feedback_count = getattr(
+            self, "review_feedback_count", None
+        )
+        if annotated_feedback_count is not None:
+            return annotated_feedback_count
         cache_key = self._feedback_count_cache_key()
         feedback_count = cache.get(cache_key, False)
         if feedback_count is not False:
@@ -202,33 +331,44 @@ class Proposal(ProposalBase):
     @property
     def plus_one(self):
         """Enumerate number of +1 reviews."""
-        return self._get_cached_vote_count(
-            "proposal_{}_plus_one".format(self.pk), ProposalVote.PLUS_ONE
-        )
+        return self._get_vote_count("plus_one", ProposalVote.PLUS_ONE)
 
     @property
     def plus_zero(self):
         """Enumerate number of +0 reviews."""
-        return self._get_cached_vote_count(
-            "proposal_{}_plus_zero".format(self.pk), ProposalVote.PLUS_ZERO
-        )
+        return self._get_vote_count("plus_zero", ProposalVote.PLUS_ZERO)
 
     @property
     def minus_zero(self):
         """Enumerate number of -0 reviews."""
-        return self._get_cached_vote_count(
-            "proposal_{}_minus_zero".format(self.pk), ProposalVote.MINUS_ZERO,
-        )
+        return self._get_vote_count("minus_zero", ProposalVote.MINUS_ZERO)
 
     @property
     def minus_one(self):
         """Enumerate number of -1 reviews."""
-        return self._get_cached_vote_count(
-            "proposal_{}_minus_one".format(self.pk), ProposalVote.MINUS_ONE
-        )
+        return self._get_vote_count("minus_one", ProposalVote.MINUS_ONE)
 
     @property
     def total_votes(self):
+        annotated_total_votes = getattr(self, "total_vote_count", None)
+        if annotated_total_votes is not None:
+            return annotated_total_votes
         return (
             self.plus_one + self.plus_zero + self.minus_zero + self.minus_one
         )
+
+    def vote_tallies(self):
+        """
+        Return a dictionary of this proposal's vote counts, total
+        number of votes, and score (the sum of all votes' scores).
+        """
+        tallies = {
+            vote_name: getattr(self, vote_name)
+            for vote_name, vote_score in VOTE_COUNT_FIELDS
+        }
+        tallies["total_votes"] = sum(tallies.values())
+        tallies["score"] = sum(
+            tallies[vote_name] * vote_score
+            for vote_name, vote_score in VOTE_COUNT_FIELDS
+        )
+        return tallies
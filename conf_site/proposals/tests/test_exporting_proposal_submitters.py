@@ -13,7 +13,7 @@ class ExportProposalSubmittersViewTestCase(StaffOnlyCsvViewTestCase):
 
     def test_all_proposals_are_included(self):
         proposals = ProposalFactory.create_batch(size=randint(2, 4))
-        response = ExportProposalSubmittersView().get()
+        response = self._get_csv_response(ExportProposalSubmittersView)
         for proposal in proposals:
             self.assertContains(response, proposal.speaker.name)
             self.assertContains(response, proposal.speaker.email)
@@ -24,7 +24,7 @@ class ExportProposalSubmittersViewTestCase(StaffOnlyCsvViewTestCase):
         proposal = ProposalFactory()
         additional_speakers = SpeakerFactory.create_batch(size=randint(2, 4))
         proposal.additional_speakers.add(*additional_speakers)
-        response = ExportProposalSubmittersView().get()
+        response = self._get_csv_response(ExportProposalSubmittersView)
         for speaker in additional_speakers:
             self.assertContains(response, speaker.name)
             self.assertContains(response, speaker.email)
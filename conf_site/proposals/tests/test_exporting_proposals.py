@@ -12,7 +12,7 @@ class ExportProposalsViewTestCase(StaffOnlyCsvViewTestCase):
 
     def test_all_proposals_are_included(self):
         proposals = ProposalFactory.create_batch(size=randint(2, 4))
-        response = ExportProposalsView().get()
+        response = self._get_csv_response(ExportProposalsView)
         for proposal in proposals:
             self.assertContains(response, proposal.number)
             self.assertContains(response, proposal.title)
@@ -26,6 +26,6 @@ class ExportProposalsViewTestCase(StaffOnlyCsvViewTestCase):
 
     def test_include_cancelled_proposal_status(self):
         proposal = ProposalFactory.create(cancelled=True)
-        response = ExportProposalsView().get()
+        response = self._get_csv_response(ExportProposalsView)
         self.assertContains(response, proposal.title)
         self.assertContains(response, "Cancelled")
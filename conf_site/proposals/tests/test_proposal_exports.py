@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from django.test import TestCase
+
+from conf_site.proposals.exports import (
+    proposal_rows,
+    proposal_submitter_rows,
+)
+from conf_site.proposals.tests.factories import ProposalFactory
+from conf_site.reviews.models import ProposalResult
+from conf_site.speakers.tests.factories import SpeakerFactory
+from symposion.proposals.models import AdditionalSpeaker
+
+
+class ProposalExportsTestCase(TestCase):
+    def setUp(self):
+        self.proposals = ProposalFactory.create_batch(size=5)
+        for proposal in self.proposals:
+            AdditionalSpeaker.objects.create(
+                proposalbase=proposal.proposalbase_ptr,
+                speaker=SpeakerFactory(),
+                status=AdditionalSpeaker.SPEAKING_STATUS_ACCEPTED,
+            )
+            # Pending speakers are submitters but not accepted speakers.
+            AdditionalSpeaker.objects.create(
+                proposalbase=proposal.proposalbase_ptr,
+                speaker=SpeakerFactory(),
+                status=AdditionalSpeaker.SPEAKING_STATUS_PENDING,
+            )
+        ProposalResult.objects.create(
+            proposal=self.proposals[0],
+            status=ProposalResult.RESULT_ACCEPTED,
+        )
+
+    def test_proposal_rows(self):
+        with self.assertNumQueries(3):
+            rows = list(proposal_rows())
+        self.assertEqual(
+            [row[0] for row in rows],
+            [proposal.number for proposal in self.proposals],
+        )
+        for row, proposal in zip(rows, self.proposals):
+            self.assertEqual(
+                row[4],
+                ", ".join(speaker.email for speaker in proposal.speakers()),
+            )
+        self.assertEqual(rows[0][7], "Accepted")
+        self.assertEqual(rows[1][7], "Undecided")
+
+    def test_proposal_submitter_rows(self):
+        with self.assertNumQueries(3):
+            rows = list(proposal_submitter_rows())
+        self.assertEqual(len(rows), 15)
+
+    def test_chunks(self):
+        """Verify that chunking does not change the rows."""
+        with self.assertNumQueries(1 + 3 * 2):
+            chunked_rows = list(proposal_rows(chunk_size=2))
+        self.assertEqual(chunked_rows, list(proposal_rows()))
+        self.assertEqual(
+            list(proposal_submitter_rows(chunk_size=2)),
+            list(proposal_submitter_rows()),
+        )
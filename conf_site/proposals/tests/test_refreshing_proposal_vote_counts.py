@@ -1,7 +1,10 @@
 from random import randint
 
 from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from conf_site.proposals.models import Proposal
 from conf_site.proposals.tests import ProposalTestCase
 from conf_site.reviews.models import ProposalVote
 from conf_site.reviews.tests.factories import ProposalVoteFactory
@@ -61,3 +64,92 @@ class ProposalVoteCountRefreshTestCase(ProposalTestCase):
         for index, cache_key in enumerate(self.vote_cache_keys):
             self.assertEqual(cache.get(cache_key), vote_counts[index])
         self.assertEqual(self.proposal.total_votes, sum(vote_counts))
+
+    def test_incremental_vote_count_updates(self):
+        """Verify that cached counts follow saved and deleted votes."""
+        self.proposal._refresh_vote_counts()
+        vote = ProposalVoteFactory(
+            proposal=self.proposal, score=ProposalVote.PLUS_ONE
+        )
+        self.assertEqual(cache.get(self.vote_cache_keys[0]), 1)
+
+        # Changing a vote's score moves it between counts.
+        vote = ProposalVote.objects.get(pk=vote.pk)
+        vote.score = ProposalVote.MINUS_ONE
+        vote.save()
+        self.assertEqual(cache.get(self.vote_cache_keys[0]), 0)
+        self.assertEqual(cache.get(self.vote_cache_keys[3]), 1)
+
+        vote.delete()
+        self.assertEqual(cache.get(self.vote_cache_keys[3]), 0)
+        self.assertEqual(self.proposal.total_votes, 0)
+
+    def test_deferred_score_vote_count_updates(self):
+        """Verify that votes loaded without scores keep counts right."""
+        vote = ProposalVoteFactory(
+            proposal=self.proposal, score=ProposalVote.PLUS_ONE
+        )
+        # Loading a vote without its score does not load the score.
+        with self.assertNumQueries(1):
+            vote = ProposalVote.objects.defer("score").get(pk=vote.pk)
+        vote.score = ProposalVote.MINUS_ONE
+        vote.save()
+        self.assertEqual(cache.get(self.vote_cache_keys[0]), 0)
+        self.assertEqual(cache.get(self.vote_cache_keys[3]), 1)
+
+        ProposalVote.objects.defer("score").get(pk=vote.pk).delete()
+        self.assertEqual(cache.get(self.vote_cache_keys[3]), 0)
+
+    def test_deleting_proposal_with_votes(self):
+        """Verify that deleted votes do not load their voters."""
+        votes = ProposalVoteFactory.create_batch(
+            size=3, proposal=self.proposal, score=ProposalVote.PLUS_ONE
+        )
+        with CaptureQueriesContext(connection) as queries:
+            self.proposal.delete()
+        self.assertFalse(
+            [
+                query for query in queries
+                if query["sql"].startswith("SELECT")
+                and 'FROM "auth_user"' in query["sql"]
+            ]
+        )
+        self.assertFalse(ProposalVote.objects.filter(
+            pk__in=[vote.pk for vote in votes]
+        ).exists())
+
+    def test_missing_cached_counts_are_refreshed(self):
+        """Verify that counts are refreshed if they were evicted."""
+        ProposalVoteFactory.create_batch(
+            size=2, proposal=self.proposal, score=ProposalVote.PLUS_ZERO
+        )
+        cache.delete_many(self.vote_cache_keys)
+        ProposalVoteFactory(
+            proposal=self.proposal, score=ProposalVote.PLUS_ZERO
+        )
+        self.assertEqual(cache.get(self.vote_cache_keys[1]), 3)
+
+    def test_vote_tally_annotations(self):
+        """Verify that vote tallies can be computed in a single query."""
+        votes = [
+            ProposalVote.PLUS_ONE,
+            ProposalVote.PLUS_ONE,
+            ProposalVote.PLUS_ZERO,
+            ProposalVote.MINUS_ONE,
+        ]
+        for score in votes:
+            ProposalVoteFactory(proposal=self.proposal, score=score)
+        ProposalVoteFactory()
+
+        with self.assertNumQueries(1):
+            proposal = Proposal.objects.with_vote_tallies().get(
+                pk=self.proposal.pk
+            )
+        cache.clear()
+        with self.assertNumQueries(0):
+            self.assertEqual(proposal.plus_one, 2)
+            self.assertEqual(proposal.plus_zero, 1)
+            self.assertEqual(proposal.minus_zero, 0)
+            self.assertEqual(proposal.minus_one, 1)
+            self.assertEqual(proposal.total_votes, len(votes))
+        self.assertEqual(proposal.vote_score, sum(votes))
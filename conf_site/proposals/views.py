@@ -1,6 +1,8 @@
 from conf_site.core.views import CsvView
-from conf_site.proposals.models import Proposal
-from conf_site.reviews.models import ProposalResult
+from conf_site.proposals.exports import (
+    proposal_rows,
+    proposal_submitter_rows,
+)
 
 
 class ExportProposalSubmittersView(CsvView):
@@ -14,24 +16,8 @@ class ExportProposalSubmittersView(CsvView):
         "Proposal Type",
     ]
 
-    def _write_submitter_row(self, submitter, proposal):
-        """Utility method to write a row for an individual submitter."""
-        self.csv_writer.writerow(
-            [
-                submitter.name,
-                submitter.email,
-                proposal.title,
-                proposal.kind.name,
-            ]
-        )
-
-    def get(self, *args, **kwargs):
-        for proposal in Proposal.objects.order_by("title"):
-            self._write_submitter_row(proposal.speaker, proposal)
-            for additional_submitter in proposal.additional_speakers.all():
-                self._write_submitter_row(additional_submitter, proposal)
-
-        return super(ExportProposalSubmittersView, self).get(*args, **kwargs)
+    def get_rows(self):
+        return proposal_submitter_rows()
 
 
 class ExportProposalsView(CsvView):
@@ -51,36 +37,5 @@ class ExportProposalsView(CsvView):
         "Date Modified",
     ]
 
-    def get(self, *args, **kwargs):
-        # Iterate through proposals.
-        for proposal in Proposal.objects.order_by("pk"):
-            accepted_speaker_email_addresses = ", ".join(
-                speaker.email for speaker in proposal.speakers()
-            )
-            if proposal.cancelled:
-                proposal_status = "Cancelled"
-            else:
-                try:
-                    proposal_status = (
-                        proposal.review_result.get_status_display()
-                    )
-                except ProposalResult.DoesNotExist:
-                    proposal_status = dict(ProposalResult.RESULT_STATUSES).get(
-                        ProposalResult.RESULT_UNDECIDED
-                    )
-            self.csv_writer.writerow(
-                [
-                    proposal.number,
-                    proposal.title,
-                    proposal.speaker.name,
-                    proposal.speaker.email,
-                    accepted_speaker_email_addresses,
-                    proposal.kind.name,
-                    proposal.get_audience_level_display(),
-                    proposal_status,
-                    proposal.date_created,
-                    proposal.date_last_modified,
-                ]
-            )
-
-        return super().get(*args, **kwargs)
+    def get_rows(self):
+        return proposal_rows()
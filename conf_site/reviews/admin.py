@@ -3,6 +3,7 @@ from django.contrib import admin
 from conf_site.reviews.models import (
     ProposalFeedback,
     ProposalNotification,
+    ProposalNotificationRecipient,
     ProposalResult,
     ProposalVote,
 )
@@ -12,6 +13,24 @@ class ProposalInline(admin.StackedInline):
     model = ProposalNotification.proposals.through
 
 
+class ProposalNotificationRecipientInline(admin.TabularInline):
+    model = ProposalNotificationRecipient
+    can_delete = False
+    extra = 0
+    fields = ("proposal", "speaker", "email", "status")
+    readonly_fields = fields
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("proposal", "queued_email", "speaker")
+        )
+
+
 @admin.register(ProposalFeedback)
 class ProposalFeedbackAdmin(admin.ModelAdmin):
     list_display = ("proposal", "author", "comment", "date_created")
@@ -20,7 +39,7 @@ class ProposalFeedbackAdmin(admin.ModelAdmin):
 @admin.register(ProposalNotification)
 class ProposalNotificationAdmin(admin.ModelAdmin):
     exclude = ("proposals",)
-    inlines = [ProposalInline]
+    inlines = [ProposalInline, ProposalNotificationRecipientInline]
     list_display = ("subject", "body", "date_sent")
 
 
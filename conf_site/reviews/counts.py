@@ -0,0 +1,108 @@
+"""
+Counts of proposals for reviewing pages.
+
+Non-cancelled proposals are counted by kind and by result status in a
+single aggregate query, and by keyword in another. The counts are
+cached, and each cache is cleared whenever the data it counts changes.
+"""
+from collections import Counter
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db.models import Count
+
+from conf_site.proposals.models import KEYWORD_THROUGH_MODELS, Proposal
+from conf_site.reviews.models import ProposalResult
+
+
+PROPOSAL_COUNTS_CACHE_KEY = "review_proposal_counts"
+KEYWORD_COUNTS_CACHE_KEY = "review_keyword_counts"
+
+
+class ProposalCounts(object):
+    """Numbers of proposals, keyed by (kind primary key, result status)."""
+
+    def __init__(self, counts):
+        self.counts = counts
+
+    def count(self, kind=None, status=None):
+        """Return the number of proposals with a kind and/or status."""
+        return sum(
+            number
+            for (kind_pk, result_status), number in self.counts.items()
+            if (kind is None or kind_pk == kind)
+            and (status is None or result_status == status)
+        )
+
+
+def count_proposals(proposals):
+    """Return a ProposalCounts of a queryset of proposals."""
+    counts = {}
+    rows = (
+        proposals.order_by()
+        .values_list("kind", "review_result__status")
+        .annotate(number=Count("pk"))
+    )
+    for kind_pk, status, number in rows:
+        # Proposals without results have not been decided yet.
+        key = (kind_pk, status or ProposalResult.RESULT_UNDECIDED)
+        counts[key] = counts.get(key, 0) + number
+    return ProposalCounts(counts)
+
+
+def get_proposal_counts():
+    """Return a ProposalCounts of all non-cancelled proposals."""
+    counts = cache.get(PROPOSAL_COUNTS_CACHE_KEY)
+    if counts is None:
+        counts = count_proposals(
+            Proposal.objects.exclude(cancelled=True)
+        ).counts
+        cache.set(
+            PROPOSAL_COUNTS_CACHE_KEY, counts, settings.CACHE_TIMEOUT_LONG
+        )
+    return ProposalCounts(counts)
+
+
+def invalidate_proposal_counts():
+    """Forget the cached proposal counts."""
+    cache.delete(PROPOSAL_COUNTS_CACHE_KEY)
+
+
+def count_keywords(proposals):
+    """
+    Return a dictionary of the number of proposals in a queryset
+    tagged with each keyword, keyed by keyword primary key.
+
+    Proposals tagged with a keyword in more than one way are
+    only counted once.
+    """
+    content_type = ContentType.objects.get_for_model(Proposal)
+    proposal_pks = proposals.order_by().values("pk")
+    tagged_items = [
+        through_model.objects.filter(
+            content_type=content_type, object_id__in=proposal_pks
+        )
+        .order_by()
+        .values_list("tag", "object_id")
+        for through_model in KEYWORD_THROUGH_MODELS
+    ]
+    # UNION removes duplicate (keyword, proposal) pairs.
+    pairs = tagged_items[0].union(*tagged_items[1:])
+    return dict(Counter(keyword_pk for keyword_pk, _ in pairs))
+
+
+def get_keyword_counts():
+    """Return the keyword counts of all non-cancelled proposals."""
+    counts = cache.get(KEYWORD_COUNTS_CACHE_KEY)
+    if counts is None:
+        counts = count_keywords(Proposal.objects.exclude(cancelled=True))
+        cache.set(
+            KEYWORD_COUNTS_CACHE_KEY, counts, settings.CACHE_TIMEOUT_LONG
+        )
+    return counts
+
+
+def invalidate_keyword_counts():
+    """Forget the cached keyword counts."""
+    cache.delete(KEYWORD_COUNTS_CACHE_KEY)
@@ -0,0 +1,28 @@
+# Generated by Django 3.0.10 on 2026-10-18 02:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('symposion_speakers', '0005_speaker_github_username'),
+        ('proposals', '0001_initial_squashed_0003_remove_under_represented_questions'),
+        ('symposion_outbox', '0001_initial'),
+        ('reviews', '0001_initial_squashed_0004_proposalnotification'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProposalNotificationRecipient',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.EmailField(blank=True, max_length=254)),
+                ('notification', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recipients', to='reviews.ProposalNotification')),
+                ('proposal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='review_notification_recipients', to='proposals.Proposal')),
+                ('queued_email', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='notification_recipient', to='symposion_outbox.QueuedEmail')),
+                ('speaker', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='review_notification_recipients', to='symposion_speakers.Speaker')),
+            ],
+        ),
+    ]
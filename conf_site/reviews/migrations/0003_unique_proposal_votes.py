@@ -0,0 +1,35 @@
+from django.db import migrations
+
+
+def remove_duplicate_votes(apps, schema_editor):
+    """Keep only the most recently modified vote of each voter."""
+    ProposalVote = apps.get_model("reviews", "ProposalVote")
+    seen = set()
+    duplicate_pks = []
+    votes = ProposalVote.objects.order_by(
+        "-date_modified", "-pk"
+    ).values_list("pk", "proposal", "voter")
+    for vote_pk, proposal_pk, voter_pk in votes:
+        if (proposal_pk, voter_pk) in seen:
+            duplicate_pks.append(vote_pk)
+        seen.add((proposal_pk, voter_pk))
+    ProposalVote.objects.filter(pk__in=duplicate_pks).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0011_update_proxy_permissions"),
+        ("proposals", "0001_initial_squashed_0003_remove_under_represented_questions"),
+        ("reviews", "0002_proposalnotificationrecipient"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_votes, migrations.RunPython.noop
+        ),
+        migrations.AlterUniqueTogether(
+            name="proposalvote",
+            unique_together={("proposal", "voter")},
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 3.0.10 on 2026-10-18 02:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# These expressions match the text search vectors that
+# conf_site.reviews.search compares to queries, so
+# that PostgreSQL can use these indexes to search.
+# Speakers' names are searched together with the text.
+SEARCH_INDEXES = [
+    ("reviews_proposalsearchdocument_text_gin", ["text"]),
+    (
+        "reviews_proposalsearchdocument_text_speaker_names_gin",
+        ["text", "speaker_names"],
+    ),
+]
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name, columns in SEARCH_INDEXES:
+        schema_editor.execute(
+            "CREATE INDEX {} ON reviews_proposalsearchdocument USING GIN "
+            "(to_tsvector('english'::regconfig, {}))".format(
+                index_name,
+                " || ' ' || ".join(
+                    "COALESCE({}, '')".format(column) for column in columns
+                ),
+            )
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name, columns in SEARCH_INDEXES:
+        schema_editor.execute("DROP INDEX IF EXISTS {}".format(index_name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0001_initial_squashed_0003_remove_under_represented_questions'),
+        ('reviews', '0003_unique_proposal_votes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProposalSearchDocument',
+            fields=[
+                ('proposal', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='proposals.Proposal')),
+                ('text', models.TextField(blank=True)),
+                ('speaker_names', models.TextField(blank=True)),
+            ],
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -1,9 +1,14 @@
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.core.mail import send_mass_mail
-from django.db import models
+from django.core.cache import cache
+from django.core.mail import EmailMessage
+from django.db import connection, models, transaction
+from django.utils import timezone
 from django.template import Context, Template
 
 from symposion.markdown_parser import parse
+from symposion.outbox.delivery import enqueue_many
+from symposion.proposals.models import prefetch_accepted_speakers
 
 
 class ProposalVote(models.Model):
@@ -64,6 +69,19 @@ class ProposalVote(models.Model):
     date_created = models.DateTimeField(auto_now_add=True)
     date_modified = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        unique_together = [("proposal", "voter")]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super(ProposalVote, cls).from_db(db, field_names, values)
+        # Remember the score that this vote was loaded with,
+        # so that cached vote counts can be updated incrementally.
+        # Deferred scores are not loaded just to be remembered.
+        if "score" in field_names:
+            instance._saved_score = instance.score
+        return instance
+
     def save(self, *args, **kwargs):
         self.comment_html = parse(self.comment)
         return super(ProposalVote, self).save(*args, **kwargs)
@@ -81,6 +99,98 @@ def proposalvote_score_cache_key(proposal, voter):
     return "proposalvote_{}_{}_score".format(proposal.pk, voter.pk)
 
 
+def proposalvote_scores(proposals, voter):
+    """
+    Return a dictionary of a voter's numeric scores
+    for several proposals, keyed by proposal primary key.
+
+    Proposals that the voter has not voted on are omitted.
+    A single query is run no matter how many proposals are passed.
+    """
+    proposal_pks = [proposal.pk for proposal in proposals]
+    if not proposal_pks or not voter.is_authenticated:
+        return {}
+    votes = ProposalVote.objects.filter(
+        proposal__in=proposal_pks, voter=voter
+    ).only("proposal", "score")
+    return {
+        vote.proposal_id: vote.get_numeric_score_display() for vote in votes
+    }
+
+
+def _upsert_vote_row(proposal, voter, score, comment, comment_html):
+    """Insert or update a vote's row in a single statement."""
+    if connection.vendor not in ["postgresql", "sqlite"]:
+        # Other databases do not support ON CONFLICT clauses.
+        # Updates do not set auto_now fields.
+        updated = ProposalVote.objects.filter(
+            proposal=proposal, voter=voter
+        ).update(
+            score=score,
+            comment=comment,
+            comment_html=comment_html,
+            date_modified=timezone.now(),
+        )
+        if not updated:
+            ProposalVote.objects.bulk_create(
+                [
+                    ProposalVote(
+                        proposal=proposal,
+                        voter=voter,
+                        score=score,
+                        comment=comment,
+                        comment_html=comment_html,
+                    )
+                ]
+            )
+        return
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    table = connection.ops.quote_name(ProposalVote._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "INSERT INTO {} (proposal_id, voter_id, score, comment, "
+            "comment_html, date_created, date_modified) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s) "
+            "ON CONFLICT (proposal_id, voter_id) DO UPDATE SET "
+            "score = excluded.score, comment = excluded.comment, "
+            "comment_html = excluded.comment_html, "
+            "date_modified = excluded.date_modified".format(table),
+            [proposal.pk, voter.pk, score, comment, comment_html, now, now],
+        )
+
+
+def upsert_proposal_vote(proposal, voter, score, comment=""):
+    """
+    Record a voter's vote on a proposal, replacing any previous vote.
+
+    The vote is written without loading or saving a ProposalVote, so
+    the proposal's cached vote counts and the voter's cached score are
+    updated here instead of by signal handlers.
+    """
+    proposal_model = ProposalVote._meta.get_field("proposal").related_model
+    with transaction.atomic():
+        # Lock the proposal, since a vote that does not exist yet
+        # cannot be locked. Otherwise two concurrent first votes
+        # would both be counted as new votes.
+        proposal_model.objects.select_for_update().filter(
+            pk=proposal.pk
+        ).exists()
+        old_score = (
+            ProposalVote.objects.select_for_update()
+            .filter(proposal=proposal, voter=voter)
+            .values_list("score", flat=True)
+            .first()
+        )
+        _upsert_vote_row(proposal, voter, score, comment, parse(comment))
+    if old_score != score:
+        proposal._update_vote_counts(old_score, score)
+    cache.set(
+        proposalvote_score_cache_key(proposal, voter),
+        ProposalVote(score=score).get_numeric_score_display(),
+        settings.CACHE_TIMEOUT_LONG,
+    )
+
+
 class ProposalFeedback(models.Model):
     proposal = models.ForeignKey(
         "proposals.Proposal",
@@ -149,30 +259,128 @@ class ProposalNotification(models.Model):
     def __str__(self):
         return "{}".format(self.subject)
 
-    def send_email(self):
-        """Returns a list of speakers without email addresses."""
-        email_messages = []
+    def send_email(self, chunk_size=500):
+        """
+        Queue a message for each speaker of this notification's proposals.
+
+        Proposals are processed in chunks of chunk_size, and messages
+        are delivered by the email outbox. Returns a list of speakers
+        without email addresses.
+        """
+        # In order to support the "variable substitution"
+        # supported by the previous reviews system, the
+        # message needs to be templated anew for each
+        # proposal, but the template only needs to be compiled once.
+        template = Template(self.body)
+        proposals = self.proposals.select_related(
+            "kind", "speaker__user"
+        ).prefetch_related(prefetch_accepted_speakers(), "review_votes")
+        proposal_pks = list(
+            self.proposals.order_by("pk").values_list("pk", flat=True)
+        )
         unemailed = []
-        # Create a message for each email address.
-        # This is necessary because we are not using BCC.
-        for proposal in self.proposals.all():
-            # In order to support the "variable substitution"
-            # supported by the previous reviews system, the
-            # message needs to be templated anew for each
-            # proposal.
-            message_body = Template(self.body).render(
+        with transaction.atomic():
+            for start in range(0, len(proposal_pks), chunk_size):
+                chunk = proposals.filter(
+                    pk__in=proposal_pks[start:start + chunk_size]
+                ).order_by("pk")
+                unemailed.extend(self._queue_messages(template, chunk))
+        return unemailed
+
+    def _queue_messages(self, template, proposals):
+        email_messages = []
+        emailed_recipients = []
+        unemailed_recipients = []
+        for proposal in proposals:
+            message_body = template.render(
                 Context({"proposal": proposal.notification_email_context()})
             )
+            # Create a message for each email address.
+            # This is necessary because we are not using BCC.
             for speaker in proposal.speakers():
+                recipient = ProposalNotificationRecipient(
+                    notification=self,
+                    proposal=proposal,
+                    speaker=speaker,
+                    email=speaker.email,
+                )
                 if speaker.email:
-                    datamessage_tuple = (
-                        self.subject,
-                        message_body,
-                        self.from_address,
-                        [speaker.email],
+                    email_messages.append(
+                        EmailMessage(
+                            self.subject,
+                            message_body,
+                            self.from_address,
+                            [speaker.email],
+                        )
                     )
-                    email_messages.append(datamessage_tuple)
+                    emailed_recipients.append(recipient)
                 else:
-                    unemailed.append(speaker)
-        send_mass_mail(email_messages)
-        return unemailed
+                    unemailed_recipients.append(recipient)
+
+        queued_emails = enqueue_many(email_messages)
+        for recipient, queued_email in zip(emailed_recipients, queued_emails):
+            recipient.queued_email = queued_email
+        ProposalNotificationRecipient.objects.bulk_create(
+            emailed_recipients + unemailed_recipients
+        )
+        return [recipient.speaker for recipient in unemailed_recipients]
+
+
+class ProposalNotificationRecipient(models.Model):
+    """Model to track the delivery of a notification to one speaker."""
+
+    notification = models.ForeignKey(
+        ProposalNotification,
+        on_delete=models.CASCADE,
+        related_name="recipients",
+    )
+    proposal = models.ForeignKey(
+        "proposals.Proposal",
+        on_delete=models.CASCADE,
+        related_name="review_notification_recipients",
+    )
+    speaker = models.ForeignKey(
+        "symposion_speakers.Speaker",
+        on_delete=models.CASCADE,
+        related_name="review_notification_recipients",
+    )
+    email = models.EmailField(blank=True)
+    queued_email = models.OneToOneField(
+        "symposion_outbox.QueuedEmail",
+        blank=True,
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="notification_recipient",
+    )
+
+    def __str__(self):
+        return "{} ({})".format(self.speaker, self.email)
+
+    def status(self):
+        """Describe whether this recipient's message has been sent."""
+        if not self.email:
+            return "No email address"
+        if self.queued_email is None:
+            return "Unknown"
+        return self.queued_email.get_status_display()
+
+
+class ProposalSearchDocument(models.Model):
+    """
+    Model to store the searchable text of a proposal.
+
+    Documents are deleted when their proposals, speakers or keywords
+    change, and conf_site.reviews.search recreates missing documents
+    before searching.
+    """
+
+    proposal = models.OneToOneField(
+        "proposals.Proposal",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="search_document",
+    )
+    # Speakers' names are stored separately so that they are not
+    # searched when reviewing is blind.
+    text = models.TextField(blank=True)
+    speaker_names = models.TextField(blank=True)
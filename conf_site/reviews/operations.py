@@ -0,0 +1,140 @@
+"""
+Bulk operations on reviewed proposals.
+
+These operations write rows in batches instead of saving each proposal,
+so they do not send signals. Caches that would have been cleared by
+those signals are cleared explicitly.
+"""
+from django.db import transaction
+
+from autoslug.utils import crop_slug
+
+from conf_site.api.cache import bump_model_version
+from conf_site.proposals.models import Proposal
+from conf_site.reviews.counts import invalidate_proposal_counts
+from conf_site.reviews.models import ProposalResult
+from symposion.markdown_parser import parse_many
+from symposion.schedule.feed import invalidate_schedule_json
+from symposion.schedule.models import Presentation
+from symposion.schedule.pagecache import invalidate_schedule_pages
+from symposion.utils.db import bulk_create
+
+
+def create_missing_results(status=ProposalResult.RESULT_UNDECIDED):
+    """Create results for proposals that do not have them."""
+    proposal_pks = list(
+        Proposal.objects.filter(review_result=None).values_list(
+            "pk", flat=True
+        )
+    )
+    if proposal_pks:
+        ProposalResult.objects.bulk_create(
+            [
+                ProposalResult(proposal_id=proposal_pk, status=status)
+                for proposal_pk in proposal_pks
+            ]
+        )
+        invalidate_proposal_counts()
+    return len(proposal_pks)
+
+
+def set_proposal_results(proposal_pks, status):
+    """Set the result of several proposals, creating missing results."""
+    with transaction.atomic():
+        proposal_pks = set(
+            Proposal.objects.filter(pk__in=proposal_pks).values_list(
+                "pk", flat=True
+            )
+        )
+        ProposalResult.objects.filter(proposal__in=proposal_pks).update(
+            status=status
+        )
+        existing_pks = set(
+            ProposalResult.objects.filter(
+                proposal__in=proposal_pks
+            ).values_list("proposal", flat=True)
+        )
+        ProposalResult.objects.bulk_create(
+            [
+                ProposalResult(proposal_id=proposal_pk, status=status)
+                for proposal_pk in sorted(proposal_pks - existing_pks)
+            ]
+        )
+    invalidate_proposal_counts()
+
+
+def _unique_slugs(titles):
+    """Return a slug for each title, like Presentation.slug would."""
+    slug_field = Presentation._meta.get_field("slug")
+    taken_slugs = set(Presentation.objects.values_list("slug", flat=True))
+    slugs = []
+    for title in titles:
+        original_slug = crop_slug(slug_field, slug_field.slugify(title))
+        original_slug = original_slug or Presentation._meta.model_name
+        slug = original_slug
+        index = 1
+        while slug in taken_slugs:
+            index += 1
+            suffix = "{}{}".format(slug_field.index_sep, index)
+            slug = original_slug[:slug_field.max_length - len(suffix)] + suffix
+        taken_slugs.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+def create_presentations(proposals):
+    """
+    Create presentations for proposals that do not have them.
+
+    Returns the number of presentations created.
+    """
+    proposals = list(
+        proposals.filter(presentation=None)
+        .order_by("pk")
+        .select_related("kind")
+        .prefetch_related("additional_speakers")
+    )
+    if not proposals:
+        return 0
+
+    # Presentations are created with the same details that saving
+    # a proposal copies to its presentation.
+    descriptions = parse_many([proposal.description for proposal in proposals])
+    abstracts = parse_many([proposal.abstract for proposal in proposals])
+    slugs = _unique_slugs([proposal.title for proposal in proposals])
+    presentations = [
+        Presentation(
+            proposal_base_id=proposal.pk,
+            section_id=proposal.kind.section_id,
+            speaker_id=proposal.speaker_id,
+            title=proposal.title,
+            slug=slug,
+            description=proposal.description,
+            description_html=description_html,
+            abstract=proposal.abstract,
+            abstract_html=abstract_html,
+        )
+        for proposal, slug, description_html, abstract_html in zip(
+            proposals, slugs, descriptions, abstracts
+        )
+    ]
+    with transaction.atomic():
+        bulk_create(Presentation, presentations)
+        speaker_model = Presentation.additional_speakers.through
+        speaker_model.objects.bulk_create(
+            [
+                speaker_model(
+                    presentation_id=presentation.pk, speaker_id=speaker.pk
+                )
+                for proposal, presentation in zip(proposals, presentations)
+                for speaker in proposal.additional_speakers.all()
+            ]
+        )
+    invalidate_schedule_json()
+    invalidate_schedule_pages()
+    # Callers may be creating presentations in a larger transaction.
+    transaction.on_commit(lambda: bump_model_version(Presentation))
+    transaction.on_commit(
+        lambda: bump_model_version(Presentation.additional_speakers.through)
+    )
+    return len(presentations)
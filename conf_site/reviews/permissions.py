@@ -0,0 +1,71 @@
+"""
+Checks for access to the reviewing section.
+
+The primary key of the Reviewers group is remembered for the lifetime
+of the process (and forgotten whenever a group is saved or deleted),
+and each user's membership is remembered on the user object, so a
+request only runs one query to decide whether its user is a reviewer.
+"""
+from django.contrib.auth.models import Group
+
+
+REVIEWERS_GROUP_NAME = "Reviewers"
+
+_reviewers_group_pk = None
+
+
+def get_reviewers_group_pk():
+    """
+    Return the primary key of the Reviewers group.
+
+    Raises Group.DoesNotExist if the group has not been created.
+    """
+    global _reviewers_group_pk
+    if _reviewers_group_pk is None:
+        _reviewers_group_pk = Group.objects.values_list("pk", flat=True).get(
+            name=REVIEWERS_GROUP_NAME
+        )
+    return _reviewers_group_pk
+
+
+def clear_reviewers_group_pk():
+    """Forget the remembered primary key of the Reviewers group."""
+    global _reviewers_group_pk
+    _reviewers_group_pk = None
+
+
+def clear_user_reviewer_status(user):
+    """Forget whether this user object is in the Reviewers group."""
+    try:
+        del user._is_reviewer
+    except AttributeError:
+        pass
+
+
+def is_reviewer(user):
+    """Determine whether user is in the Reviewers user group."""
+    if not user.is_authenticated:
+        return False
+    try:
+        return user._is_reviewer
+    except AttributeError:
+        pass
+    try:
+        reviewers_group_pk = get_reviewers_group_pk()
+    except Group.DoesNotExist:
+        return False
+    user._is_reviewer = user.groups.filter(pk=reviewers_group_pk).exists()
+    return user._is_reviewer
+
+
+def is_reviewer_or_superuser(user):
+    """Check if user is in Reviewers group or is superuser."""
+    if user.is_superuser:
+        return True
+    # Raise an exception if the Reviewers group does not
+    # exist, because this is a critical problem.
+    try:
+        get_reviewers_group_pk()
+    except Group.DoesNotExist:
+        raise Exception("Reviewers user group does not exist.")
+    return is_reviewer(user)
@@ -0,0 +1,308 @@
+"""
+Full-text search of proposals for reviewers.
+
+Each proposal's searchable text (its title, description, abstract,
+notes and keywords) and its speakers' names are stored in a
+ProposalSearchDocument. Documents are deleted when the data that they
+contain changes, and missing documents are created before searching.
+
+PostgreSQL databases search documents with the GIN indexes created by
+their migration, matching words in any of the searched fields as the
+inverted index does. Other databases (like SQLite during development and
+testing) use an inverted index that each process builds from the
+documents and updates as they are created.
+"""
+import math
+import re
+import threading
+import uuid
+from collections import Counter, defaultdict
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Case, FloatField, Value, When
+
+from conf_site.proposals.models import Proposal
+from conf_site.reviews.counts import count_keywords, count_proposals
+from conf_site.reviews.models import ProposalSearchDocument
+
+
+# Text search configuration used by PostgreSQL. The indexes
+# created by this app's migrations must use the same configuration.
+SEARCH_CONFIG = "english"
+SEARCH_FIELDS = ("text", "speaker_names")
+SEARCH_INDEX_VERSION_KEY = "proposal_search_index_version"
+
+# Number of documents created at a time.
+DOCUMENT_BATCH_SIZE = 500
+
+WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """Return the lowercase words in text."""
+    return WORD_RE.findall(text.lower())
+
+
+def _build_document(proposal):
+    keywords = (
+        list(proposal.official_keywords.all())
+        + list(proposal.user_keywords.all())
+        + list(proposal.editor_keywords.all())
+    )
+    text = [
+        proposal.title,
+        proposal.description,
+        proposal.abstract,
+        proposal.additional_notes,
+    ] + [keyword.name for keyword in keywords]
+    speakers = [proposal.speaker] + list(proposal.additional_speakers.all())
+    return ProposalSearchDocument(
+        proposal_id=proposal.pk,
+        text="\n".join(text),
+        speaker_names="\n".join(speaker.name for speaker in speakers),
+    )
+
+
+def create_missing_documents():
+    """
+    Create documents of proposals that do not have them.
+
+    Returns the number of documents created.
+    """
+    proposal_pks = list(
+        Proposal.objects.filter(search_document=None)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    for start in range(0, len(proposal_pks), DOCUMENT_BATCH_SIZE):
+        proposals = (
+            Proposal.objects.filter(
+                pk__in=proposal_pks[start:start + DOCUMENT_BATCH_SIZE]
+            )
+            .select_related("speaker")
+            .prefetch_related(
+                "additional_speakers",
+                "editor_keywords",
+                "official_keywords",
+                "user_keywords",
+            )
+        )
+        documents = [_build_document(proposal) for proposal in proposals]
+        # Another request may be creating the same documents.
+        ProposalSearchDocument.objects.bulk_create(
+            documents, ignore_conflicts=True
+        )
+        get_search_backend().update(documents)
+    return len(proposal_pks)
+
+
+def forget_search_documents(proposal_pks):
+    """Delete the documents of proposals so that they are recreated."""
+    proposal_pks = list(proposal_pks)
+    ProposalSearchDocument.objects.filter(proposal__in=proposal_pks).delete()
+    get_search_backend().remove(proposal_pks)
+
+
+class InvertedIndex(object):
+    """The proposals that contain each word of each document field."""
+
+    def __init__(self):
+        # Numbers of times that words appear in each proposal's fields,
+        # keyed by field name, word and proposal primary key.
+        self.postings = {field: defaultdict(dict) for field in SEARCH_FIELDS}
+        # Numbers of words in each proposal's fields.
+        self.lengths = {field: {} for field in SEARCH_FIELDS}
+        self.words = {}
+
+    def add(self, document):
+        self.remove(document.proposal_id)
+        self.words[document.proposal_id] = {}
+        for field in SEARCH_FIELDS:
+            word_counts = Counter(tokenize(getattr(document, field)))
+            for word, count in word_counts.items():
+                self.postings[field][word][document.proposal_id] = count
+            self.lengths[field][document.proposal_id] = sum(
+                word_counts.values()
+            )
+            self.words[document.proposal_id][field] = list(word_counts)
+
+    def remove(self, proposal_pk):
+        for field, words in self.words.pop(proposal_pk, {}).items():
+            for word in words:
+                postings = self.postings[field][word]
+                del postings[proposal_pk]
+                if not postings:
+                    del self.postings[field][word]
+            del self.lengths[field][proposal_pk]
+
+    def search(self, query, fields=SEARCH_FIELDS):
+        """
+        Return a dictionary of the ranks of proposals that contain
+        every word in query, keyed by proposal primary key.
+
+        Words are ranked by their frequency in each field, weighted
+        by their rarity among all proposals (TF-IDF).
+        """
+        ranks = None
+        for word in set(tokenize(query)):
+            word_ranks = {}
+            for field in fields:
+                postings = self.postings[field].get(word, {})
+                if not postings:
+                    continue
+                weight = math.log(1 + len(self.lengths[field]) / len(postings))
+                for proposal_pk, count in postings.items():
+                    word_ranks[proposal_pk] = word_ranks.get(
+                        proposal_pk, 0
+                    ) + weight * count / self.lengths[field][proposal_pk]
+            if ranks is None:
+                ranks = word_ranks
+            else:
+                ranks = {
+                    proposal_pk: rank + word_ranks[proposal_pk]
+                    for proposal_pk, rank in ranks.items()
+                    if proposal_pk in word_ranks
+                }
+        return ranks or {}
+
+
+class LocalSearchBackend(object):
+    """
+    Search documents with an inverted index kept in this process.
+
+    Each index is built from the stored documents, and rebuilt when the
+    version stored in the cache shows that another process has changed
+    them. Words must match exactly, since they are not stemmed.
+    """
+
+    def __init__(self):
+        self._index = None
+        self._version = None
+        self._lock = threading.RLock()
+
+    def _set_version(self):
+        self._version = uuid.uuid4().hex
+        cache.set(SEARCH_INDEX_VERSION_KEY, self._version, None)
+
+    def _get_index(self):
+        version = cache.get(SEARCH_INDEX_VERSION_KEY)
+        with self._lock:
+            if self._index is None or version != self._version:
+                self._index = InvertedIndex()
+                for document in ProposalSearchDocument.objects.all():
+                    self._index.add(document)
+                if version is None:
+                    self._set_version()
+                else:
+                    self._version = version
+            return self._index
+
+    def _change_index(self, change):
+        with self._lock:
+            if cache.get(SEARCH_INDEX_VERSION_KEY) != self._version:
+                # This index is already out of date.
+                self._index = None
+            elif self._index is not None:
+                change(self._index)
+            self._set_version()
+
+    def update(self, documents):
+        def add_documents(index):
+            for document in documents:
+                index.add(document)
+
+        self._change_index(add_documents)
+
+    def remove(self, proposal_pks):
+        def remove_proposals(index):
+            for proposal_pk in proposal_pks:
+                index.remove(proposal_pk)
+
+        self._change_index(remove_proposals)
+
+    def search(self, proposals, query, fields):
+        ranks = self._get_index().search(query, fields)
+        return proposals.filter(pk__in=list(ranks)).annotate(
+            search_rank=Case(
+                *[
+                    When(pk=proposal_pk, then=Value(rank))
+                    for proposal_pk, rank in ranks.items()
+                ],
+                default=Value(0.0),
+                output_field=FloatField()
+            )
+        )
+
+
+class PostgresSearchBackend(object):
+    """Search documents with PostgreSQL's full-text search."""
+
+    def update(self, documents):
+        """PostgreSQL updates its indexes as documents change."""
+
+    def remove(self, proposal_pks):
+        """PostgreSQL updates its indexes as documents change."""
+
+    def search(self, proposals, query, fields):
+        search_query = SearchQuery(query, config=SEARCH_CONFIG)
+        # Fields are searched as one vector, so that words can be
+        # found in different fields, as they are by InvertedIndex.
+        # Documents are filtered in a subquery so that their vectors
+        # match the indexed expressions.
+        matching_documents = ProposalSearchDocument.objects.annotate(
+            vector=SearchVector(*fields, config=SEARCH_CONFIG)
+        ).filter(vector=search_query)
+        rank = SearchRank(
+            SearchVector(
+                *["search_document__{}".format(field) for field in fields],
+                config=SEARCH_CONFIG
+            ),
+            search_query,
+        )
+        return proposals.filter(
+            pk__in=matching_documents.values("proposal")
+        ).annotate(search_rank=rank)
+
+
+_local_backend = LocalSearchBackend()
+_postgres_backend = PostgresSearchBackend()
+
+
+def get_search_backend():
+    if connection.vendor == "postgresql":
+        return _postgres_backend
+    return _local_backend
+
+
+def search_proposals(proposals, query, include_speakers=True):
+    """
+    Filter a queryset of proposals by a search query.
+
+    Proposals containing every word in query are annotated with their
+    rank (search_rank). Speakers' names are only searched if
+    include_speakers is true.
+    """
+    create_missing_documents()
+    fields = SEARCH_FIELDS if include_speakers else ("text",)
+    return get_search_backend().search(proposals, query, fields)
+
+
+def get_search_facets(proposals):
+    """
+    Count the proposals in a queryset by kind, result status and keyword.
+
+    Returns a ProposalCounts and a dictionary of keyword counts.
+    """
+    matching_proposals = Proposal.objects.filter(
+        pk__in=proposals.order_by().values("pk")
+    )
+    return (
+        count_proposals(matching_proposals),
+        count_keywords(matching_proposals),
+    )
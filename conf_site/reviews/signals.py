@@ -1,13 +1,29 @@
 from django.conf import settings
+from django.contrib.auth.models import Group, User
 from django.core.cache import cache
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
+from conf_site.proposals.models import KEYWORD_THROUGH_MODELS, Proposal
+from conf_site.reviews.counts import (
+    invalidate_keyword_counts,
+    invalidate_proposal_counts,
+)
 from conf_site.reviews.models import (
     ProposalFeedback,
+    ProposalResult,
     ProposalVote,
     proposalvote_score_cache_key,
 )
+from conf_site.reviews.permissions import (
+    clear_reviewers_group_pk,
+    clear_user_reviewer_status,
+)
+from conf_site.reviews.search import forget_search_documents
+from symposion.proposals.models import AdditionalSpeaker
+from symposion.speakers.models import Speaker
 
 
 @receiver(post_save, sender=ProposalFeedback)
@@ -15,11 +31,130 @@ def refresh_proposal_feedback_count(sender, instance, created, **kwargs):
     instance.proposal._refresh_feedback_count()
 
 
+def _score_or_none(score):
+    if score is None or score == "":
+        return None
+    return int(score)
+
+
 @receiver(post_save, sender=ProposalVote)
 def refresh_vote_counts(sender, instance, created, **kwargs):
     # Update this ProposalVote's proposal's cached proposal votes.
-    instance.proposal._refresh_vote_counts()
+    if not created and not hasattr(instance, "_saved_score"):
+        # The vote's previous score was never loaded.
+        instance.proposal._refresh_vote_counts()
+    else:
+        old_score = None if created else _score_or_none(instance._saved_score)
+        new_score = _score_or_none(instance.score)
+        if old_score != new_score:
+            instance.proposal._update_vote_counts(old_score, new_score)
+    instance._saved_score = instance.score
     # Update this voter's cached score for this proposal.
     cache_key = proposalvote_score_cache_key(instance.proposal, instance.voter)
     numeric_score = instance.get_numeric_score_display()
     cache.set(cache_key, numeric_score, settings.CACHE_TIMEOUT_LONG)
+
+
+@receiver(post_delete, sender=ProposalVote)
+def remove_deleted_vote_from_counts(sender, instance, **kwargs):
+    # The proposal itself may be in the process of being deleted,
+    # so we avoid loading it from the database.
+    proposal = Proposal(pk=instance.proposal_id)
+    if hasattr(instance, "_saved_score"):
+        proposal._update_vote_counts(
+            _score_or_none(instance._saved_score), None
+        )
+    else:
+        proposal._refresh_vote_counts()
+    # Forget this voter's cached score for this proposal.
+    # The voter may also be in the process of being deleted.
+    voter = User(pk=instance.voter_id)
+    cache.delete(proposalvote_score_cache_key(proposal, voter))
+
+
+@receiver(post_save, sender=Proposal)
+@receiver(post_delete, sender=Proposal)
+@receiver(post_save, sender=ProposalResult)
+@receiver(post_delete, sender=ProposalResult)
+def forget_proposal_counts(sender, **kwargs):
+    invalidate_proposal_counts()
+    if sender is Proposal:
+        # Cancelled proposals are not counted.
+        invalidate_keyword_counts()
+
+
+def forget_keyword_counts(sender, **kwargs):
+    invalidate_keyword_counts()
+
+
+for through_model in KEYWORD_THROUGH_MODELS:
+    post_save.connect(forget_keyword_counts, sender=through_model)
+    post_delete.connect(forget_keyword_counts, sender=through_model)
+
+
+def _forget_search_documents_on_commit(proposal_pks):
+    # Until the change is committed, searches would recreate
+    # the documents from the old data.
+    proposal_pks = list(proposal_pks)
+    transaction.on_commit(lambda: forget_search_documents(proposal_pks))
+
+
+@receiver(post_save, sender=Proposal)
+@receiver(post_delete, sender=Proposal)
+def forget_proposal_search_document(sender, instance, **kwargs):
+    _forget_search_documents_on_commit([instance.pk])
+
+
+def forget_keyword_search_document(sender, instance, **kwargs):
+    _forget_search_documents_on_commit([instance.object_id])
+
+
+for through_model in KEYWORD_THROUGH_MODELS:
+    post_save.connect(forget_keyword_search_document, sender=through_model)
+    post_delete.connect(forget_keyword_search_document, sender=through_model)
+
+
+@receiver(post_save, sender=AdditionalSpeaker)
+@receiver(post_delete, sender=AdditionalSpeaker)
+def forget_additional_speaker_search_document(sender, instance, **kwargs):
+    _forget_search_documents_on_commit([instance.proposalbase_id])
+
+
+def _forget_speaker_search_documents(speaker):
+    _forget_search_documents_on_commit(
+        Proposal.objects.filter(
+            Q(speaker=speaker) | Q(additional_speakers=speaker)
+        )
+        .distinct()
+        .values_list("pk", flat=True)
+    )
+
+
+@receiver(m2m_changed, sender=AdditionalSpeaker)
+def forget_additional_speakers_search_documents(
+    sender, instance, action, **kwargs
+):
+    if not action.startswith("post_"):
+        return
+    if isinstance(instance, Speaker):
+        _forget_speaker_search_documents(instance)
+    else:
+        _forget_search_documents_on_commit([instance.pk])
+
+
+@receiver(post_save, sender=Speaker)
+def forget_speaker_search_documents(sender, instance, created, **kwargs):
+    if not created:
+        _forget_speaker_search_documents(instance)
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def forget_reviewers_group(sender, **kwargs):
+    clear_reviewers_group_pk()
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def forget_reviewer_status(sender, instance, **kwargs):
+    if isinstance(instance, User):
+        clear_user_reviewer_status(instance)
@@ -1,8 +1,8 @@
 from django import template
 from django.conf import settings
-from django.contrib.auth.models import Group
 from django.core.cache import cache
 
+from conf_site.reviews import permissions
 from conf_site.reviews.models import ProposalVote, proposalvote_score_cache_key
 
 
@@ -10,12 +10,19 @@ register = template.Library()
 
 
 @register.simple_tag
-def user_score(proposal, user):
-    """For the selected proposal, display the current user's review score."""
+def user_score(proposal, user, scores=None):
+    """
+    For the selected proposal, display the current user's review score.
+
+    List views pass the scores that they have already loaded
+    for the current page so that no further queries are needed.
+    """
+    if scores is not None:
+        return scores.get(proposal.pk, " ")
     # Try to retrieve score from cache.
     score_cache_key = proposalvote_score_cache_key(proposal, user)
     cached_score = cache.get(score_cache_key)
-    if cached_score:
+    if cached_score is not None:
         return cached_score
     try:
         uncached_score = ProposalVote.objects.get(
@@ -30,8 +37,4 @@ def user_score(proposal, user):
 @register.filter(name="is_reviewer")
 def is_reviewer(user):
     """Determine whether selected user is in the Reviewers user group."""
-    try:
-        reviewers_group = Group.objects.get(name="Reviewers")
-    except Group.DoesNotExist:
-        return False
-    return True if reviewers_group in user.groups.all() else False
+    return permissions.is_reviewer(user)
@@ -22,7 +22,7 @@ class ExportReviewersViewTestCase(StaffOnlyCsvViewTestCase):
             reviewer.groups.add(self.reviewers_group)
             reviewer.save()
 
-        response = self.view_class().get()
+        response = self._get_csv_response()
 
         for reviewer in reviewers:
             self.assertContains(response, reviewer.id)
@@ -32,7 +32,7 @@ class ExportReviewersViewTestCase(StaffOnlyCsvViewTestCase):
     def test_not_including_non_reviewers(self):
         users_not_reviewers = UserFactory.create_batch(size=randint(2, 4))
 
-        response = self.view_class().get()
+        response = self._get_csv_response()
 
         for user in users_not_reviewers:
             self.assertNotContains(response, user.get_full_name())
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+from django.urls import reverse
+
+from conf_site.accounts.tests import AccountsTestCase
+from conf_site.proposals.tests.factories import ProposalFactory
+from conf_site.reviews.counts import (
+    get_keyword_counts,
+    invalidate_keyword_counts,
+)
+from conf_site.reviews.tests import ReviewingMixin
+
+
+class ReviewKeywordViewTestCase(ReviewingMixin, AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        invalidate_keyword_counts()
+        self.proposal = ProposalFactory()
+        self.proposal.editor_keywords.add("snakes")
+        self.proposal.user_keywords.add("snakes", "pandas")
+        self.keyword = self.proposal.user_keywords.get(name="snakes")
+        self.other_proposal = ProposalFactory()
+        self.other_proposal.official_keywords.add("snakes")
+        self.untagged_proposal = ProposalFactory()
+        self.cancelled_proposal = ProposalFactory(cancelled=True)
+        self.cancelled_proposal.user_keywords.add("snakes")
+
+    def test_no_reviewer_access(self):
+        """Verify that non-reviewers cannot see keywords."""
+        for url in [
+            reverse("review_keyword_list"),
+            reverse("review_keyword_detail", args=[self.keyword.slug]),
+        ]:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 403)
+
+    def test_keyword_detail(self):
+        """Verify that each tagged proposal is listed once."""
+        self._add_to_reviewers_group()
+        response = self.client.get(
+            reverse("review_keyword_detail", args=[self.keyword.slug])
+        )
+        self.assertEqual(
+            list(response.context["proposal_list"]),
+            [self.proposal, self.other_proposal],
+        )
+        self.assertContains(response, "<strong>2</strong> proposals")
+        self.assertNotContains(response, self.untagged_proposal.title)
+
+    def test_keyword_counts(self):
+        with self.assertNumQueries(1):
+            keyword_counts = get_keyword_counts()
+        self.assertEqual(keyword_counts[self.keyword.pk], 2)
+        pandas = self.proposal.user_keywords.get(name="pandas")
+        self.assertEqual(keyword_counts[pandas.pk], 1)
+        with self.assertNumQueries(0):
+            get_keyword_counts()
+
+    def test_tagging_clears_keyword_counts(self):
+        get_keyword_counts()
+        self.untagged_proposal.user_keywords.add("snakes")
+        self.assertEqual(get_keyword_counts()[self.keyword.pk], 3)
+        self.proposal.editor_keywords.clear()
+        self.proposal.user_keywords.remove("snakes")
+        self.assertEqual(get_keyword_counts()[self.keyword.pk], 2)
+        self.other_proposal.cancelled = True
+        self.other_proposal.save()
+        self.assertEqual(get_keyword_counts()[self.keyword.pk], 1)
+
+    def test_keyword_list_counts(self):
+        self._add_to_reviewers_group()
+        response = self.client.get(reverse("review_keyword_list"))
+        self.assertContains(response, '<span class="badge">2</span>')
+        self.assertContains(response, '<span class="badge">1</span>')
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+from django.test import TestCase
+
+from conf_site.proposals.models import Proposal
+from conf_site.proposals.tests.factories import ProposalFactory
+from conf_site.reviews.counts import (
+    get_proposal_counts,
+    invalidate_proposal_counts,
+)
+from conf_site.reviews.models import ProposalResult
+from symposion.schedule.tests.factories import ProposalKindFactory
+
+
+class ProposalCountsTestCase(TestCase):
+    def setUp(self):
+        invalidate_proposal_counts()
+        self.kinds = ProposalKindFactory.create_batch(size=3)
+        for index, kind in enumerate(self.kinds):
+            ProposalFactory.create_batch(size=index + 1, kind=kind)
+        ProposalFactory(kind=self.kinds[0], cancelled=True)
+
+    def test_counts_by_kind(self):
+        with self.assertNumQueries(1):
+            counts = get_proposal_counts()
+        self.assertEqual(counts.count(), 6)
+        for index, kind in enumerate(self.kinds):
+            self.assertEqual(counts.count(kind=kind.pk), index + 1)
+
+    def test_counts_by_status(self):
+        proposal = Proposal.objects.filter(kind=self.kinds[2]).first()
+        ProposalResult.objects.create(
+            proposal=proposal, status=ProposalResult.RESULT_ACCEPTED
+        )
+        counts = get_proposal_counts()
+        self.assertEqual(
+            counts.count(status=ProposalResult.RESULT_ACCEPTED), 1
+        )
+        # Proposals without results are undecided.
+        self.assertEqual(
+            counts.count(status=ProposalResult.RESULT_UNDECIDED), 5
+        )
+        self.assertEqual(
+            counts.count(
+                kind=self.kinds[2].pk, status=ProposalResult.RESULT_UNDECIDED
+            ),
+            2,
+        )
+
+    def test_counts_are_cached(self):
+        get_proposal_counts()
+        with self.assertNumQueries(0):
+            self.assertEqual(get_proposal_counts().count(), 6)
+
+    def test_changes_clear_cache(self):
+        get_proposal_counts()
+        proposal = ProposalFactory(kind=self.kinds[0])
+        self.assertEqual(get_proposal_counts().count(), 7)
+        ProposalResult.objects.create(
+            proposal=proposal, status=ProposalResult.RESULT_REJECTED
+        )
+        self.assertEqual(
+            get_proposal_counts().count(status=ProposalResult.RESULT_REJECTED),
+            1,
+        )
+        proposal.cancelled = True
+        proposal.save()
+        self.assertEqual(get_proposal_counts().count(), 6)
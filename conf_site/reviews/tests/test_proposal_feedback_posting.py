@@ -4,6 +4,7 @@ from conf_site.accounts.tests import AccountsTestCase
 from conf_site.accounts.tests.factories import UserFactory
 from conf_site.reviews.tests import ReviewingPostViewTestCase
 from conf_site.reviews.tests.factories import ProposalFeedbackFactory
+from symposion.outbox.delivery import send_queued_email
 
 
 class ProposalFeedbackPostingTestCase(
@@ -46,6 +47,7 @@ class ProposalFeedbackPostingTestCase(
         )
 
         response = self._get_response()
+        send_queued_email()
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(mail.outbox), 2)
@@ -61,6 +63,7 @@ class ProposalFeedbackPostingTestCase(
         )
 
         response = self._get_response()
+        send_queued_email()
 
         self.assertEqual(response.status_code, 200)
         # There should be only one message sent - to the random user.
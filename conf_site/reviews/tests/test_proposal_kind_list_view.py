@@ -20,6 +20,9 @@ class ProposalKindListViewTestCase(ProposalListViewTestCase):
         self.proposal_kind = ProposalKindFactory.create()
         self.reverse_view_args = [self.proposal_kind.slug]
 
+    def _proposal_kwargs(self):
+        return {"kind": self.proposal_kind}
+
     # Disable reviewing methods that are not valid for this view
     # because it contains a subset of all proposals.
     def test_blind_reviewing_types_as_reviewer(self):
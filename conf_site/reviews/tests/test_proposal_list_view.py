@@ -3,10 +3,13 @@ from random import randint
 
 from django.core import mail
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from faker import Faker
 
+from symposion.outbox.delivery import send_queued_email
 from symposion.proposals.models import AdditionalSpeaker
 from symposion.schedule.tests.factories import (
     ProposalKindFactory, SectionFactory
@@ -15,8 +18,9 @@ from symposion.schedule.tests.factories import (
 from conf_site.accounts.tests import AccountsTestCase
 from conf_site.proposals.models import Proposal
 from conf_site.proposals.tests.factories import ProposalFactory
-from conf_site.reviews.models import ProposalResult
+from conf_site.reviews.models import ProposalResult, ProposalVote
 from conf_site.reviews.tests import ReviewingTestCase
+from conf_site.reviews.tests.factories import ProposalVoteFactory
 from conf_site.speakers.tests.factories import SpeakerFactory
 
 
@@ -27,6 +31,10 @@ class ProposalListViewTestCase(ReviewingTestCase, AccountsTestCase):
         super(ProposalListViewTestCase, self).setUp()
         self.faker = Faker()
 
+    def _proposal_kwargs(self):
+        """Return arguments for creating proposals shown by this view."""
+        return {}
+
     def _validate_proposals(self, proposals, should_contain=True):
         # User must be in the reviewers group in order to access
         # this view.
@@ -190,6 +198,8 @@ class ProposalListViewTestCase(ReviewingTestCase, AccountsTestCase):
             reverse("review_multiedit"), post_data, follow=True
         )
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 0)
+        send_queued_email()
         self.assertEqual(len(mail.outbox), 1)
 
     def test_warning_about_unnotified_speakers(self):
@@ -220,3 +230,81 @@ class ProposalListViewTestCase(ReviewingTestCase, AccountsTestCase):
             "and has not been notified.".format(emailless_speaker.name)
         )
         self.assertContains(response, speaker_warning)
+
+    def test_ordering_by_score(self):
+        """Verify that proposals can be sorted by their scores."""
+        self._add_to_reviewers_group()
+        low_proposal, high_proposal = ProposalFactory.create_batch(
+            size=2, **self._proposal_kwargs()
+        )
+        ProposalVoteFactory(
+            proposal=low_proposal, score=ProposalVote.MINUS_ONE
+        )
+        ProposalVoteFactory.create_batch(
+            size=2, proposal=high_proposal, score=ProposalVote.PLUS_ONE
+        )
+
+        response = self.client.get(
+            reverse(self.reverse_view_name, args=self.reverse_view_args),
+            {"order": "score"},
+        )
+        self.assertEqual(
+            list(response.context["proposal_list"]),
+            [high_proposal, low_proposal],
+        )
+        self.assertEqual(response.context["proposal_list"][0].vote_score, 6)
+
+        response = self.client.get(
+            reverse(self.reverse_view_name, args=self.reverse_view_args),
+            {"order": "score", "min_score": 0},
+        )
+        self.assertEqual(
+            list(response.context["proposal_list"]), [high_proposal]
+        )
+
+    def test_user_scores_are_preloaded(self):
+        """Verify that the current user's scores are loaded in bulk."""
+        self._add_to_reviewers_group()
+        voted_proposal, unvoted_proposal = ProposalFactory.create_batch(
+            size=2, **self._proposal_kwargs()
+        )
+        ProposalVoteFactory(
+            proposal=voted_proposal,
+            voter=self.user,
+            score=ProposalVote.PLUS_ZERO,
+        )
+        # Other reviewers' votes are not shown.
+        ProposalVoteFactory(
+            proposal=unvoted_proposal, score=ProposalVote.PLUS_ONE
+        )
+
+        response = self._get_response()
+        self.assertEqual(
+            response.context["user_scores"], {voted_proposal.pk: "+0"}
+        )
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        """Verify that each row does not run its own queries."""
+        self._add_to_reviewers_group()
+        for proposal in ProposalFactory.create_batch(
+            size=2, **self._proposal_kwargs()
+        ):
+            ProposalVoteFactory(proposal=proposal, voter=self.user)
+        # Warm up per-process caches, such as the current site.
+        self._get_response()
+        with CaptureQueriesContext(connection) as small_page_queries:
+            self._get_response()
+
+        for proposal in ProposalFactory.create_batch(
+            size=5, **self._proposal_kwargs()
+        ):
+            ProposalVoteFactory(proposal=proposal, voter=self.user)
+        # Creating proposals clears the cached proposal counts.
+        self._get_response()
+        with CaptureQueriesContext(connection) as large_page_queries:
+            self._get_response()
+
+        self.assertEqual(
+            len(large_page_queries.captured_queries),
+            len(small_page_queries.captured_queries),
+        )
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+from django.core import mail
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from conf_site.proposals.tests.factories import ProposalFactory
+from conf_site.reviews.models import ProposalNotification
+from conf_site.reviews.tests.factories import ProposalVoteFactory
+from conf_site.speakers.tests.factories import SpeakerFactory
+from symposion.outbox.delivery import send_queued_email
+from symposion.outbox.models import QueuedEmail
+from symposion.proposals.models import AdditionalSpeaker
+
+
+class ProposalNotificationTestCase(TestCase):
+    def _create_notification(self, proposals):
+        notification = ProposalNotification.objects.create(
+            from_address="program@example.com",
+            subject="Your proposal",
+            body="{{ proposal.title }} by {{ proposal.speakers }} "
+            "({{ proposal.votes|length }} votes)",
+        )
+        notification.proposals.set(proposals)
+        return notification
+
+    def _count_selects(self, queries):
+        return len(
+            [
+                query
+                for query in queries.captured_queries
+                if query["sql"].startswith("SELECT")
+            ]
+        )
+
+    def _add_speaker(self, proposal, speaker):
+        AdditionalSpeaker.objects.create(
+            proposalbase=proposal.proposalbase_ptr,
+            speaker=speaker,
+            status=AdditionalSpeaker.SPEAKING_STATUS_ACCEPTED,
+        )
+
+    def test_messages_are_rendered_per_proposal(self):
+        proposal = ProposalFactory()
+        additional_speaker = SpeakerFactory()
+        self._add_speaker(proposal, additional_speaker)
+        ProposalVoteFactory.create_batch(size=2, proposal=proposal)
+        notification = self._create_notification([proposal])
+
+        self.assertEqual(notification.send_email(), [])
+        send_queued_email()
+
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            sorted([proposal.speaker.email, additional_speaker.email]),
+        )
+        for message in mail.outbox:
+            self.assertEqual(message.subject, "Your proposal")
+            self.assertIn(proposal.title, message.body)
+            self.assertIn(additional_speaker.name, message.body)
+            self.assertIn("(2 votes)", message.body)
+
+    def test_query_count_does_not_depend_on_proposals(self):
+        proposals = ProposalFactory.create_batch(size=6)
+        for proposal in proposals:
+            self._add_speaker(proposal, SpeakerFactory())
+            ProposalVoteFactory(proposal=proposal)
+        small_notification = self._create_notification(proposals[:2])
+        large_notification = self._create_notification(proposals)
+
+        with CaptureQueriesContext(connection) as small_queries:
+            small_notification.send_email()
+        with CaptureQueriesContext(connection) as large_queries:
+            large_notification.send_email()
+        # Queued emails are inserted one at a time on databases that
+        # cannot return primary keys from bulk inserts, so only
+        # compare the queries that load data.
+        self.assertEqual(
+            self._count_selects(large_queries),
+            self._count_selects(small_queries),
+        )
+
+    def test_recipient_status_is_recorded(self):
+        proposal = ProposalFactory()
+        emailless_speaker = SpeakerFactory(user=None)
+        self._add_speaker(proposal, emailless_speaker)
+        notification = self._create_notification([proposal])
+
+        self.assertEqual(notification.send_email(), [emailless_speaker])
+        recipients = {
+            recipient.speaker: recipient
+            for recipient in notification.recipients.all()
+        }
+        self.assertEqual(
+            recipients[emailless_speaker].status(), "No email address"
+        )
+        self.assertEqual(recipients[proposal.speaker].status(), "Queued")
+
+        send_queued_email()
+        recipients[proposal.speaker].queued_email.refresh_from_db()
+        self.assertEqual(recipients[proposal.speaker].status(), "Sent")
+        self.assertEqual(
+            recipients[proposal.speaker].queued_email.status,
+            QueuedEmail.STATUS_SENT,
+        )
+
+    def test_proposals_are_chunked(self):
+        proposals = ProposalFactory.create_batch(size=5)
+        notification = self._create_notification(proposals)
+        notification.send_email(chunk_size=2)
+        self.assertEqual(notification.recipients.count(), 5)
+        self.assertEqual(QueuedEmail.objects.count(), 5)
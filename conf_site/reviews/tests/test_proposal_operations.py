@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+from django.test import TestCase
+
+from conf_site.proposals.models import Proposal
+from conf_site.proposals.tests.factories import ProposalFactory
+from conf_site.reviews.models import ProposalResult
+from conf_site.reviews.operations import (
+    create_missing_results,
+    create_presentations,
+    set_proposal_results,
+)
+from conf_site.speakers.tests.factories import SpeakerFactory
+from symposion.schedule.models import Presentation
+
+
+class ProposalOperationsTestCase(TestCase):
+    def test_setting_results(self):
+        proposals = ProposalFactory.create_batch(size=4)
+        ProposalResult.objects.create(
+            proposal=proposals[0], status=ProposalResult.RESULT_REJECTED
+        )
+        # Four queries and a savepoint, however many proposals change.
+        with self.assertNumQueries(6):
+            set_proposal_results(
+                [proposal.pk for proposal in proposals[:3]],
+                ProposalResult.RESULT_ACCEPTED,
+            )
+        self.assertEqual(
+            set(
+                ProposalResult.objects.filter(
+                    status=ProposalResult.RESULT_ACCEPTED
+                ).values_list("proposal", flat=True)
+            ),
+            {proposal.pk for proposal in proposals[:3]},
+        )
+        self.assertFalse(
+            ProposalResult.objects.filter(proposal=proposals[3]).exists()
+        )
+
+    def test_creating_missing_results(self):
+        proposals = ProposalFactory.create_batch(size=3)
+        ProposalResult.objects.create(
+            proposal=proposals[0], status=ProposalResult.RESULT_ACCEPTED
+        )
+        self.assertEqual(create_missing_results(), 2)
+        self.assertEqual(create_missing_results(), 0)
+        self.assertEqual(
+            ProposalResult.objects.filter(
+                status=ProposalResult.RESULT_UNDECIDED
+            ).count(),
+            2,
+        )
+
+    def test_creating_presentations(self):
+        proposals = ProposalFactory.create_batch(
+            size=3, title="Snakes", abstract="*Abstract*"
+        )
+        additional_speaker = SpeakerFactory()
+        proposals[1].additional_speakers.add(additional_speaker)
+
+        self.assertEqual(create_presentations(Proposal.objects.all()), 3)
+        self.assertEqual(create_presentations(Proposal.objects.all()), 0)
+
+        presentations = Presentation.objects.order_by("proposal_base")
+        self.assertEqual(
+            [presentation.slug for presentation in presentations],
+            ["snakes", "snakes-2", "snakes-3"],
+        )
+        for proposal, presentation in zip(proposals, presentations):
+            self.assertEqual(presentation.proposal_base_id, proposal.pk)
+            self.assertEqual(presentation.section, proposal.section)
+            self.assertEqual(presentation.speaker, proposal.speaker)
+            self.assertEqual(presentation.description, proposal.description)
+            self.assertEqual(
+                presentation.abstract_html, "<p><em>Abstract</em></p>"
+            )
+        self.assertEqual(
+            list(presentations[1].additional_speakers.all()),
+            [additional_speaker],
+        )
+
+    def test_slugs_do_not_clash_with_existing_presentations(self):
+        create_presentations(
+            Proposal.objects.filter(pk=ProposalFactory(title="Snakes").pk)
+        )
+        create_presentations(
+            Proposal.objects.filter(pk=ProposalFactory(title="Snakes").pk)
+        )
+        self.assertEqual(
+            sorted(Presentation.objects.values_list("slug", flat=True)),
+            ["snakes", "snakes-2"],
+        )
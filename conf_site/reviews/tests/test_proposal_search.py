@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from constance.test import override_config
+
+from conf_site.accounts.tests import AccountsTestCase
+from conf_site.proposals.models import Proposal
+from conf_site.proposals.tests.factories import ProposalFactory
+from conf_site.reviews.models import ProposalResult, ProposalSearchDocument
+from conf_site.reviews.search import (
+    SEARCH_FIELDS,
+    SEARCH_INDEX_VERSION_KEY,
+    InvertedIndex,
+    LocalSearchBackend,
+    create_missing_documents,
+    get_search_facets,
+    search_proposals,
+)
+from conf_site.reviews.tests import ReviewingMixin
+from conf_site.speakers.tests.factories import SpeakerFactory
+from symposion.proposals.models import AdditionalSpeaker
+from symposion.tests.utils import run_on_commit_callbacks
+
+
+class ProposalSearchTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.pandas_proposal = ProposalFactory(
+            title="Dataframes with pandas",
+            description="Tabular data",
+            abstract="Pandas pandas pandas",
+            speaker__name="Wes Wrangler",
+        )
+        self.numpy_proposal = ProposalFactory(
+            title="Arrays with numpy",
+            description="Numerical data",
+            abstract="Broadcasting and pandas interoperability",
+        )
+        self.numpy_proposal.official_keywords.add("Scientific Computing")
+
+    def _search(self, query, include_speakers=True):
+        return list(
+            search_proposals(
+                Proposal.objects.all(), query, include_speakers
+            ).order_by("-search_rank", "pk")
+        )
+
+    def test_search(self):
+        self.assertEqual(self._search("numpy"), [self.numpy_proposal])
+        self.assertEqual(self._search("NUMERICAL"), [self.numpy_proposal])
+        # Proposals must contain every word.
+        self.assertEqual(self._search("pandas data"), [
+            self.pandas_proposal, self.numpy_proposal,
+        ])
+        self.assertEqual(self._search("pandas numerical"), [
+            self.numpy_proposal,
+        ])
+        self.assertEqual(self._search("scipy"), [])
+        self.assertEqual(self._search("   "), [])
+
+    def test_ranking(self):
+        """Verify that proposals that mention words more rank higher."""
+        self.assertEqual(self._search("pandas"), [
+            self.pandas_proposal, self.numpy_proposal,
+        ])
+
+    def test_search_keywords(self):
+        self.assertEqual(
+            self._search("scientific computing"), [self.numpy_proposal]
+        )
+
+    def test_search_speakers(self):
+        self.assertEqual(self._search("wrangler"), [self.pandas_proposal])
+        self.assertEqual(self._search("wrangler", include_speakers=False), [])
+        speaker = SpeakerFactory(name="Nellie Numerical")
+        with run_on_commit_callbacks():
+            AdditionalSpeaker.objects.create(
+                proposalbase=self.pandas_proposal, speaker=speaker
+            )
+        self.assertEqual(self._search("nellie"), [self.pandas_proposal])
+
+    def test_search_across_fields(self):
+        """Verify that words can be found in different fields."""
+        self.assertEqual(
+            self._search("pandas wrangler"), [self.pandas_proposal]
+        )
+        self.assertEqual(
+            self._search("pandas wrangler", include_speakers=False), []
+        )
+
+    def test_documents_are_created_once(self):
+        self._search("numpy")
+        self.assertEqual(ProposalSearchDocument.objects.count(), 2)
+        # Once documents exist, only the check for missing documents
+        # and the search itself use the database.
+        with self.assertNumQueries(2):
+            self._search("numpy")
+
+    def test_changes_update_search(self):
+        self._search("numpy")
+        self.numpy_proposal.title = "Arrays with cupy"
+        with run_on_commit_callbacks():
+            self.numpy_proposal.save()
+        self.assertEqual(self._search("numpy"), [])
+        self.assertEqual(self._search("cupy"), [self.numpy_proposal])
+
+        with run_on_commit_callbacks():
+            self.pandas_proposal.user_keywords.add("Spreadsheets")
+        self.assertEqual(self._search("spreadsheets"), [self.pandas_proposal])
+        with run_on_commit_callbacks():
+            self.pandas_proposal.user_keywords.clear()
+        self.assertEqual(self._search("spreadsheets"), [])
+
+        speaker = self.pandas_proposal.speaker
+        speaker.name = "Wes Tidier"
+        with run_on_commit_callbacks():
+            speaker.save()
+        self.assertEqual(self._search("wrangler"), [])
+        self.assertEqual(self._search("tidier"), [self.pandas_proposal])
+
+        with run_on_commit_callbacks():
+            self.pandas_proposal.delete()
+        self.assertEqual(self._search("data"), [self.numpy_proposal])
+
+    def test_documents_are_forgotten_on_commit(self):
+        """Verify that documents are only deleted once changes commit."""
+        self._search("numpy")
+        with run_on_commit_callbacks():
+            self.numpy_proposal.title = "Arrays with cupy"
+            self.numpy_proposal.save()
+            # Until the change is committed, other searches would
+            # recreate the document from the old data.
+            self.assertTrue(
+                ProposalSearchDocument.objects.filter(
+                    proposal=self.numpy_proposal, text__contains="numpy"
+                ).exists()
+            )
+        self.assertFalse(
+            ProposalSearchDocument.objects.filter(
+                proposal=self.numpy_proposal
+            ).exists()
+        )
+        self.assertEqual(self._search("cupy"), [self.numpy_proposal])
+
+    def test_other_processes_changes(self):
+        """Verify that changes made elsewhere are searched."""
+        self._search("numpy")
+        ProposalSearchDocument.objects.filter(
+            proposal=self.numpy_proposal
+        ).update(text="Arrays with jax")
+        # Another process would store a new index version.
+        cache.clear()
+        self.assertEqual(self._search("jax"), [self.numpy_proposal])
+
+    def test_facets(self):
+        ProposalResult.objects.create(
+            proposal=self.numpy_proposal,
+            status=ProposalResult.RESULT_ACCEPTED,
+        )
+        counts, keyword_counts = get_search_facets(
+            search_proposals(Proposal.objects.all(), "data")
+        )
+        self.assertEqual(counts.count(), 2)
+        self.assertEqual(counts.count(kind=self.numpy_proposal.kind_id), 1)
+        self.assertEqual(
+            counts.count(status=ProposalResult.RESULT_ACCEPTED), 1
+        )
+        self.assertEqual(
+            counts.count(status=ProposalResult.RESULT_UNDECIDED), 1
+        )
+        keyword = self.numpy_proposal.official_keywords.get()
+        self.assertEqual(keyword_counts, {keyword.pk: 1})
+
+
+class InvertedIndexTestCase(SimpleTestCase):
+    def setUp(self):
+        self.index = InvertedIndex()
+        self.index.add(
+            ProposalSearchDocument(
+                proposal_id=1,
+                text="Dataframes with pandas\nPandas pandas",
+                speaker_names="Wes Wrangler",
+            )
+        )
+        self.index.add(
+            ProposalSearchDocument(
+                proposal_id=2,
+                text="Arrays with numpy\nBroadcasting and pandas",
+                speaker_names="Nellie Numerical",
+            )
+        )
+
+    def test_search(self):
+        self.assertEqual(set(self.index.search("with")), {1, 2})
+        self.assertEqual(set(self.index.search("NUMPY arrays")), {2})
+        self.assertEqual(self.index.search("numpy wrangler"), {})
+        self.assertEqual(self.index.search("scipy"), {})
+        self.assertEqual(self.index.search(""), {})
+
+    def test_search_across_fields(self):
+        self.assertEqual(set(self.index.search("pandas wrangler")), {1})
+        self.assertEqual(
+            self.index.search("pandas wrangler", fields=("text",)), {}
+        )
+
+    def test_ranking(self):
+        ranks = self.index.search("pandas")
+        self.assertGreater(ranks[1], ranks[2])
+
+    def test_replace_and_remove(self):
+        self.index.add(
+            ProposalSearchDocument(
+                proposal_id=2, text="Arrays with cupy", speaker_names=""
+            )
+        )
+        self.assertEqual(self.index.search("numpy"), {})
+        self.assertEqual(set(self.index.search("cupy")), {2})
+        self.assertEqual(self.index.search("nellie"), {})
+
+        self.index.remove(1)
+        self.assertEqual(set(self.index.search("with")), {2})
+        self.assertEqual(self.index.search("pandas"), {})
+        self.assertNotIn("pandas", self.index.postings["text"])
+
+
+class LocalSearchBackendTestCase(TestCase):
+    """
+    Test the backend used by databases other than PostgreSQL,
+    whichever database the tests are run with.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.pandas_proposal = ProposalFactory(
+            title="Dataframes with pandas", speaker__name="Wes Wrangler"
+        )
+        self.numpy_proposal = ProposalFactory(title="Arrays with numpy")
+        create_missing_documents()
+        self.backend = LocalSearchBackend()
+
+    def _search(self, query, fields=SEARCH_FIELDS):
+        return list(
+            self.backend.search(Proposal.objects.all(), query, fields)
+        )
+
+    def test_search(self):
+        self.assertEqual(
+            self._search("pandas wrangler"), [self.pandas_proposal]
+        )
+        self.assertEqual(self._search("pandas wrangler", ("text",)), [])
+        self.assertGreater(self._search("numpy")[0].search_rank, 0)
+
+    def test_update_and_remove(self):
+        self._search("numpy")
+        document = ProposalSearchDocument.objects.get(
+            proposal=self.numpy_proposal
+        )
+        document.text = "Arrays with cupy"
+        self.backend.update([document])
+        self.assertEqual(self._search("cupy"), [self.numpy_proposal])
+        self.assertEqual(self._search("numpy"), [])
+
+        self.backend.remove([self.numpy_proposal.pk])
+        self.assertEqual(self._search("cupy"), [])
+
+    def test_other_processes_changes(self):
+        """Verify that indexes are rebuilt when their version changes."""
+        self._search("numpy")
+        ProposalSearchDocument.objects.filter(
+            proposal=self.numpy_proposal
+        ).update(text="Arrays with jax")
+        self.assertEqual(self._search("jax"), [])
+        # Another process would store a new index version.
+        cache.set(SEARCH_INDEX_VERSION_KEY, "other", None)
+        self.assertEqual(self._search("jax"), [self.numpy_proposal])
+
+
+class ProposalSearchViewTestCase(ReviewingMixin, AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.proposal = ProposalFactory(
+            title="Dataframes in Python with pandas",
+            speaker__name="Wes Wrangler",
+        )
+        self.proposal.user_keywords.add("Spreadsheets")
+        self.other_proposal = ProposalFactory(
+            title="Arrays in Python with numpy",
+            speaker__name="Nellie Numerical",
+        )
+
+    def _search(self, **parameters):
+        return self.client.get(reverse("review_search"), parameters)
+
+    def test_no_reviewer_access(self):
+        response = self._search(q="pandas")
+        self.assertEqual(response.status_code, 403)
+
+    def test_search(self):
+        self._add_to_reviewers_group()
+        response = self._search(q="python")
+        self.assertEqual(
+            set(response.context["proposal_list"]),
+            {self.proposal, self.other_proposal},
+        )
+        self.assertContains(response, "<strong>2</strong> proposals")
+        self.assertEqual(len(response.context["kind_facets"]), 2)
+        self.assertEqual(
+            [(name, number) for name, number, url in
+             response.context["keyword_facets"]],
+            [("Spreadsheets", 1)],
+        )
+
+    def test_empty_search(self):
+        self._add_to_reviewers_group()
+        response = self._search()
+        self.assertEqual(list(response.context["proposal_list"]), [])
+        self.assertEqual(response.context["kind_facets"], [])
+
+    def test_facet_filters(self):
+        self._add_to_reviewers_group()
+        keyword = self.proposal.user_keywords.get()
+        for parameters in [
+            {"kind": self.proposal.kind_id},
+            {"keyword": keyword.pk},
+        ]:
+            response = self._search(q="python", **parameters)
+            self.assertEqual(
+                list(response.context["proposal_list"]), [self.proposal]
+            )
+            # Facets count every matching proposal.
+            self.assertEqual(len(response.context["kind_facets"]), 2)
+        response = self._search(
+            q="python", status=ProposalResult.RESULT_UNDECIDED, order="number"
+        )
+        self.assertEqual(
+            list(response.context["proposal_list"]),
+            [self.proposal, self.other_proposal],
+        )
+
+    def test_blind_reviewers(self):
+        self._add_to_reviewers_group()
+        with override_config(BLIND_REVIEWERS=True):
+            response = self._search(q="wrangler")
+            self.assertEqual(list(response.context["proposal_list"]), [])
+        with override_config(BLIND_REVIEWERS=False):
+            response = self._search(q="wrangler")
+            self.assertEqual(
+                list(response.context["proposal_list"]), [self.proposal]
+            )
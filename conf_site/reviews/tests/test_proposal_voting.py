@@ -1,9 +1,18 @@
 import random
+from datetime import timedelta
+from unittest import mock
 
 from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
 
 from conf_site.accounts.tests import AccountsTestCase
-from conf_site.reviews.models import ProposalVote, proposalvote_score_cache_key
+from conf_site.reviews.models import (
+    ProposalVote,
+    proposalvote_score_cache_key,
+    upsert_proposal_vote,
+)
 from conf_site.reviews.signals import refresh_vote_counts
 from conf_site.reviews.tests import ReviewingPostViewTestCase
 from conf_site.reviews.tests.factories import ProposalVoteFactory
@@ -17,6 +26,8 @@ class ProposalVotePostingTestCase(ReviewingPostViewTestCase, AccountsTestCase):
 
     def setUp(self):
         super().setUp()
+        # Cached vote counts outlive the test database's transactions.
+        cache.clear()
 
         self.reverse_view_data = {
             "score": random.choice(NUMERIC_SCORE_LIST),
@@ -50,3 +61,83 @@ class ProposalVotePostingTestCase(ReviewingPostViewTestCase, AccountsTestCase):
         self.assertNotEqual(
             self._get_cached_vote_score(), previous_numeric_score
         )
+
+    def _post_ajax_vote(self, score, comment=""):
+        return self.client.post(
+            reverse(self.reverse_view_name, args=self.reverse_view_args),
+            data={"score": score, "comment": comment},
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        )
+
+    def test_ajax_vote_returns_tallies(self):
+        self._add_to_reviewers_group()
+        ProposalVoteFactory(
+            proposal=self.proposal, score=ProposalVote.PLUS_ONE
+        )
+        response = self._post_ajax_vote(ProposalVote.MINUS_ZERO, "*Hmm*")
+        self.assertEqual(
+            response.json(),
+            {
+                "plus_one": 1,
+                "plus_zero": 0,
+                "minus_zero": 1,
+                "minus_one": 0,
+                "total_votes": 2,
+                "score": ProposalVote.PLUS_ONE + ProposalVote.MINUS_ZERO,
+                "user_score": "−0",
+            },
+        )
+        vote = ProposalVote.objects.get(
+            proposal=self.proposal, voter=self.user
+        )
+        self.assertEqual(vote.comment_html, "<p><em>Hmm</em></p>")
+
+    def test_changing_vote_updates_tallies(self):
+        self._add_to_reviewers_group()
+        self._post_ajax_vote(ProposalVote.PLUS_ONE)
+        response = self._post_ajax_vote(ProposalVote.MINUS_ONE, "Changed")
+        tallies = response.json()
+        self.assertEqual(tallies["plus_one"], 0)
+        self.assertEqual(tallies["minus_one"], 1)
+        self.assertEqual(tallies["total_votes"], 1)
+        # The previous vote is replaced instead of duplicated.
+        vote = ProposalVote.objects.get(
+            proposal=self.proposal, voter=self.user
+        )
+        self.assertEqual(vote.score, ProposalVote.MINUS_ONE)
+        self.assertEqual(vote.comment, "Changed")
+        self.assertEqual(self._get_cached_vote_score(), "−1")
+        # Incrementally updated counts match the database.
+        self.proposal._refresh_vote_counts()
+        self.assertEqual(self.proposal.vote_tallies()["minus_one"], 1)
+        self.assertEqual(self.proposal.vote_tallies()["plus_one"], 0)
+
+    def test_invalid_score(self):
+        self._add_to_reviewers_group()
+        for score in ["", "2", "plus one"]:
+            response = self._post_ajax_vote(score)
+            self.assertEqual(response.status_code, 400)
+        self.assertFalse(ProposalVote.objects.exists())
+
+    def test_upsert_updates_modification_date(self):
+        vote = ProposalVoteFactory(
+            proposal=self.proposal,
+            voter=self.user,
+            score=ProposalVote.PLUS_ONE,
+        )
+        last_week = timezone.now() - timedelta(days=7)
+        ProposalVote.objects.filter(pk=vote.pk).update(
+            date_modified=last_week
+        )
+        # Databases without ON CONFLICT clauses update existing votes.
+        for vendor in [connection.vendor, "oracle"]:
+            with mock.patch.object(connection, "vendor", vendor):
+                upsert_proposal_vote(
+                    self.proposal, self.user, ProposalVote.MINUS_ONE
+                )
+            vote.refresh_from_db()
+            self.assertEqual(vote.score, ProposalVote.MINUS_ONE)
+            self.assertGreater(vote.date_modified, last_week)
+            ProposalVote.objects.filter(pk=vote.pk).update(
+                date_modified=last_week
+            )
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+from django.contrib.auth.models import Group
+
+from conf_site.accounts.tests import AccountsTestCase
+from conf_site.reviews.permissions import (
+    get_reviewers_group_pk,
+    is_reviewer,
+    is_reviewer_or_superuser,
+)
+
+
+class ReviewerPermissionsTestCase(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.reviewers_group = Group.objects.get_or_create(name="Reviewers")[0]
+
+    def test_reviewers_group_is_remembered(self):
+        """Verify that the Reviewers group is only looked up once."""
+        self.assertEqual(get_reviewers_group_pk(), self.reviewers_group.pk)
+        with self.assertNumQueries(0):
+            get_reviewers_group_pk()
+
+    def test_reviewers_group_is_forgotten(self):
+        """Verify that a recreated Reviewers group is found."""
+        get_reviewers_group_pk()
+        self.reviewers_group.delete()
+        new_group = Group.objects.create(name="Reviewers")
+        self.assertEqual(get_reviewers_group_pk(), new_group.pk)
+
+    def test_membership_is_checked_once(self):
+        """Verify that each user object's membership is only checked once."""
+        get_reviewers_group_pk()
+        with self.assertNumQueries(1):
+            self.assertFalse(is_reviewer(self.user))
+            self.assertFalse(is_reviewer(self.user))
+
+    def test_membership_changes(self):
+        """Verify that changing a user's groups updates their status."""
+        self.assertFalse(is_reviewer(self.user))
+        self.user.groups.add(self.reviewers_group)
+        self.assertTrue(is_reviewer(self.user))
+        self.user.groups.clear()
+        self.assertFalse(is_reviewer(self.user))
+
+    def test_missing_reviewers_group(self):
+        """Verify that a missing Reviewers group is a critical problem."""
+        self.reviewers_group.delete()
+        self.assertFalse(is_reviewer(self.user))
+        with self.assertRaises(Exception):
+            is_reviewer_or_superuser(self.user)
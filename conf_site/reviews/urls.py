@@ -19,6 +19,7 @@ from conf_site.reviews.views.results import (
     ProposalResultListView,
     ProposalMultieditPostView,
 )
+from conf_site.reviews.views.search import ProposalSearchView
 
 urlpatterns = [
     path(
@@ -72,5 +73,6 @@ urlpatterns = [
         ReviewerCsvImportView.as_view(),
         name="reviewer_import",
     ),
+    path("search/", ProposalSearchView.as_view(), name="review_search"),
     path("", ProposalListView.as_view(), name="review_proposal_list"),
 ]
@@ -1,60 +1,86 @@
 # -*- coding: utf-8 -*-
 from django.contrib.auth.mixins import UserPassesTestMixin
-from django.contrib.auth.models import Group
-from django.http import Http404, HttpResponseRedirect
+from django.http import (
+    Http404,
+    HttpResponseBadRequest,
+    HttpResponseRedirect,
+    JsonResponse,
+)
 from django.urls import reverse
 from django.views.generic import DetailView, ListView, View
 
 from constance import config
 
 from conf_site.proposals.models import Proposal
+from conf_site.reviews.counts import get_proposal_counts
 from conf_site.reviews.forms import (
     ProposalFeedbackForm,
     ProposalNotificationForm,
     ProposalVoteForm,
 )
-from conf_site.reviews.models import ProposalFeedback, ProposalVote
+from conf_site.reviews.models import (
+    ProposalFeedback,
+    ProposalResult,
+    ProposalVote,
+    proposalvote_scores,
+    upsert_proposal_vote,
+)
+from conf_site.reviews.permissions import is_reviewer_or_superuser
 from symposion.proposals.models import ProposalKind
 from symposion.utils.mail import send_email
 
 
-def _is_reviewer_or_superuser(user):
-    """Check if user is in Reviewers group or is superuser."""
-    if user.is_superuser:
-        return True
-    # Raise an exception if the Reviewers group does not
-    # exist, because this is a critical problem.
-    try:
-        reviewers_group = Group.objects.get(name="Reviewers")
-    except Group.DoesNotExist:
-        raise Exception("Reviewers user group does not exist.")
-    return reviewers_group in user.groups.all()
-
-
 class ReviewingView(UserPassesTestMixin, View):
     allow_speakers = False
     raise_exception = True
 
+    def get_proposal(self):
+        """Return the proposal in the URL, loading it once per request."""
+        if not hasattr(self, "_proposal"):
+            try:
+                self._proposal = Proposal.objects.select_related(
+                    "speaker"
+                ).get(pk=self.kwargs["pk"])
+            except Proposal.DoesNotExist:
+                raise Http404
+        return self._proposal
+
+    def is_proposal_speaker(self):
+        """Check if user is one of the proposal's speakers."""
+        if not hasattr(self, "_is_proposal_speaker"):
+            user = self.request.user
+            self._is_proposal_speaker = user.is_authenticated and any(
+                speaker.user_id == user.pk
+                for speaker in self.get_proposal().speakers()
+            )
+        return self._is_proposal_speaker
+
     def test_func(self):
         """Check if user can access reviewing section."""
         # If allow_speakers is enabled, speakers get access.
         if self.allow_speakers:
-            # Test whether user is one of the proposal's speakers.
             try:
-                proposal = Proposal.objects.get(pk=self.kwargs["pk"])
-                for speaker in proposal.speakers():
-                    if self.request.user == speaker.user:
-                        return True
-            except Proposal.DoesNotExist:
+                if self.is_proposal_speaker():
+                    return True
+            except Http404:
                 pass
 
-        return _is_reviewer_or_superuser(self.request.user)
+        return is_reviewer_or_superuser(self.request.user)
 
 
 class ProposalListView(ListView, ReviewingView):
     template_name = "reviews/proposal_list.html"
 
-    def get_queryset(self, **kwargs):
+    # Orderings that reviewers can select with the "order" parameter.
+    orderings = {
+        "number": ["pk"],
+        "score": ["-vote_score", "pk"],
+        "lowest_score": ["vote_score", "pk"],
+        "votes": ["-total_vote_count", "pk"],
+        "fewest_votes": ["total_vote_count", "pk"],
+    }
+
+    def get_proposals(self):
         """Show all proposals, except those that have been cancelled."""
         return (
             Proposal.objects.order_by("pk")
@@ -62,27 +88,66 @@ class ProposalListView(ListView, ReviewingView):
             .select_related("kind", "speaker", "review_result")
         )
 
+    def get_queryset(self, **kwargs):
+        """
+        Annotate proposals with their vote tallies.
+
+        Proposals can be filtered by their scores with the "min_score"
+        and "max_score" parameters and sorted with the "order" parameter.
+        """
+        queryset = self.get_proposals().with_vote_tallies()
+        for parameter, lookup in [
+            ("min_score", "vote_score__gte"),
+            ("max_score", "vote_score__lte"),
+        ]:
+            try:
+                queryset = queryset.filter(
+                    **{lookup: int(self.request.GET[parameter])}
+                )
+            except (KeyError, ValueError):
+                pass
+        ordering = self.orderings.get(self.request.GET.get("order"))
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        return queryset
+
     def get_paginate_by(self, queryset):
         return config.PROPOSALS_PER_PAGE
 
+    def get_count_filters(self):
+        """Return the kind and/or status of the listed proposals."""
+        return {}
+
     def get_context_data(self, **kwargs):
-        # Add number of talks and tutorials to context data.
         context = super(ProposalListView, self).get_context_data(**kwargs)
-        context["num_proposals"] = self.get_queryset().count()
-        context["num_talks"] = (
-            self.get_queryset().filter(kind__slug="talk").count()
-        )
-        context["num_tutorials"] = (
-            self.get_queryset().filter(kind__slug="tutorial").count()
-        )
         if self.request.user.is_superuser:
             context["notification_form"] = ProposalNotificationForm()
         context["proposal_category"] = "All"
         context["proposal_kind"] = "Proposal"
         context["kind_list"] = ProposalKind.objects.order_by("name")
+        # Add numbers of listed proposals of each kind to context data.
+        counts = get_proposal_counts()
+        count_filters = self.get_count_filters()
+        context["num_proposals"] = counts.count(**count_filters)
+        context["kind_counts"] = [
+            (kind, counts.count(**dict(count_filters, kind=kind.pk)))
+            for kind in context["kind_list"]
+        ]
+        context["status_counts"] = {
+            status: counts.count(status=status)
+            for status, label in ProposalResult.RESULT_STATUSES
+        }
+        # Load the current user's scores for this page in one query.
+        context["user_scores"] = proposalvote_scores(
+            context["object_list"], self.request.user
+        )
 
         # Add ARIA label for pagination.
         context["pagination_aria_label"] = "Proposal lists pages"
+        # Keep sorting and filtering when changing pages.
+        query = self.request.GET.copy()
+        query.pop("page", None)
+        context["pagination_query"] = query.urlencode()
 
         return context
 
@@ -95,14 +160,17 @@ class ProposalKindListView(ProposalListView):
             raise Http404
         return super().get(request, *args, **kwargs)
 
-    def get_queryset(self, **kwargs):
+    def get_proposals(self):
         return (
             Proposal.objects.order_by("pk")
             .exclude(cancelled=True)
             .filter(kind=self.proposal_kind)
-            .select_related("speaker", "review_result")
+            .select_related("kind", "speaker", "review_result")
         )
 
+    def get_count_filters(self):
+        return {"kind": self.proposal_kind.pk}
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["proposal_kind"] = self.proposal_kind.name
@@ -115,17 +183,19 @@ class ProposalDetailView(DetailView, ReviewingView):
     model = Proposal
     template_name = "reviews/proposal_detail.html"
 
+    def get_object(self, queryset=None):
+        return self.get_proposal()
+
     def get_context_data(self, **kwargs):
         """Add context as to whether this is a reviewer or speaker."""
         context = super(ProposalDetailView, self).get_context_data(**kwargs)
-        if _is_reviewer_or_superuser(self.request.user):
+        if is_reviewer_or_superuser(self.request.user):
             context["actor"] = "reviewer"
-        for speaker in self.get_object().speakers():
-            if self.request.user == speaker.user:
-                context["actor"] = "speaker"
+        if self.is_proposal_speaker():
+            context["actor"] = "speaker"
         try:
             vote = ProposalVote.objects.get(
-                proposal=self.get_object(), voter=self.request.user
+                proposal=self.object, voter=self.request.user
             )
             context["vote_form"] = ProposalVoteForm(instance=vote)
             context["existing_vote"] = True
@@ -139,17 +209,32 @@ class ProposalVotePostView(ReviewingView):
     http_method_names = ["post"]
 
     def post(self, *args, **kwargs):
-        """AJAX update an individual ProposalVote object."""
-        proposal = Proposal.objects.get(pk=kwargs["pk"])
-        vote = ProposalVote.objects.get_or_create(
-            proposal=proposal,
-            voter=self.request.user,
-            defaults={"score": self.request.POST["score"]},
-        )[0]
-        vote.score = int(self.request.POST["score"])
-        vote.comment = self.request.POST["comment"]
-        vote.save()
+        """
+        Record the user's vote on a proposal.
+
+        AJAX requests receive the proposal's new vote tallies and
+        the user's score as JSON instead of being redirected.
+        """
+        proposal = self.get_proposal()
+        try:
+            score = int(self.request.POST["score"])
+        except (KeyError, ValueError):
+            score = None
+        if score not in dict(ProposalVote.SCORES):
+            return HttpResponseBadRequest("Invalid score.")
+        upsert_proposal_vote(
+            proposal,
+            self.request.user,
+            score,
+            self.request.POST.get("comment", ""),
+        )
 
+        if self.request.is_ajax():
+            tallies = proposal.vote_tallies()
+            tallies["user_score"] = ProposalVote(
+                score=score
+            ).get_numeric_score_display()
+            return JsonResponse(tallies)
         return HttpResponseRedirect(
             reverse("review_proposal_detail", args=[proposal.id])
         )
@@ -161,7 +246,7 @@ class ProposalFeedbackPostView(ReviewingView):
 
     def post(self, *args, **kwargs):
         """AJAX update an individual ProposalVote object."""
-        proposal = Proposal.objects.get(pk=kwargs["pk"])
+        proposal = self.get_proposal()
         feedback = ProposalFeedback.objects.create(
             proposal=proposal,
             author=self.request.user,
@@ -7,15 +7,11 @@ class ExportReviewersView(CsvView):
     csv_filename = "reviewers.csv"
     header_row = ["ID", "Name", "Email"]
 
-    def get(self, *args, **kwargs):
+    def get_rows(self):
+        # Look up the group before streaming begins, so that
+        # a missing group is reported as an error response.
         reviewers_group = Group.objects.get(name="Reviewers")
-        for reviewer in reviewers_group.user_set.all():
-            self.csv_writer.writerow(
-                [
-                    reviewer.id,
-                    reviewer.get_full_name(),
-                    reviewer.email,
-                ]
-            )
-
-        return super().get(*args, **kwargs)
+        return (
+            [reviewer.id, reviewer.get_full_name(), reviewer.email]
+            for reviewer in reviewers_group.user_set.iterator()
+        )
@@ -1,12 +1,12 @@
-from itertools import chain
-
 from django.shortcuts import get_object_or_404
 from django.views.generic import ListView
 
-from conf_site.proposals.models import Proposal, ProposalKeyword
+from conf_site.proposals.models import ProposalKeyword
+from conf_site.reviews.counts import get_keyword_counts
+from conf_site.reviews.views import ProposalListView, ReviewingView
 
 
-class ReviewKeywordListView(ListView):
+class ReviewKeywordListView(ListView, ReviewingView):
     """A view to display keywords associated with proposals for reviewers."""
     context_object_name = "keywords"
     template_name = "reviews/proposalkeyword_list.html"
@@ -14,10 +14,17 @@ class ReviewKeywordListView(ListView):
     def get_queryset(self, **kwargs):
         return ProposalKeyword.objects.all().order_by("name")
 
+    def get_context_data(self, **kwargs):
+        """Add the number of proposals with each keyword."""
+        context = super().get_context_data(**kwargs)
+        keyword_counts = get_keyword_counts()
+        for keyword in context["keywords"]:
+            keyword.num_proposals = keyword_counts.get(keyword.pk, 0)
+        return context
 
-class ReviewKeywordDetailView(ListView):
+
+class ReviewKeywordDetailView(ProposalListView):
     """A view that displays proposals associated with a specific keyword."""
-    context_object_name = "proposal_list"
     template_name = "reviews/keyword_detail.html"
 
     def get(self, request, *args, **kwargs):
@@ -27,23 +34,18 @@ class ReviewKeywordDetailView(ListView):
         return super(ReviewKeywordDetailView, self).get(
             request, *args, **kwargs)
 
-    def get_queryset(self, **kwargs):
-        # Merge querysets for editor keywords, official keywords,
-        # and user tagged keywords into one big list, sorted by
-        # proposal ID.
-        editor_proposals = Proposal.objects.filter(
-            editor_keywords__id__in=[self.keyword.id])
-        official_proposals = Proposal.objects.filter(
-            official_keywords__id__in=[self.keyword.id])
-        user_proposals = Proposal.objects.filter(
-            user_keywords__id__in=[self.keyword.id])
-        return sorted(
-            chain(editor_proposals, official_proposals, user_proposals),
-            key=lambda instance: instance.id)
+    def get_proposals(self):
+        return super().get_proposals().with_keyword(self.keyword)
 
     def get_context_data(self, **kwargs):
         """Add keyword to template context."""
         context = super(
             ReviewKeywordDetailView, self).get_context_data(**kwargs)
         context["keyword"] = self.keyword
+        # Proposals are not counted by kind for each keyword.
+        paginator = context["paginator"]
+        context["num_proposals"] = (
+            paginator.count if paginator else len(context["object_list"])
+        )
+        context["kind_counts"] = None
         return context
@@ -9,8 +9,12 @@ from django.urls import reverse
 from conf_site.core.views import SuperuserOnlyView
 from conf_site.proposals.models import Proposal
 from conf_site.reviews.models import ProposalNotification, ProposalResult
+from conf_site.reviews.operations import (
+    create_missing_results,
+    create_presentations,
+    set_proposal_results,
+)
 from conf_site.reviews.views import ProposalListView
-from symposion.schedule.models import Presentation
 
 
 class ProposalChangeResultPostView(SuperuserOnlyView):
@@ -35,25 +39,22 @@ class ProposalResultListView(SuperuserOnlyView, ProposalListView):
         self.status = kwargs["status"]
         if self.status == ProposalResult.RESULT_UNDECIDED:
             # Create ProposalResults for proposals that do not have them.
-            proposals_without_result = Proposal.objects.filter(
-                review_result=None
-            )
-            for proposal in proposals_without_result:
-                ProposalResult.objects.create(
-                    proposal=proposal, status=ProposalResult.RESULT_UNDECIDED
-                )
+            create_missing_results()
         return super(ProposalResultListView, self).get(
             request, *args, **kwargs
         )
 
-    def get_queryset(self):
+    def get_proposals(self):
         return (
             Proposal.objects.order_by("pk")
             .exclude(cancelled=True)
             .filter(review_result__status=self.status)
-            .select_related("speaker", "review_result")
+            .select_related("kind", "speaker", "review_result")
         )
 
+    def get_count_filters(self):
+        return {"status": self.status}
+
     def get_context_data(self, **kwargs):
         context = super(ProposalResultListView, self).get_context_data(
             **kwargs
@@ -73,17 +74,7 @@ class ProposalMultieditPostView(SuperuserOnlyView):
         proposals = Proposal.objects.filter(pk__in=proposal_pks)
         new_status = self.request.POST.get("mark_status")
         if new_status:
-            # <queryset>.update() will not work here because
-            # the status field lives in the related model
-            # ProposalResult.
-            for proposal in proposals:
-                try:
-                    proposal.review_result.status = new_status
-                    proposal.review_result.save()
-                except ProposalResult.DoesNotExist:
-                    proposal.review_result = ProposalResult.objects.create(
-                        proposal=proposal, status=new_status
-                    )
+            set_proposal_results(proposal_pks, new_status)
             return HttpResponseRedirect(
                 reverse("review_proposal_result_list", args=[new_status])
             )
@@ -97,6 +88,10 @@ class ProposalMultieditPostView(SuperuserOnlyView):
             )
             notification.proposals.set(proposals)
             unemailed_speakers = notification.send_email()
+            messages.success(
+                self.request,
+                "Notifications have been queued and will be sent shortly.",
+            )
             for speaker in unemailed_speakers:
                 messages.warning(
                     self.request,
@@ -105,26 +100,7 @@ class ProposalMultieditPostView(SuperuserOnlyView):
                 )
             return HttpResponseRedirect(reverse("review_proposal_list"))
         elif self.request.POST.get("create_presentations"):
-            num_presentations_created = 0
-            for proposal in proposals:
-                # We don't need to add all of the proposal's metadata
-                # to the presentation. Most fields will automatically be
-                # added when we save the proposal.
-                # See https://github.com/pydata/conf_site/pull/176.
-                # Note that the title needs to be added here so that
-                # a presentation's slugs are created properly.
-                presentation, created = Presentation.objects.get_or_create(
-                    proposal_base=proposal.proposalbase_ptr,
-                    section=proposal.section,
-                    speaker=proposal.speaker,
-                    title=proposal.title,
-                )
-                # If the presentation already existed, we do not need
-                # to attach it to the proposal.
-                if created:
-                    proposal.presentation = presentation
-                    proposal.save()
-                    num_presentations_created += 1
+            num_presentations_created = create_presentations(proposals)
             # Create a message if any new presentations were created.
             if num_presentations_created:
                 messages.success(
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# Views relating to searching proposals.
+from django.db.models import Q
+
+from constance import config
+
+from conf_site.proposals.models import ProposalKeyword
+from conf_site.reviews.models import ProposalResult
+from conf_site.reviews.search import get_search_facets, search_proposals
+from conf_site.reviews.views import ProposalListView
+
+
+class ProposalSearchView(ProposalListView):
+    """
+    A view to search proposals' text, keywords and speakers' names.
+
+    Results are sorted by relevance unless another "order" is selected,
+    and can be narrowed with the "kind", "status" and "keyword"
+    parameters. Facets count the matching proposals of each kind,
+    result status and keyword.
+    """
+
+    template_name = "reviews/proposal_search.html"
+
+    def get_search_query(self):
+        return self.request.GET.get("q", "").strip()
+
+    def get_proposals(self):
+        proposals = super().get_proposals()
+        query = self.get_search_query()
+        if not query:
+            self.matching_proposals = proposals.none()
+            return self.matching_proposals
+        # Speakers cannot be searched for when reviewing is blind.
+        self.matching_proposals = search_proposals(
+            proposals,
+            query,
+            include_speakers=(
+                not config.BLIND_REVIEWERS or self.request.user.is_superuser
+            ),
+        )
+        return self.filter_by_facets(self.matching_proposals)
+
+    def filter_by_facets(self, proposals):
+        """Narrow search results to the selected kind, status and keyword."""
+        filters = self.get_facet_filters()
+        if "kind" in filters:
+            proposals = proposals.filter(kind=filters["kind"])
+        if "status" in filters:
+            status_filter = Q(review_result__status=filters["status"])
+            if filters["status"] == ProposalResult.RESULT_UNDECIDED:
+                status_filter |= Q(review_result=None)
+            proposals = proposals.filter(status_filter)
+        if "keyword" in filters:
+            proposals = proposals.with_keyword(filters["keyword"])
+        return proposals
+
+    def get_facet_filters(self):
+        """Return the valid facets selected by this request."""
+        filters = {}
+        for parameter in ["kind", "keyword"]:
+            try:
+                filters[parameter] = int(self.request.GET[parameter])
+            except (KeyError, ValueError):
+                pass
+        status = self.request.GET.get("status")
+        if status in dict(ProposalResult.RESULT_STATUSES):
+            filters["status"] = status
+        return filters
+
+    def get_queryset(self, **kwargs):
+        queryset = super().get_queryset(**kwargs)
+        if self.get_search_query() and (
+            self.request.GET.get("order") not in self.orderings
+        ):
+            queryset = queryset.order_by("-search_rank", "pk")
+        return queryset
+
+    def get_facet_url(self, parameter, value):
+        """Return the query string of these results narrowed by a facet."""
+        query = self.request.GET.copy()
+        query.pop("page", None)
+        query[parameter] = value
+        return "?{}".format(query.urlencode())
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["proposal_category"] = "Matching"
+        context["search_query"] = self.get_search_query()
+        paginator = context["paginator"]
+        context["num_proposals"] = (
+            paginator.count if paginator else len(context["object_list"])
+        )
+        context["kind_counts"] = None
+
+        counts, keyword_counts = get_search_facets(self.matching_proposals)
+        context["kind_facets"] = []
+        for kind in context["kind_list"]:
+            number = counts.count(kind=kind.pk)
+            if number:
+                context["kind_facets"].append(
+                    (kind.name, number, self.get_facet_url("kind", kind.pk))
+                )
+        context["status_facets"] = []
+        for status, label in ProposalResult.RESULT_STATUSES:
+            number = counts.count(status=status)
+            if number:
+                context["status_facets"].append(
+                    (label, number, self.get_facet_url("status", status))
+                )
+        keywords = ProposalKeyword.objects.filter(
+            pk__in=keyword_counts
+        ).order_by("name")
+        context["keyword_facets"] = sorted(
+            [
+                (
+                    keyword.name,
+                    keyword_counts[keyword.pk],
+                    self.get_facet_url("keyword", keyword.pk),
+                )
+                for keyword in keywords
+            ],
+            key=lambda facet: -facet[1],
+        )
+
+        # Keep the search query and facets when changing the order.
+        query = self.request.GET.copy()
+        query.pop("page", None)
+        query.pop("order", None)
+        context["order_query"] = query.urlencode()
+        return context
@@ -3,6 +3,7 @@ from django.urls import reverse
 from conf_site.core.tests.test_csv_view import StaffOnlyCsvViewTestCase
 from conf_site.schedule.tests.factories import PresentationFactory
 from conf_site.schedule.views import ExportPresentationSpeakerView
+from conf_site.speakers.tests.factories import SpeakerFactory
 
 
 class ExportPresentationSpeakerViewTestCase(StaffOnlyCsvViewTestCase):
@@ -16,3 +17,20 @@ class ExportPresentationSpeakerViewTestCase(StaffOnlyCsvViewTestCase):
         cancelled_presentation = PresentationFactory(cancelled=True)
         response = self.client.get(reverse(self.view_name))
         self.assertNotContains(response, cancelled_presentation.title)
+
+    def test_presentations_of_all_speakers_are_included(self):
+        presentations = PresentationFactory.create_batch(size=3)
+        additional_speaker = SpeakerFactory()
+        presentations[0].additional_speakers.add(additional_speaker)
+        with self.assertNumQueries(4):
+            rows = list(self.view_class().get_rows())
+        self.assertEqual(len(rows), 4)
+        self.assertIn(
+            [
+                additional_speaker.name,
+                additional_speaker.email,
+                presentations[0].title,
+                presentations[0].proposal_base.kind.name,
+            ],
+            rows,
+        )
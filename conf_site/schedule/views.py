@@ -1,7 +1,10 @@
 from django.http import Http404
+from django.template.loader import render_to_string
 
 from symposion.schedule.models import Presentation
+from symposion.schedule.pagecache import get_cached_fragment
 from symposion.speakers.models import Speaker
+from symposion.utils.db import iterate_in_chunks
 
 from conf_site.core.views import CsvView, SlugDetailView, SlugRedirectView
 
@@ -36,6 +39,15 @@ class PresentationDetailView(SlugDetailView):
             if not schedule.published and not self.request.user.is_staff:
                 raise Http404()
 
+        context["presentation_html"] = get_cached_fragment(
+            self.request,
+            ["presentation", presentation.pk],
+            lambda: render_to_string(
+                "symposion/schedule/_presentation_detail.html",
+                {"presentation": presentation},
+                request=self.request,
+            ),
+        )
         return super().render_to_response(context, **response_kwargs)
 
 
@@ -48,28 +60,26 @@ class ExportPresentationSpeakerView(CsvView):
     """Export information about speakers and presentations."""
 
     csv_filename = "speakers-with-presentation-emails.csv"
-
-    def get(self, *args, **kwargs):
-        self.csv_writer.writerow(
-            [
-                "Speaker Name",
-                "Speaker Email",
-                "Presentation Name",
-                "Presentation Type",
-            ]
-        )
-
+    header_row = [
+        "Speaker Name",
+        "Speaker Email",
+        "Presentation Name",
+        "Presentation Type",
+    ]
+
+    def get_rows(self):
         # Iterate through speakers and presentations.
-        for speaker in Speaker.objects.all():
-            for presentation in speaker.all_presentations:
-                if not presentation.cancelled:
-                    self.csv_writer.writerow(
-                        [
-                            speaker.name,
-                            speaker.email,
-                            presentation.title,
-                            presentation.proposal.kind.name,
-                        ]
-                    )
-
-        return super(ExportPresentationSpeakerView, self).get(*args, **kwargs)
+        speakers = (
+            Speaker.objects.with_presentations()
+            .prefetch_presentations()
+            .select_related("user")
+            .order_by("name")
+        )
+        for speaker in iterate_in_chunks(speakers):
+            for presentation in speaker.not_cancelled_presentations:
+                yield [
+                    speaker.name,
+                    speaker.email,
+                    presentation.title,
+                    presentation.proposal_base.kind.name,
+                ]
@@ -8,6 +8,13 @@ PROJECT_ROOT = os.path.abspath(os.path.join(BASE_DIR, os.pardir))
 
 DEBUG = True
 EMAIL_DEBUG = DEBUG
+# Transactional email is queued and sent by the send_queued_email
+# management command. Failed messages are retried after
+# EMAIL_OUTBOX_RETRY_DELAY seconds, doubling after each attempt.
+EMAIL_OUTBOX_ENABLED = True
+EMAIL_OUTBOX_BATCH_SIZE = 100
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+EMAIL_OUTBOX_RETRY_DELAY = 60
 
 DATABASES = {
     "default": {
@@ -151,6 +158,7 @@ INSTALLED_APPS = [
     "reversion",
     "symposion",
     "symposion.conference",
+    "symposion.outbox",
     "symposion.proposals",
     "symposion.schedule",
     "symposion.speakers",
@@ -294,6 +302,8 @@ PROPOSAL_FORMS = {
     "talk": "conf_site.proposals.forms.ProposalForm",
     "tutorial": "conf_site.proposals.forms.ProposalForm",
 }
+# Directory where precomputed copies of the conference.json feed are kept.
+SCHEDULE_JSON_ROOT = os.path.join(PROJECT_ROOT, "cache")
 SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
 STATICFILES_STORAGE = (
     "django.contrib.staticfiles.storage.ManifestStaticFilesStorage")
@@ -13,6 +13,7 @@ DATABASES = {
 }
 
 GOOGLE_ANALYTICS_PROPERTY_ID = "UA-000000-0"
+SCHEDULE_JSON_ROOT = None
 SECRET_KEY = "foobar"
 SENTRY_PUBLIC_DSN = False
 SETTINGS_EXPORT = [
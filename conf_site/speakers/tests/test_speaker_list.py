@@ -1,4 +1,6 @@
 from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -181,3 +183,24 @@ class SpeakerListViewTestCase(AccountsTestCase):
         response = self.client.get(reverse("speaker_list"))
         self.assertNotContains(response, presentation.title)
         self.assertNotContains(response, presentation.speaker.name)
+
+    def test_query_count_does_not_depend_on_speakers(self):
+        """Verify that presentations are not loaded for each speaker."""
+        for presentation in PresentationFactory.create_batch(size=2):
+            presentation.additional_speakers.add(SpeakerFactory())
+        # Warm up per-process caches, such as the current site.
+        self.client.get(reverse("speaker_list"))
+        with CaptureQueriesContext(connection) as few_speakers_queries:
+            self.client.get(reverse("speaker_list"))
+
+        for presentation in PresentationFactory.create_batch(size=4):
+            presentation.additional_speakers.add(SpeakerFactory())
+        # Creating schedules clears the cached published sections.
+        self.client.get(reverse("speaker_list"))
+        with CaptureQueriesContext(connection) as many_speakers_queries:
+            self.client.get(reverse("speaker_list"))
+
+        self.assertEqual(
+            len(many_speakers_queries.captured_queries),
+            len(few_speakers_queries.captured_queries),
+        )
@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -165,3 +167,30 @@ class SpeakerProfileTestCase(TestCase):
             )
         )
         self.assertRedirects(response, self.speaker_profile_url, 301)
+
+    def test_query_count_does_not_depend_on_presentations(self):
+        """Verify that visibility is not checked for each presentation."""
+        # Warm up per-process caches, such as the current site.
+        self.client.get(self.speaker_profile_url)
+        with CaptureQueriesContext(connection) as two_presentation_queries:
+            self.client.get(self.speaker_profile_url)
+
+        self.second_presentation.pk = None
+        self.second_presentation.slot = None
+        self.second_presentation.slug = ""
+        self.second_presentation.proposal_base = ProposalBase.objects.create(
+            title="Third presentation",
+            description="Description",
+            abstract="Abstract",
+            kind=self.first_presentation.proposal_base.kind,
+            speaker=self.speaker,
+        )
+        self.second_presentation.save()
+        with CaptureQueriesContext(connection) as three_presentation_queries:
+            response = self.client.get(self.speaker_profile_url)
+
+        self.assertEqual(len(response.context["presentations"]), 3)
+        self.assertEqual(
+            len(three_presentation_queries.captured_queries),
+            len(two_presentation_queries.captured_queries),
+        )
@@ -1,9 +1,11 @@
 from django.contrib.auth.mixins import UserPassesTestMixin
-from django.db.models import Q
 from django.http import Http404
 from django.views.generic import ListView
 
-from symposion.schedule.models import Schedule
+from symposion.schedule.visibility import (
+    any_presentation_published,
+    any_schedule_published,
+)
 from symposion.speakers.models import Speaker
 
 from conf_site.core.views import CsvView, SlugDetailView, SlugRedirectView
@@ -17,17 +19,18 @@ class SpeakerDetailView(SlugDetailView):
 
     def _get_presentations(self):
         """Utility method to retrive a speaker's presentations."""
-        speaker = self.get_object()
-        return speaker.not_cancelled_presentations
+        # A speaker's "copresentations" are included.
+        if not hasattr(self, "_presentations"):
+            self._presentations = list(
+                self.get_object().get_presentations().exclude(cancelled=True)
+            )
+        return self._presentations
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
         # Add speaker's presentations to context.
-        # This is necessary because we need
-        # a speaker's "copresentations" as well.
-        presentations = self._get_presentations()
-        context["presentations"] = presentations
+        context["presentations"] = self._get_presentations()
 
         return context
 
@@ -38,14 +41,7 @@ class SpeakerDetailView(SlugDetailView):
             raise Http404()
 
         # Make sure that at least one presentation is on a published schedule.
-        for presentation in presentations:
-            try:
-                schedule = Schedule.objects.get(section=presentation.section)
-            except Schedule.DoesNotExist:
-                continue
-            if schedule.published:
-                break
-        else:
+        if not any_presentation_published(presentations):
             raise Http404()
 
         return super().render_to_response(context, **response_kwargs)
@@ -61,11 +57,9 @@ class SpeakerListView(UserPassesTestMixin, ListView):
 
     context_object_name = "speakers"
     queryset = (
-        Speaker.objects.filter(
-            Q(presentations__gt=0) | Q(copresentations__gt=0)
-        )
+        Speaker.objects.with_presentations()
+        .prefetch_presentations()
         .order_by("name")
-        .distinct()
     )
     template_name = "speakers/speaker_list.html"
 
@@ -75,11 +69,7 @@ class SpeakerListView(UserPassesTestMixin, ListView):
         if self.request.user.is_superuser or self.request.user.is_staff:
             return True
         # Check to see if there is a published schedule.
-        for schedule in Schedule.objects.all():
-            if schedule.published:
-                return True
-
-        return False
+        return any_schedule_published()
 
 
 class ExportAcceptedSpeakerEmailView(CsvView):
@@ -88,11 +78,12 @@ class ExportAcceptedSpeakerEmailView(CsvView):
     csv_filename = "accepted-speaker-emails.csv"
     header_row = ["Name", "Email Address"]
 
-    def get(self, *args, **kwargs):
-        # Iterate through speakers.
-        # Add speakers with accepted presentations to temp file.
-        for speaker in Speaker.objects.all():
-            if speaker.all_presentations:
-                self.csv_writer.writerow([speaker.name, speaker.email])
-
-        return super(ExportAcceptedSpeakerEmailView, self).get(*args, **kwargs)
+    def get_rows(self):
+        # Add speakers with presentations to CSV file.
+        speakers = (
+            Speaker.objects.with_presentations()
+            .select_related("user")
+            .order_by("name")
+        )
+        for speaker in speakers.iterator():
+            yield [speaker.name, speaker.email]
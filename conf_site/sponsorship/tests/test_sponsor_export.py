@@ -12,7 +12,7 @@ class ExportSponsorsViewTestCase(StaffOnlyCsvViewTestCase):
     def test_not_including_inactive_sponsor(self):
         """Verify that inactive sponsors are not included."""
         inactive_sponsor = SponsorFactory(active=False)
-        response = self.view_class().get()
+        response = self._get_csv_response()
         self.assertNotContains(response, inactive_sponsor.name)
 
     def test_including_active_sponsors(self):
@@ -20,7 +20,7 @@ class ExportSponsorsViewTestCase(StaffOnlyCsvViewTestCase):
         sponsors = []
         for _ in range(random.randint(0, 5)):
             sponsors.append(SponsorFactory(active=True))
-        response = self.view_class().get()
+        response = self._get_csv_response()
         for sponsor in sponsors:
             self.assertContains(response, sponsor.name)
             self.assertContains(response, sponsor.external_url)
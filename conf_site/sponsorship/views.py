@@ -9,17 +9,16 @@ class ExportSponsorsView(CsvView):
     csv_filename = "sponsors.csv"
     header_row = ["Name", "URL", "Contact Name", "Contact Email", "Level"]
 
-    def get(self, *args, **kwargs):
+    def get_rows(self):
         # Add all **active** sponsors to CSV file.
-        for sponsor in Sponsor.objects.filter(active=True):
-            self.csv_writer.writerow(
-                [
-                    sponsor.name,
-                    sponsor.external_url,
-                    sponsor.contact_name,
-                    sponsor.contact_email,
-                    sponsor.level,
-                ]
-            )
-
-        return super(ExportSponsorsView, self).get(*args, **kwargs)
+        sponsors = Sponsor.objects.filter(active=True).select_related(
+            "level__conference"
+        )
+        for sponsor in sponsors.iterator():
+            yield [
+                sponsor.name,
+                sponsor.external_url,
+                sponsor.contact_name,
+                sponsor.contact_email,
+                sponsor.level,
+            ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.0.10 on 2026-10-18 02:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('symposion_conference', '0002_remove_conference_timezone'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conference',
+            name='date_last_modified',
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True, verbose_name='Last modified'),
+        ),
+        migrations.AddField(
+            model_name='section',
+            name='date_last_modified',
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True, verbose_name='Last modified'),
+        ),
+    ]
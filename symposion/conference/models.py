@@ -16,6 +16,9 @@ class Conference(models.Model):
     # when the conference runs
     start_date = models.DateField(_("Start date"), null=True, blank=True)
     end_date = models.DateField(_("End date"), null=True, blank=True)
+    date_last_modified = models.DateTimeField(
+        _("Last modified"), auto_now=True, db_index=True, null=True
+    )
 
     def __str__(self):
         return self.title
@@ -55,6 +58,9 @@ class Section(models.Model):
     # when the section runs
     start_date = models.DateField(_("Start date"), null=True, blank=True)
     end_date = models.DateField(_("End date"), null=True, blank=True)
+    date_last_modified = models.DateTimeField(
+        _("Last modified"), auto_now=True, db_index=True, null=True
+    )
 
     def __str__(self):
         return "%s %s" % (self.conference, self.name)
@@ -1,17 +1,136 @@
+"""
+Render Markdown to HTML.
+
+Rendered HTML is cached by a hash of its source text, first in a small
+in-process LRU cache and then in the shared Django cache, so text that
+has already been rendered (by any process) is not parsed again. Each
+thread keeps its own Markdown instance for every set of extensions
+and resets it between documents instead of building a new one.
+"""
 from __future__ import unicode_literals
+import hashlib
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
 
 import markdown
 
 
-def parse(text):
+DEFAULT_EXTENSIONS = ("extra",)
+
+# Number of rendered documents kept in each process.
+LOCAL_CACHE_SIZE = 512
+
+
+class _LRUCache(object):
+    """A thread-safe dictionary that forgets its least recently used keys."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return None
+            return self._data[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_local_cache = _LRUCache(LOCAL_CACHE_SIZE)
+_thread_data = threading.local()
+
+
+def _get_renderer(extensions):
+    renderers = getattr(_thread_data, "renderers", None)
+    if renderers is None:
+        renderers = _thread_data.renderers = {}
+    renderer = renderers.get(extensions)
+    if renderer is None:
+        renderer = renderers[extensions] = markdown.Markdown(
+            extensions=list(extensions)
+        )
+    return renderer
+
+
+def render(text, extensions=DEFAULT_EXTENSIONS):
+    """Render text without using the cache."""
+    renderer = _get_renderer(tuple(extensions))
+    try:
+        return renderer.convert(text)
+    finally:
+        renderer.reset()
+
+
+def render_many(texts, extensions=DEFAULT_EXTENSIONS):
+    """
+    Render several texts without using the cache.
+
+    This can be run in worker processes, since it does not use
+    the database or the cache.
+    """
+    return [render(text, extensions) for text in texts]
+
+
+def markdown_cache_key(text, extensions=DEFAULT_EXTENSIONS):
+    """Return the cache key of text's rendered HTML."""
+    # Rendering with different extensions or another version
+    # of the Markdown library may produce different HTML.
+    text_hash = hashlib.sha256(
+        "\0".join(
+            [markdown.__version__, ",".join(extensions), text]
+        ).encode("utf-8")
+    ).hexdigest()
+    return "markdown_{}".format(text_hash)
+
+
+def parse_many(texts, extensions=DEFAULT_EXTENSIONS):
+    """
+    Render several texts, returning a list of HTML in the same order.
+
+    Shared cache lookups and updates are made in bulk.
+    """
+    extensions = tuple(extensions)
+    keys = [markdown_cache_key(text, extensions) for text in texts]
+    results = {}
+    for key in keys:
+        html = _local_cache.get(key)
+        if html is not None:
+            results[key] = html
+
+    missing_keys = [key for key in keys if key not in results]
+    if missing_keys:
+        results.update(cache.get_many(missing_keys))
+
+    rendered = {}
+    for key, text in zip(keys, texts):
+        if key not in results:
+            results[key] = rendered[key] = render(text, extensions)
+    if rendered:
+        cache.set_many(rendered, settings.CACHE_TIMEOUT_LONG)
+
+    for key in set(keys):
+        _local_cache.set(key, results[key])
+    return [results[key] for key in keys]
 
-    # First run through the Markdown parser
-    text = markdown.markdown(text, extensions=["extra"])
 
-    # Sanitize using html5lib
-    # bits = []
-    # parser = html5parser.HTMLParser(tokenizer=sanitizer.HTMLSanitizer)
-    # for token in parser.parseFragment(text).childNodes:
-    #     bits.append(token.toxml())
-    # return "".join(bits)
-    return text
+def parse(text, extensions=DEFAULT_EXTENSIONS):
+    """Render text, using cached HTML when available."""
+    if not text:
+        return ""
+    return parse_many([text], extensions)[0]
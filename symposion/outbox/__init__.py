@@ -0,0 +1 @@
+default_app_config = "symposion.outbox.apps.OutboxConfig"
@@ -0,0 +1,20 @@
+from __future__ import unicode_literals
+from django.contrib import admin
+
+from symposion.outbox.models import QueuedEmail
+
+
+admin.site.register(
+    QueuedEmail,
+    list_display=[
+        "subject",
+        "to",
+        "status",
+        "attempts",
+        "next_attempt",
+        "date_created",
+        "date_sent",
+    ],
+    list_filter=["status"],
+    search_fields=["subject", "to"],
+)
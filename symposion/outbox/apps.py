@@ -0,0 +1,9 @@
+from __future__ import unicode_literals
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class OutboxConfig(AppConfig):
+    name = "symposion.outbox"
+    label = "symposion_outbox"
+    verbose_name = _("Symposion Outbox")
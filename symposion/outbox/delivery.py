@@ -0,0 +1,124 @@
+"""
+Queueing and delivery of transactional email.
+
+Messages are rendered during the request and stored as QueuedEmail
+rows. The send_queued_email management command delivers them in
+batches, reusing one connection per batch and retrying failed
+messages with exponential backoff.
+"""
+from __future__ import unicode_literals
+import datetime
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from symposion.outbox.models import QueuedEmail
+from symposion.utils.db import bulk_create
+
+
+def _setting(name, default):
+    return getattr(settings, "EMAIL_OUTBOX_{}".format(name), default)
+
+
+def enqueue(message):
+    """
+    Queue an email message for delivery.
+
+    The message is sent immediately if the outbox is disabled.
+    Messages without any recipients are ignored.
+    """
+    if not message.recipients():
+        return
+    if not _setting("ENABLED", True):
+        message.send()
+        return
+    QueuedEmail.from_message(message).save()
+
+
+def enqueue_many(messages):
+    """
+    Queue several email messages at once.
+
+    Every message must have at least one recipient. Returns the saved
+    QueuedEmail objects in the same order as the messages. If the
+    outbox is disabled, the messages are sent immediately over one
+    connection and recorded as sent.
+    """
+    queued_emails = [QueuedEmail.from_message(message) for message in messages]
+    if not _setting("ENABLED", True):
+        get_connection().send_messages(messages)
+        now = timezone.now()
+        for queued_email in queued_emails:
+            queued_email.attempts = 1
+            queued_email.date_sent = now
+            queued_email.status = QueuedEmail.STATUS_SENT
+    return bulk_create(QueuedEmail, queued_emails)
+
+
+def retry_delay(attempts):
+    """Return how long to wait after a message has failed this many times."""
+    return datetime.timedelta(
+        seconds=_setting("RETRY_DELAY", 60) * 2 ** (attempts - 1)
+    )
+
+
+def _record_failure(queued_email, error, now):
+    queued_email.attempts += 1
+    queued_email.last_error = "{}: {}".format(type(error).__name__, error)
+    if queued_email.attempts >= _setting("MAX_ATTEMPTS", 5):
+        queued_email.status = QueuedEmail.STATUS_FAILED
+    else:
+        queued_email.next_attempt = now + retry_delay(queued_email.attempts)
+
+
+def send_queued_email(batch_size=None):
+    """
+    Deliver one batch of queued email that is due to be sent.
+
+    Returns a tuple of the number of messages sent and
+    the number of messages that failed.
+    """
+    if batch_size is None:
+        batch_size = _setting("BATCH_SIZE", 100)
+    now = timezone.now()
+    sent = failed = 0
+    with transaction.atomic():
+        # Locked rows are being delivered by another worker.
+        queued_emails = list(
+            QueuedEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=QueuedEmail.STATUS_QUEUED, next_attempt__lte=now)
+            .order_by("next_attempt", "pk")[:batch_size]
+        )
+        if not queued_emails:
+            return sent, failed
+
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception as error:
+            for queued_email in queued_emails:
+                _record_failure(queued_email, error, now)
+            failed = len(queued_emails)
+        else:
+            try:
+                for queued_email in queued_emails:
+                    try:
+                        queued_email.to_message(connection).send()
+                    except Exception as error:
+                        _record_failure(queued_email, error, now)
+                        failed += 1
+                    else:
+                        queued_email.attempts += 1
+                        queued_email.status = QueuedEmail.STATUS_SENT
+                        queued_email.date_sent = timezone.now()
+                        sent += 1
+            finally:
+                connection.close()
+
+        QueuedEmail.objects.bulk_update(
+            queued_emails,
+            ["attempts", "date_sent", "last_error", "next_attempt", "status"],
+        )
+    return sent, failed
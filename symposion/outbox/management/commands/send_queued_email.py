@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+import time
+
+from django.core.management.base import BaseCommand
+
+from symposion.outbox.delivery import send_queued_email
+
+
+class Command(BaseCommand):
+    help = "Sends queued email messages that are due to be delivered."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Number of messages to send over each connection.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running and check for new messages periodically.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=10,
+            help="Seconds to wait between checks when looping.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            total_sent = total_failed = 0
+            while True:
+                sent, failed = send_queued_email(options["batch_size"])
+                if not sent and not failed:
+                    break
+                total_sent += sent
+                total_failed += failed
+            if total_sent or total_failed or not options["loop"]:
+                self.stdout.write(
+                    "Sent {} email messages; {} failed.".format(
+                        total_sent, total_failed
+                    )
+                )
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
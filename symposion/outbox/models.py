@@ -0,0 +1,94 @@
+from __future__ import unicode_literals
+
+from django.core.mail import EmailMultiAlternatives
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+def _join_addresses(addresses):
+    return "\n".join(addresses)
+
+
+def _split_addresses(addresses):
+    return [address for address in addresses.splitlines() if address]
+
+
+class QueuedEmail(models.Model):
+    """A rendered email message waiting to be delivered."""
+
+    STATUS_QUEUED = "queued"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, _("Queued")),
+        (STATUS_SENT, _("Sent")),
+        (STATUS_FAILED, _("Failed")),
+    ]
+
+    subject = models.TextField(verbose_name=_("Subject"))
+    from_email = models.CharField(
+        max_length=254, verbose_name=_("From email")
+    )
+    to = models.TextField(
+        help_text=_("One address per line."), verbose_name=_("To")
+    )
+    cc = models.TextField(
+        blank=True, help_text=_("One address per line."), verbose_name=_("Cc")
+    )
+    body = models.TextField(verbose_name=_("Body"))
+    html_body = models.TextField(blank=True, verbose_name=_("HTML body"))
+    status = models.CharField(
+        choices=STATUS_CHOICES,
+        db_index=True,
+        default=STATUS_QUEUED,
+        max_length=10,
+        verbose_name=_("Status"),
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, verbose_name=_("Attempts")
+    )
+    next_attempt = models.DateTimeField(
+        db_index=True, default=timezone.now, verbose_name=_("Next attempt")
+    )
+    last_error = models.TextField(blank=True, verbose_name=_("Last error"))
+    date_created = models.DateTimeField(auto_now_add=True)
+    date_sent = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ["pk"]
+        verbose_name = _("Queued email")
+        verbose_name_plural = _("Queued emails")
+
+    def __str__(self):
+        return self.subject
+
+    @classmethod
+    def from_message(cls, message):
+        """Create an unsaved QueuedEmail from an EmailMultiAlternatives."""
+        html_body = ""
+        for content, mimetype in getattr(message, "alternatives", []):
+            if mimetype == "text/html":
+                html_body = content
+        return cls(
+            subject=message.subject,
+            from_email=message.from_email,
+            to=_join_addresses(message.to),
+            cc=_join_addresses(message.cc),
+            body=message.body,
+            html_body=html_body,
+        )
+
+    def to_message(self, connection=None):
+        """Return an EmailMultiAlternatives for this queued email."""
+        message = EmailMultiAlternatives(
+            self.subject,
+            self.body,
+            self.from_email,
+            _split_addresses(self.to),
+            cc=_split_addresses(self.cc),
+            connection=connection,
+        )
+        if self.html_body:
+            message.attach_alternative(self.html_body, "text/html")
+        return message
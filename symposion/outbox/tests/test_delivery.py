@@ -0,0 +1,99 @@
+from unittest import mock
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from conf_site.proposals.tests.factories import ProposalFactory
+from symposion.outbox.delivery import send_queued_email
+from symposion.outbox.models import QueuedEmail
+from symposion.utils.mail import send_email
+
+
+class OutboxTestCase(TestCase):
+    def setUp(self):
+        self.proposal = ProposalFactory()
+
+    def _send_feedback_email(self, to):
+        send_email(
+            to,
+            "proposal_new_message",
+            context={
+                "proposal": self.proposal,
+                "message": None,
+                "reviewer": True,
+            },
+        )
+
+    def test_send_email_is_queued(self):
+        """Verify that send_email does not send messages immediately."""
+        self._send_feedback_email(["a@example.com", "b@example.com"])
+        self.assertEqual(len(mail.outbox), 0)
+        queued_email = QueuedEmail.objects.get()
+        self.assertEqual(queued_email.status, QueuedEmail.STATUS_QUEUED)
+        self.assertTrue(queued_email.html_body)
+
+        self.assertEqual(send_queued_email(), (1, 0))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["a@example.com", "b@example.com"])
+        self.assertEqual(mail.outbox[0].alternatives[0][1], "text/html")
+        queued_email.refresh_from_db()
+        self.assertEqual(queued_email.status, QueuedEmail.STATUS_SENT)
+        self.assertIsNotNone(queued_email.date_sent)
+
+        # Sent messages are not sent again.
+        self.assertEqual(send_queued_email(), (0, 0))
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_messages_without_recipients_are_ignored(self):
+        self._send_feedback_email([])
+        self.assertFalse(QueuedEmail.objects.exists())
+
+    @override_settings(EMAIL_OUTBOX_ENABLED=False)
+    def test_outbox_disabled(self):
+        """Verify that messages can still be sent immediately."""
+        self._send_feedback_email(["a@example.com"])
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(QueuedEmail.objects.exists())
+
+    def test_batches_share_a_connection(self):
+        for index in range(5):
+            self._send_feedback_email(["{}@example.com".format(index)])
+        with mock.patch(
+            "symposion.outbox.delivery.get_connection",
+            wraps=mail.get_connection,
+        ) as get_connection:
+            self.assertEqual(send_queued_email(batch_size=3), (3, 0))
+            self.assertEqual(send_queued_email(batch_size=3), (2, 0))
+        self.assertEqual(get_connection.call_count, 2)
+        self.assertEqual(len(mail.outbox), 5)
+
+    @override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=2)
+    def test_failed_messages_are_retried(self):
+        self._send_feedback_email(["a@example.com"])
+        queued_email = QueuedEmail.objects.get()
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=OSError("Connection refused"),
+        ):
+            self.assertEqual(send_queued_email(), (0, 1))
+            queued_email.refresh_from_db()
+            self.assertEqual(queued_email.status, QueuedEmail.STATUS_QUEUED)
+            self.assertEqual(queued_email.attempts, 1)
+            self.assertIn("Connection refused", queued_email.last_error)
+            self.assertGreater(
+                queued_email.next_attempt, queued_email.date_created
+            )
+
+            # The message is not retried until its next attempt is due.
+            self.assertEqual(send_queued_email(), (0, 0))
+
+            QueuedEmail.objects.update(next_attempt=queued_email.date_created)
+            self.assertEqual(send_queued_email(), (0, 1))
+            queued_email.refresh_from_db()
+            self.assertEqual(queued_email.status, QueuedEmail.STATUS_FAILED)
+
+    def test_management_command(self):
+        self._send_feedback_email(["a@example.com"])
+        call_command("send_queued_email", stdout=mock.MagicMock())
+        self.assertEqual(len(mail.outbox), 1)
@@ -176,10 +176,17 @@ class ProposalBase(models.Model):
 
     def speakers(self):
         yield self.speaker
-        accepted_status = AdditionalSpeaker.SPEAKING_STATUS_ACCEPTED
-        speakers = self.additional_speakers.filter(
-            additionalspeaker__status=accepted_status
-        )
+        try:
+            # Use accepted speakers loaded by prefetch_accepted_speakers.
+            speakers = [
+                additional_speaker.speaker
+                for additional_speaker in self.accepted_additional_speakers
+            ]
+        except AttributeError:
+            accepted_status = AdditionalSpeaker.SPEAKING_STATUS_ACCEPTED
+            speakers = self.additional_speakers.filter(
+                additionalspeaker__status=accepted_status
+            )
         for speaker in speakers:
             yield speaker
 
@@ -237,6 +244,24 @@ class AdditionalSpeaker(models.Model):
             return self.speaker.name
 
 
+def prefetch_accepted_speakers(lookup="additionalspeaker_set"):
+    """
+    Return a Prefetch that loads proposals' accepted additional speakers.
+
+    ProposalBase.speakers() uses the prefetched speakers
+    instead of running a query for each proposal.
+    """
+    return models.Prefetch(
+        lookup,
+        queryset=AdditionalSpeaker.objects.filter(
+            status=AdditionalSpeaker.SPEAKING_STATUS_ACCEPTED
+        )
+        .select_related("speaker__user")
+        .order_by("speaker__name"),
+        to_attr="accepted_additional_speakers",
+    )
+
+
 def uuid_filename(instance, filename):
     ext = filename.split(".")[-1]
     filename = "%s.%s" % (uuid.uuid4(), ext)
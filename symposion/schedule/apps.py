@@ -6,3 +6,6 @@ class ScheduleConfig(AppConfig):
     name = "symposion.schedule"
     label = "symposion_schedule"
     verbose_name = "Symposion Schedule"
+
+    def ready(self):
+        import symposion.schedule.signals   # noqa: F401
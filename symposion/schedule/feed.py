@@ -0,0 +1,272 @@
+"""
+Precomputed snapshots of the conference.json schedule feed.
+
+Building the feed touches every published slot, so the serialized feed
+is stored in the cache (and optionally on disk in SCHEDULE_JSON_ROOT)
+and is only rebuilt after schedule data changes. Staff members receive
+a separate variant that includes speaker email addresses.
+
+Cache keys and file names include a version that is replaced whenever
+schedule data changes, so snapshots built from older data (or by an
+older deploy) are never restored.
+"""
+from __future__ import unicode_literals
+import hashlib
+import json
+import glob
+import os
+import time
+import uuid
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.urls import reverse
+
+from symposion.proposals.models import AdditionalSpeaker
+from symposion.schedule.models import Slot, SlotRoom
+
+
+PROTOCOLS = ["http", "https"]
+SCHEDULE_JSON_VERSION_KEY = "schedule_json_version"
+
+
+def _variant_name(staff, protocol):
+    return "{}-{}".format("staff" if staff else "public", protocol)
+
+
+def schedule_json_version():
+    """Return the current version of the schedule feed's snapshots."""
+    version = cache.get(SCHEDULE_JSON_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        # Another process may have stored a version in the meantime.
+        if not cache.add(SCHEDULE_JSON_VERSION_KEY, version, None):
+            version = cache.get(SCHEDULE_JSON_VERSION_KEY, version)
+    return version
+
+
+def schedule_json_cache_key(staff, protocol, version=None):
+    """Return the cache key of a schedule feed variant."""
+    if version is None:
+        version = schedule_json_version()
+    return "schedule_json_{}_{}".format(
+        version, _variant_name(staff, protocol)
+    )
+
+
+def _schedule_json_root():
+    return getattr(settings, "SCHEDULE_JSON_ROOT", None) or None
+
+
+def _schedule_json_path(staff, protocol, version):
+    root = _schedule_json_root()
+    if root is None:
+        return None
+    return os.path.join(
+        root,
+        "conference-{}-{}.json".format(
+            _variant_name(staff, protocol), version
+        ),
+    )
+
+
+def _all_variants():
+    for staff in [False, True]:
+        for protocol in PROTOCOLS:
+            yield staff, protocol
+
+
+def _make_snapshot(content, last_modified):
+    return {
+        "content": content,
+        "etag": '"{}"'.format(hashlib.md5(content).hexdigest()),
+        "last_modified": int(last_modified),
+    }
+
+
+def build_schedule_data(staff, protocol):
+    """Return a list of dictionaries describing every published slot."""
+    slots = (
+        Slot.objects.filter(
+            day__schedule__published=True, day__schedule__hidden=False
+        )
+        .select_related(
+            "kind",
+            "day__schedule__section",
+            "content_ptr__speaker__user",
+        )
+        .prefetch_related(
+            Prefetch(
+                "slotroom_set",
+                queryset=SlotRoom.objects.select_related("room"),
+            ),
+            "content_ptr__additional_speakers__user",
+        )
+        .order_by("start")
+    )
+    slots = list(slots)
+
+    # Only accepted additional speakers are listed, which is decided
+    # by the proposal that each presentation was created from.
+    proposal_base_pks = set()
+    for slot in slots:
+        if slot.content is not None:
+            proposal_base_pks.add(slot.content.proposal_base_id)
+    accepted_speakers = defaultdict(set)
+    additional_speakers = AdditionalSpeaker.objects.filter(
+        proposalbase__in=proposal_base_pks,
+        status=AdditionalSpeaker.SPEAKING_STATUS_ACCEPTED,
+    ).values_list("proposalbase", "speaker")
+    for proposal_base_pk, speaker_pk in additional_speakers:
+        accepted_speakers[proposal_base_pk].add(speaker_pk)
+
+    domain = Site.objects.get_current().domain
+    data = []
+    for slot in slots:
+        room_names = [
+            slot_room.room.name for slot_room in slot.slotroom_set.all()
+        ]
+        slot_data = {
+            "room": ", ".join(room_names),
+            "rooms": room_names,
+            "start": slot.start.isoformat(),
+            "end": slot.end.isoformat(),
+            "duration": slot.length_in_minutes,
+            "kind": slot.kind.label,
+            "section": slot.day.schedule.section.slug,
+            "conf_key": slot.pk,
+            # TODO: models should be changed.
+            # these are model features from other conferences that have
+            # forked symposion these have been used almost everywhere
+            # and are good candidates for base proposals
+            "license": "",
+            "tags": "",
+            "released": True,
+            "contact": [],
+        }
+        presentation = slot.content
+        if presentation is not None:
+            accepted = accepted_speakers[presentation.proposal_base_id]
+            speakers = [presentation.speaker] + [
+                speaker
+                for speaker in presentation.additional_speakers.all()
+                if speaker.pk in accepted
+            ]
+            slot_data.update(
+                {
+                    "name": presentation.title,
+                    "authors": [s.name for s in speakers],
+                    "contact": [s.email for s in speakers]
+                    if staff
+                    else ["redacted"],
+                    "abstract": presentation.abstract,
+                    "description": presentation.description,
+                    "conf_url": "%s://%s%s"
+                    % (
+                        protocol,
+                        domain,
+                        reverse(
+                            "schedule_presentation_detail",
+                            args=[presentation.pk, presentation.slug],
+                        ),
+                    ),
+                    "cancelled": presentation.cancelled,
+                }
+            )
+        else:
+            slot_data.update(
+                {
+                    "name": slot.content_override
+                    if slot.content_override
+                    else "Slot"
+                }
+            )
+        data.append(slot_data)
+    return data
+
+
+def build_schedule_json(staff, protocol, version=None):
+    """Build, store and return a snapshot of a schedule feed variant."""
+    # The version is read before the feed is built, so that a feed
+    # built from data that changes in the meantime is never stored
+    # under the next version.
+    if version is None:
+        version = schedule_json_version()
+    content = json.dumps(
+        {"schedule": build_schedule_data(staff, protocol)}
+    ).encode("utf-8")
+    snapshot = _make_snapshot(content, time.time())
+    cache.set(
+        schedule_json_cache_key(staff, protocol, version),
+        snapshot,
+        settings.CACHE_TIMEOUT_LONG,
+    )
+
+    path = _schedule_json_path(staff, protocol, version)
+    if path is not None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first so that readers never
+        # see a partially-written feed.
+        temp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(temp_path, "wb") as feed_file:
+            feed_file.write(content)
+        os.replace(temp_path, path)
+        os.utime(path, (snapshot["last_modified"], snapshot["last_modified"]))
+
+    return snapshot
+
+
+def get_schedule_json(staff, protocol):
+    """
+    Return a snapshot of a schedule feed variant.
+
+    Snapshots are dictionaries containing the serialized feed
+    ("content"), its ETag ("etag") and the Unix timestamp of when it
+    was built ("last_modified").
+    """
+    if protocol not in PROTOCOLS:
+        protocol = "http"
+    version = schedule_json_version()
+    cache_key = schedule_json_cache_key(staff, protocol, version)
+    snapshot = cache.get(cache_key)
+    if snapshot is not None:
+        return snapshot
+
+    # Fall back to the on-disk copy before rebuilding the feed.
+    path = _schedule_json_path(staff, protocol, version)
+    if path is not None:
+        try:
+            with open(path, "rb") as feed_file:
+                content = feed_file.read()
+            last_modified = os.path.getmtime(path)
+        except OSError:
+            pass
+        else:
+            snapshot = _make_snapshot(content, last_modified)
+            cache.set(cache_key, snapshot, settings.CACHE_TIMEOUT_LONG)
+            return snapshot
+
+    return build_schedule_json(staff, protocol, version)
+
+
+def invalidate_schedule_json():
+    """Remove every stored snapshot of the schedule feed."""
+    version = uuid.uuid4().hex
+    cache.set(SCHEDULE_JSON_VERSION_KEY, version, None)
+    root = _schedule_json_root()
+    if root is None:
+        return
+    # Files of older versions (and of older deploys) are never read.
+    current_paths = set(
+        _schedule_json_path(staff, protocol, version)
+        for staff, protocol in _all_variants()
+    )
+    for path in glob.glob(os.path.join(root, "conference-*.json")):
+        if path not in current_paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
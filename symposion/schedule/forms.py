@@ -1,14 +1,17 @@
 from __future__ import unicode_literals
 import csv
+from collections import defaultdict
 from io import TextIOWrapper
 
 from datetime import datetime
 
 from django import forms
 from django.contrib import messages
-from django.db import IntegrityError, transaction
+from django.db import transaction
 from django.db.models import Q
+from django.utils import timezone
 
+from symposion.schedule.feed import invalidate_schedule_json
 from symposion.schedule.models import (
     Day,
     Presentation,
@@ -17,6 +20,8 @@ from symposion.schedule.models import (
     Slot,
     SlotRoom,
 )
+from symposion.schedule.pagecache import invalidate_schedule_pages
+from symposion.utils.db import bulk_create
 
 
 class SlotEditForm(forms.Form):
@@ -70,6 +75,7 @@ class ScheduleSectionForm(forms.Form):
 
     def __init__(self, *args, **kwargs):
         self.schedule = kwargs.pop("schedule")
+        self.import_errors = []
         super(ScheduleSectionForm, self).__init__(*args, **kwargs)
 
     def clean_filename(self):
@@ -87,84 +93,236 @@ class ScheduleSectionForm(forms.Form):
                 datetime_obj = datetime.fromisoformat(x)
             except (ValueError, TypeError):
                 return messages.ERROR, "Malformed time found: %s." % x
+            if timezone.is_naive(datetime_obj):
+                datetime_obj = timezone.make_aware(datetime_obj)
             datetimes.append(datetime_obj)
         return datetimes
 
     def _build_rooms(self, data):
         "Get or Create Rooms based on schedule type and set of Tracks"
-        created_rooms = []
-        rooms = sorted(set([x[self.ROOM_KEY] for x in data]))
-        for i, room in enumerate(rooms):
-            room, created = Room.objects.get_or_create(
-                schedule=self.schedule, name=room, order=i
+        existing_rooms = set(
+            Room.objects.filter(schedule=self.schedule).values_list(
+                "name", flat=True
             )
-            if created:
-                created_rooms.append(room)
-        return created_rooms
+        )
+        rooms = sorted(set([x[self.ROOM_KEY] for x in data]))
+        created_rooms = [
+            Room(schedule=self.schedule, name=room, order=i)
+            for i, room in enumerate(rooms)
+            if room not in existing_rooms
+        ]
+        return bulk_create(Room, created_rooms)
 
     def _build_days(self, data):
         "Get or Create Days based on schedule type and set of Days"
-        created_days = []
-        days = set([x[self.DATE_KEY] for x in data])
-        for day in days:
+        dates = set()
+        for day in set([x[self.DATE_KEY] for x in data]):
             try:
-                date = datetime.strptime(day, "%m/%d/%Y")
+                dates.add(datetime.strptime(day, "%m/%d/%Y").date())
             except ValueError:
-                [x.delete() for x in created_days]
                 return messages.ERROR, "Malformed data found: %s." % day
-            day, created = Day.objects.get_or_create(
-                schedule=self.schedule, date=date
+        existing_dates = set(
+            Day.objects.filter(schedule=self.schedule).values_list(
+                "date", flat=True
             )
-            if created:
-                created_days.append(day)
-        return created_days
+        )
+        created_days = [
+            Day(schedule=self.schedule, date=date)
+            for date in sorted(dates - existing_dates)
+        ]
+        return bulk_create(Day, created_days)
 
-    def build_schedule(self):
-        created_items = []
+    def _build_slot_kinds(self, data):
+        "Get or Create SlotKinds based on the set of kinds"
+        existing_kinds = set(
+            SlotKind.objects.filter(schedule=self.schedule).values_list(
+                "label", flat=True
+            )
+        )
+        kinds = sorted(set([x[self.KIND] for x in data]))
+        created_kinds = [
+            SlotKind(schedule=self.schedule, label=kind)
+            for kind in kinds
+            if kind not in existing_kinds
+        ]
+        return bulk_create(SlotKind, created_kinds)
+
+    def _read_rows(self):
+        "Return the uploaded CSV file's rows with whitespace removed"
         csv_file = TextIOWrapper(self.cleaned_data.get("filename"))
         reader = csv.DictReader(csv_file)
-        data = [
-            dict((k.strip(), v.strip()) for k, v in x.items()) for x in reader
-        ]
-        # build rooms
-        created_items.extend(self._build_rooms(data))
-        # build_days
-        created_items.extend(self._build_days(data))
-        # build Slot  -> SlotRoom
-        for row in data:
-            room = Room.objects.get(
-                schedule=self.schedule, name=row[self.ROOM_KEY]
+        return [
+            dict(
+                (k.strip(), (v or "").strip())
+                for k, v in x.items()
+                if k is not None
             )
-            date = datetime.strptime(row[self.DATE_KEY], "%m/%d/%Y")
-            day = Day.objects.get(schedule=self.schedule, date=date)
-            start, end = self._get_start_end_times(row)
-            slot_kind, created = SlotKind.objects.get_or_create(
-                label=row[self.KIND], schedule=self.schedule
-            )
-            if created:
-                created_items.append(slot_kind)
-            if row[self.KIND] == "plenary":
-                slot, created = Slot.objects.get_or_create(
-                    kind=slot_kind, day=day, start=start, end=end
-                )
-                if created:
-                    created_items.append(slot)
-            else:
-                slot = Slot.objects.create(
-                    kind=slot_kind, day=day, start=start, end=end
+            for x in reader
+        ]
+
+    def _validate_rows(self, data):
+        """
+        Validate every row of the CSV file.
+
+        Returns a list of (line number, error) tuples. Line numbers
+        refer to the CSV file, whose first line is its header.
+        """
+        errors = []
+        for line_number, row in enumerate(data, start=2):
+            missing_keys = [
+                key
+                for key in [
+                    self.DATE_KEY,
+                    self.START_KEY,
+                    self.END_KEY,
+                    self.KIND,
+                    self.ROOM_KEY,
+                ]
+                if not row.get(key)
+            ]
+            if missing_keys:
+                errors.append(
+                    (
+                        line_number,
+                        "Missing value for %s." % ", ".join(missing_keys),
+                    )
                 )
-                created_items.append(slot)
+                continue
             try:
-                with transaction.atomic():
-                    SlotRoom.objects.create(slot=slot, room=room)
-            except IntegrityError:
-                # delete all created objects and report error
-                for x in created_items:
-                    x.delete()
-                return (
-                    messages.ERROR,
-                    "An overlap occurred; the import was cancelled.",
+                datetime.strptime(row[self.DATE_KEY], "%m/%d/%Y")
+            except ValueError:
+                errors.append(
+                    (
+                        line_number,
+                        "Malformed data found: %s." % row[self.DATE_KEY],
+                    )
+                )
+            times = self._get_start_end_times(row)
+            if times[0] == messages.ERROR:
+                errors.append((line_number, times[1]))
+            elif times[0] >= times[1]:
+                errors.append(
+                    (line_number, "Slot does not end after it starts.")
                 )
+        return errors
+
+    def _find_overlaps(self, data):
+        """
+        Find slots that would overlap within the same room.
+
+        Returns a list of (line number, error) tuples. Rows of the
+        "plenary" kind with the same times share a single slot,
+        just like existing plenary slots do.
+        """
+        # Collect the time ranges already used in each room.
+        room_times = defaultdict(list)
+        existing_slot_rooms = SlotRoom.objects.filter(
+            room__schedule=self.schedule
+        ).select_related("slot", "room")
+        for slot_room in existing_slot_rooms:
+            room_times[slot_room.room.name].append(
+                (slot_room.slot.start, slot_room.slot.end, None)
+            )
+
+        for line_number, row in enumerate(data, start=2):
+            start, end = self._get_start_end_times(row)
+            room_times[row[self.ROOM_KEY]].append((start, end, line_number))
+
+        errors = []
+        for room, times in sorted(room_times.items()):
+            times.sort(key=lambda x: (x[0], x[1]))
+            latest_end = None
+            for start, end, line_number in times:
+                if latest_end is not None and start < latest_end[0]:
+                    # Overlaps between existing slots are not the
+                    # responsibility of this import.
+                    error_line_number = line_number or latest_end[1]
+                    if error_line_number is not None:
+                        errors.append(
+                            (
+                                error_line_number,
+                                "Slot overlaps another slot in %s." % room,
+                            )
+                        )
+                if latest_end is None or end > latest_end[0]:
+                    latest_end = (end, line_number)
+        return sorted(errors)
+
+    def build_schedule(self):
+        """
+        Import the uploaded CSV file into this form's schedule.
+
+        The entire file is validated before anything is saved, and
+        all objects are created within a single transaction. Errors
+        for individual rows are saved in import_errors as a list of
+        (line number, error) tuples.
+        """
+        data = self._read_rows()
+
+        self.import_errors = self._validate_rows(data)
+        if self.import_errors:
+            return (
+                messages.ERROR,
+                "Errors were found; the import was cancelled.",
+            )
+        self.import_errors = self._find_overlaps(data)
+        if self.import_errors:
+            return (
+                messages.ERROR,
+                "An overlap occurred; the import was cancelled.",
+            )
+
+        with transaction.atomic():
+            self._build_rooms(data)
+            self._build_days(data)
+            self._build_slot_kinds(data)
+
+            # Resolve rooms, days, and kinds in memory.
+            rooms = {}
+            for room in Room.objects.filter(schedule=self.schedule):
+                rooms.setdefault(room.name, room)
+            days = dict(
+                (day.date, day)
+                for day in Day.objects.filter(schedule=self.schedule)
+            )
+            slot_kinds = {}
+            for slot_kind in SlotKind.objects.filter(schedule=self.schedule):
+                slot_kinds.setdefault(slot_kind.label, slot_kind)
+
+            # Existing plenary slots are shared by new rooms.
+            plenary_slots = {}
+            if "plenary" in slot_kinds:
+                for slot in Slot.objects.filter(kind=slot_kinds["plenary"]):
+                    plenary_slots[(slot.day_id, slot.start, slot.end)] = slot
+
+            new_slots = []
+            slot_rooms = []
+            for row in data:
+                date = datetime.strptime(row[self.DATE_KEY], "%m/%d/%Y")
+                day = days[date.date()]
+                start, end = self._get_start_end_times(row)
+                slot_kind = slot_kinds[row[self.KIND]]
+                if row[self.KIND] == "plenary":
+                    slot = plenary_slots.get((day.pk, start, end))
+                    if slot is None:
+                        slot = Slot(
+                            kind=slot_kind, day=day, start=start, end=end
+                        )
+                        plenary_slots[(day.pk, start, end)] = slot
+                        new_slots.append(slot)
+                else:
+                    slot = Slot(kind=slot_kind, day=day, start=start, end=end)
+                    new_slots.append(slot)
+                slot_rooms.append((slot, rooms[row[self.ROOM_KEY]]))
+
+            bulk_create(Slot, new_slots)
+            SlotRoom.objects.bulk_create(
+                [SlotRoom(slot=slot, room=room) for slot, room in slot_rooms]
+            )
+
+        # Bulk creation does not send signals.
+        invalidate_schedule_json()
+        invalidate_schedule_pages()
         return messages.SUCCESS, "Your schedule has been imported."
 
     def delete_schedule(self):
@@ -0,0 +1,33 @@
+# Generated by Django 3.0.10 on 2026-10-18 02:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('symposion_schedule', '0006_rename_slot_datetime_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='day',
+            name='date_last_modified',
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True, verbose_name='Last modified'),
+        ),
+        migrations.AddField(
+            model_name='presentation',
+            name='date_last_modified',
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True, verbose_name='Last modified'),
+        ),
+        migrations.AddField(
+            model_name='room',
+            name='date_last_modified',
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True, verbose_name='Last modified'),
+        ),
+        migrations.AddField(
+            model_name='slot',
+            name='date_last_modified',
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True, verbose_name='Last modified'),
+        ),
+    ]
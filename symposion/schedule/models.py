@@ -40,6 +40,12 @@ class Day(models.Model):
         Schedule, on_delete=models.CASCADE, verbose_name=_("Schedule")
     )
     date = models.DateField(verbose_name=_("Date"))
+    date_last_modified = models.DateTimeField(
+        auto_now=True,
+        db_index=True,
+        null=True,
+        verbose_name=_("Last modified"),
+    )
 
     def __str__(self):
         return "%s" % self.date
@@ -58,6 +64,12 @@ class Room(models.Model):
     )
     name = models.CharField(max_length=65, verbose_name=_("Name"))
     order = models.PositiveIntegerField(verbose_name=_("Order"))
+    date_last_modified = models.DateTimeField(
+        auto_now=True,
+        db_index=True,
+        null=True,
+        verbose_name=_("Last modified"),
+    )
 
     def __str__(self):
         return self.name
@@ -99,6 +111,12 @@ class Slot(models.Model):
         blank=True, verbose_name=_("Content override")
     )
     content_override_html = models.TextField(blank=True, editable=False)
+    date_last_modified = models.DateTimeField(
+        auto_now=True,
+        db_index=True,
+        null=True,
+        verbose_name=_("Last modified"),
+    )
 
     def assign(self, content):
         """
@@ -231,6 +249,12 @@ class Presentation(models.Model):
         related_name="presentations",
         verbose_name=_("Section"),
     )
+    date_last_modified = models.DateTimeField(
+        auto_now=True,
+        db_index=True,
+        null=True,
+        verbose_name=_("Last modified"),
+    )
 
     def save(self, *args, **kwargs):
         self.description_html = parse(self.description)
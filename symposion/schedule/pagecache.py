@@ -0,0 +1,62 @@
+"""
+Cached fragments of the public schedule pages.
+
+Each page's schedule content is rendered once and stored in the cache,
+keyed by the page, its schedule or presentation, the visitor's time
+zone and whether the visitor is a staff member. Every key includes a
+version that is replaced whenever schedule data changes, which purges
+all stored fragments at once. The rest of each page (such as the time
+zone selector and its CSRF token) is still rendered per request.
+"""
+from __future__ import unicode_literals
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.safestring import mark_safe
+
+
+SCHEDULE_PAGES_VERSION_KEY = "schedule_pages_version"
+
+
+def schedule_pages_version():
+    """Return the current version of the cached schedule pages."""
+    version = cache.get(SCHEDULE_PAGES_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        # Another process may have stored a version in the meantime.
+        if not cache.add(SCHEDULE_PAGES_VERSION_KEY, version, None):
+            version = cache.get(SCHEDULE_PAGES_VERSION_KEY, version)
+    return version
+
+
+def schedule_page_cache_key(request, *parts):
+    """Return the cache key of a page fragment for this request."""
+    return "schedule_page_{}_{}_{}_{}".format(
+        schedule_pages_version(),
+        "_".join(str(part) for part in parts),
+        timezone.get_current_timezone_name(),
+        "staff" if request.user.is_staff else "public",
+    )
+
+
+def get_cached_fragment(request, parts, render):
+    """
+    Return a page fragment, calling render() to build it if needed.
+
+    parts identify the page and the object that it displays.
+    """
+    cache_key = schedule_page_cache_key(request, *parts)
+    content = cache.get(cache_key)
+    if content is None:
+        content = render()
+        # Some displayed data (e.g. proposal details) does not purge
+        # the cache when changed, so fragments are not kept too long.
+        cache.set(cache_key, content, settings.CACHE_TIMEOUT_MEDIUM)
+    return mark_safe(content)
+
+
+def invalidate_schedule_pages():
+    """Purge every cached schedule page fragment."""
+    cache.set(SCHEDULE_PAGES_VERSION_KEY, uuid.uuid4().hex, None)
@@ -0,0 +1,80 @@
+from __future__ import unicode_literals
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from symposion.conference.models import Section
+from symposion.proposals.models import AdditionalSpeaker
+from symposion.schedule.feed import invalidate_schedule_json
+from symposion.schedule.models import (
+    Day,
+    Presentation,
+    Room,
+    Schedule,
+    Slot,
+    SlotKind,
+    SlotRoom,
+)
+from symposion.schedule.pagecache import invalidate_schedule_pages
+from symposion.schedule.visibility import invalidate_published_sections
+from symposion.speakers.models import Speaker
+
+
+# Models whose changes affect the contents of the conference.json feed
+# and of the public schedule pages.
+SCHEDULE_JSON_MODELS = [
+    AdditionalSpeaker,
+    Day,
+    Presentation,
+    Room,
+    Schedule,
+    Section,
+    Slot,
+    SlotKind,
+    SlotRoom,
+    Speaker,
+]
+
+
+def _invalidate_schedule_caches():
+    invalidate_schedule_json()
+    invalidate_schedule_pages()
+
+
+def invalidate_schedule_caches(sender, **kwargs):
+    # Until the change is committed, other requests would store
+    # snapshots of the old data under the new versions.
+    transaction.on_commit(_invalidate_schedule_caches)
+
+
+for model in SCHEDULE_JSON_MODELS:
+    post_save.connect(
+        invalidate_schedule_caches,
+        sender=model,
+        dispatch_uid="schedule_json_post_save_{}".format(model.__name__),
+    )
+    post_delete.connect(
+        invalidate_schedule_caches,
+        sender=model,
+        dispatch_uid="schedule_json_post_delete_{}".format(model.__name__),
+    )
+m2m_changed.connect(
+    invalidate_schedule_caches,
+    sender=Presentation.additional_speakers.through,
+    dispatch_uid="schedule_json_m2m_changed_presentation_speakers",
+)
+
+
+def invalidate_schedule_visibility(sender, **kwargs):
+    invalidate_published_sections()
+
+
+post_save.connect(
+    invalidate_schedule_visibility,
+    sender=Schedule,
+    dispatch_uid="schedule_visibility_post_save",
+)
+post_delete.connect(
+    invalidate_schedule_visibility,
+    sender=Schedule,
+    dispatch_uid="schedule_visibility_post_delete",
+)
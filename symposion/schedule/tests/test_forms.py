@@ -1,6 +1,7 @@
 import os
 
 from datetime import datetime, timedelta
+from unittest import mock
 
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
@@ -163,3 +164,129 @@ class ScheduleSectionFormTests(TestCase):
         self.assertEqual(0, Room.objects.all().count())
         self.assertEqual(0, Slot.objects.all().count())
         self.assertEqual(0, SlotKind.objects.all().count())
+
+    def _build_schedule_from_rows(self, rows):
+        """Build schedule from a CSV file containing the given rows."""
+        content = '"date","time_start","time_end","kind","room"\n'
+        content += "".join(
+            ",".join('"%s"' % value for value in row) + "\n" for row in rows
+        )
+        file_data = {
+            "filename": SimpleUploadedFile(
+                "schedule.csv", content.encode("utf-8")
+            )
+        }
+        data = {"submit": "Submit"}
+        form = ScheduleSectionForm(data, file_data, schedule=self.schedule)
+        form.is_valid()
+        return form, form.build_schedule()
+
+    def test_build_schedule_purges_schedule_pages(self):
+        """Verify that importing slots purges cached schedule pages."""
+        # Slots are created in bulk where the database supports it,
+        # in which case no signals purge the cached pages.
+        with mock.patch(
+            "symposion.schedule.forms.invalidate_schedule_pages"
+        ) as invalidate_schedule_pages:
+            form, (msg_type, msg) = self._build_schedule_from_rows(
+                [
+                    [
+                        "12/12/2013",
+                        "2013-12-12T10:00:00+00:00",
+                        "2013-12-12T11:00:00+00:00",
+                        "talk",
+                        "Room1",
+                    ]
+                ]
+            )
+        self.assertEqual(25, msg_type)
+        invalidate_schedule_pages.assert_called_once_with()
+
+    def test_build_schedule_row_errors(self):
+        """Verify that invalid rows are reported and nothing is created."""
+        form, (msg_type, msg) = self._build_schedule_from_rows(
+            [
+                [
+                    "12/12/2013",
+                    "2013-12-12T10:00:00+00:00",
+                    "2013-12-12T11:00:00+00:00",
+                    "talk",
+                    "Room1",
+                ],
+                [
+                    "12-12-13",
+                    "2013-12-12T11:00:00+00:00",
+                    "2013-12-12T12:00:00+00:00",
+                    "talk",
+                    "Room1",
+                ],
+                [
+                    "12/12/2013",
+                    "2013-12-12T13:00:00+00:00",
+                    "2013-12-12T12:00:00+00:00",
+                    "talk",
+                    "Room1",
+                ],
+            ]
+        )
+        self.assertEqual(40, msg_type)
+        self.assertEqual([3, 4], [error[0] for error in form.import_errors])
+        self.assertIn("12-12-13", form.import_errors[0][1])
+        self.assertEqual(0, Day.objects.all().count())
+        self.assertEqual(0, Room.objects.all().count())
+        self.assertEqual(0, Slot.objects.all().count())
+
+    def test_build_schedule_partial_overlap(self):
+        """Verify that partially overlapping slots are detected."""
+        form, (msg_type, msg) = self._build_schedule_from_rows(
+            [
+                [
+                    "12/12/2013",
+                    "2013-12-12T10:00:00+00:00",
+                    "2013-12-12T11:00:00+00:00",
+                    "talk",
+                    "Room1",
+                ],
+                [
+                    "12/12/2013",
+                    "2013-12-12T10:30:00+00:00",
+                    "2013-12-12T11:30:00+00:00",
+                    "talk",
+                    "Room1",
+                ],
+                [
+                    "12/12/2013",
+                    "2013-12-12T10:30:00+00:00",
+                    "2013-12-12T11:30:00+00:00",
+                    "talk",
+                    "Room2",
+                ],
+            ]
+        )
+        self.assertEqual(40, msg_type)
+        self.assertIn("overlap", msg)
+        self.assertEqual([3], [error[0] for error in form.import_errors])
+        self.assertEqual(0, Slot.objects.all().count())
+
+    def test_build_schedule_existing_plenary(self):
+        """Verify that existing plenary slots are shared by new rooms."""
+        plenary_row = [
+            "12/12/2013",
+            "2013-12-12T10:00:00+00:00",
+            "2013-12-12T11:00:00+00:00",
+            "plenary",
+        ]
+        self._build_schedule_from_rows([plenary_row + ["Room1"]])
+        form, (msg_type, msg) = self._build_schedule_from_rows(
+            [plenary_row + ["Room2"]]
+        )
+        self.assertEqual(25, msg_type)
+        self.assertEqual(1, Slot.objects.all().count())
+        self.assertEqual(2, Slot.objects.get().slotroom_set.count())
+
+        # Importing the same room again is an overlap.
+        form, (msg_type, msg) = self._build_schedule_from_rows(
+            [plenary_row + ["Room2"]]
+        )
+        self.assertEqual(40, msg_type)
+        self.assertEqual(2, Slot.objects.get().slotroom_set.count())
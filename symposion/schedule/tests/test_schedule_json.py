@@ -1,18 +1,32 @@
+import os
+import tempfile
+
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
 from symposion.proposals.models import ProposalBase
+from symposion.schedule.feed import (
+    get_schedule_json,
+    invalidate_schedule_json,
+    schedule_json_cache_key,
+)
 from symposion.schedule.models import Presentation
 from symposion.schedule.tests.factories import (
     SectionFactory, ProposalKindFactory, SlotFactory
 )
 from symposion.speakers.models import Speaker
+from symposion.tests.utils import run_on_commit_callbacks
 
 
 class ScheduleJSONViewTestCase(TestCase):
     """Automated test cases for schedule_json view."""
 
+    def setUp(self):
+        # Feed snapshots outlive the test database's transactions.
+        invalidate_schedule_json()
+
     def test_empty_schedule(self):
         """Verify that an empty schedule returns empty JSON."""
         response = self.client.get(reverse("schedule_json"))
@@ -84,3 +98,83 @@ class ScheduleJSONViewTestCase(TestCase):
         self.assertContains(response=response, text=TALK_TITLE)
         self.assertContains(response=response, text=DESCRIPTION_CONTENT)
         self.assertContains(response=response, text=ABSTRACT_CONTENT)
+
+    def test_conditional_get(self):
+        """Verify that clients with the current feed get a 304 response."""
+        SlotFactory()
+        response = self.client.get(reverse("schedule_json"))
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+
+        response = self.client.get(
+            reverse("schedule_json"), HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_slot_changes_invalidate_feed(self):
+        """Verify that saving a slot rebuilds the feed."""
+        slot = SlotFactory()
+        first_response = self.client.get(reverse("schedule_json"))
+        slot.content_override = "Lunch"
+        with run_on_commit_callbacks():
+            slot.save()
+
+        response = self.client.get(
+            reverse("schedule_json"),
+            HTTP_IF_NONE_MATCH=first_response["ETag"],
+        )
+        self.assertContains(response=response, text="Lunch", status_code=200)
+        self.assertNotEqual(response["ETag"], first_response["ETag"])
+
+    def test_feed_is_stored_on_disk(self):
+        """Verify that the feed can be restored from its on-disk copy."""
+        SlotFactory()
+        with tempfile.TemporaryDirectory() as feed_root:
+            with override_settings(SCHEDULE_JSON_ROOT=feed_root):
+                snapshot = get_schedule_json(False, "https")
+                # Remove the cached copy, but keep the on-disk copy.
+                cache.delete(schedule_json_cache_key(False, "https"))
+                with self.assertNumQueries(0):
+                    disk_snapshot = get_schedule_json(False, "https")
+                self.assertEqual(disk_snapshot["content"], snapshot["content"])
+
+                invalidate_schedule_json()
+                self.assertEqual(os.listdir(feed_root), [])
+
+    def test_feed_is_invalidated_on_commit(self):
+        """Verify that feeds are only invalidated once changes commit."""
+        slot = SlotFactory()
+        first_response = self.client.get(reverse("schedule_json"))
+        with run_on_commit_callbacks():
+            slot.content_override = "Lunch"
+            slot.save()
+            # Until the change is committed, other requests cannot see
+            # it, so the feed must not be rebuilt yet.
+            response = self.client.get(reverse("schedule_json"))
+            self.assertEqual(response["ETag"], first_response["ETag"])
+            self.assertNotContains(response, "Lunch")
+        response = self.client.get(reverse("schedule_json"))
+        self.assertContains(response, "Lunch")
+        self.assertNotEqual(response["ETag"], first_response["ETag"])
+
+    def test_older_feed_files_are_not_restored(self):
+        """Verify that on-disk copies of older versions are ignored."""
+        slot = SlotFactory()
+        with tempfile.TemporaryDirectory() as feed_root:
+            with override_settings(SCHEDULE_JSON_ROOT=feed_root):
+                # A copy written by an older deploy.
+                old_path = os.path.join(
+                    feed_root, "conference-public-https.json"
+                )
+                with open(old_path, "wb") as feed_file:
+                    feed_file.write(b'{"schedule": "old"}')
+                snapshot = get_schedule_json(False, "https")
+                self.assertNotIn(b"old", snapshot["content"])
+
+                slot.content_override = "Lunch"
+                slot.save()
+                invalidate_schedule_json()
+                self.assertFalse(os.path.exists(old_path))
+                self.assertEqual(os.listdir(feed_root), [])
+                snapshot = get_schedule_json(False, "https")
+                self.assertIn(b"Lunch", snapshot["content"])
@@ -0,0 +1,99 @@
+from django.contrib.auth.models import AnonymousUser, User
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from symposion.schedule.models import Slot
+from symposion.schedule.pagecache import (
+    get_cached_fragment,
+    invalidate_schedule_pages,
+    schedule_page_cache_key,
+)
+from symposion.schedule.tests.factories import DayFactory, SlotFactory
+from symposion.tests.utils import run_on_commit_callbacks
+
+
+class SchedulePageCacheTestCase(TestCase):
+    def setUp(self):
+        invalidate_schedule_pages()
+        self.request = RequestFactory().get("/")
+        self.request.user = AnonymousUser()
+
+    def test_fragments_are_rendered_once(self):
+        rendered = []
+
+        def render():
+            rendered.append(True)
+            return "<p>Schedule</p>"
+
+        for _ in range(2):
+            content = get_cached_fragment(self.request, ["test"], render)
+        self.assertEqual(content, "<p>Schedule</p>")
+        self.assertEqual(len(rendered), 1)
+
+        invalidate_schedule_pages()
+        get_cached_fragment(self.request, ["test"], render)
+        self.assertEqual(len(rendered), 2)
+
+    def test_cache_key_varies_by_time_zone(self):
+        with timezone.override("America/New_York"):
+            new_york_key = schedule_page_cache_key(self.request, "test")
+        with timezone.override("Europe/Berlin"):
+            berlin_key = schedule_page_cache_key(self.request, "test")
+        self.assertNotEqual(new_york_key, berlin_key)
+
+    def test_cache_key_varies_by_staff_status(self):
+        public_key = schedule_page_cache_key(self.request, "test")
+        self.request.user = User(is_staff=True)
+        staff_key = schedule_page_cache_key(self.request, "test")
+        self.assertNotEqual(public_key, staff_key)
+
+
+class SchedulePageViewTestCase(TestCase):
+    def setUp(self):
+        invalidate_schedule_pages()
+        day = DayFactory()
+        self.schedule = day.schedule
+        self.slot = SlotFactory(
+            day=day, kind__schedule=self.schedule, content_override="Breakfast"
+        )
+        self.url = reverse(
+            "schedule_detail", args=[self.schedule.section.slug]
+        )
+
+    def test_schedule_detail_is_cached(self):
+        self.assertContains(self.client.get(self.url), "Breakfast")
+        # Changes that bypass signals are not displayed.
+        Slot.objects.filter(pk=self.slot.pk).update(content_override="Lunch")
+        self.assertContains(self.client.get(self.url), "Breakfast")
+
+    def test_slot_changes_purge_cache(self):
+        self.assertContains(self.client.get(self.url), "Breakfast")
+        self.slot.content_override = "Lunch"
+        with run_on_commit_callbacks():
+            self.slot.save()
+        response = self.client.get(self.url)
+        self.assertContains(response, "Lunch")
+        self.assertNotContains(response, "Breakfast")
+
+    def test_unpublishing_schedule_hides_page(self):
+        self.client.get(self.url)
+        self.schedule.published = False
+        self.schedule.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 404)
+
+    def test_conference_schedule_is_cached(self):
+        url = reverse("schedule_conference")
+        self.assertContains(self.client.get(url), "Breakfast")
+        with CaptureQueriesContext(connection) as queries:
+            self.assertContains(self.client.get(url), "Breakfast")
+        # Only the rest of the page (menus, settings) is loaded.
+        schedule_queries = [
+            query["sql"]
+            for query in queries
+            if "symposion_schedule_" in query["sql"]
+        ]
+        self.assertEqual(schedule_queries, [])
@@ -0,0 +1,110 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from symposion.schedule.models import Day, Room, Slot, SlotRoom
+from symposion.schedule.tests.factories import (
+    DayFactory,
+    ScheduleFactory,
+    SlotKindFactory,
+)
+from symposion.schedule.timetable import TimeTable
+
+
+class TimeTableTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.schedule = ScheduleFactory()
+        cls.day = DayFactory(schedule=cls.schedule)
+        cls.kind = SlotKindFactory(schedule=cls.schedule)
+        cls.room1 = Room.objects.create(
+            schedule=cls.schedule, name="Room 1", order=1
+        )
+        cls.room2 = Room.objects.create(
+            schedule=cls.schedule, name="Room 2", order=2
+        )
+
+    def _time(self, hour, minute=0):
+        return timezone.make_aware(
+            datetime.datetime.combine(
+                self.day.date, datetime.time(hour, minute)
+            ),
+            timezone.utc,
+        )
+
+    def _create_slot(self, day, start, end, rooms):
+        slot = Slot.objects.create(
+            day=day, kind=self.kind, start=start, end=end
+        )
+        for room in rooms:
+            SlotRoom.objects.create(slot=slot, room=room)
+        return slot
+
+    def test_empty_day(self):
+        timetable = TimeTable(self.day)
+        self.assertEqual(list(timetable), [])
+        self.assertEqual(timetable.rooms(), [])
+
+    def test_rows_rowspan_and_colspan(self):
+        plenary = self._create_slot(
+            self.day, self._time(9), self._time(10), [self.room1, self.room2]
+        )
+        # Create room 2's talk first to verify sorting by room order.
+        talk2 = self._create_slot(
+            self.day, self._time(10), self._time(10, 30), [self.room2]
+        )
+        talk1 = self._create_slot(
+            self.day, self._time(10), self._time(11), [self.room1]
+        )
+        talk3 = self._create_slot(
+            self.day, self._time(10, 30), self._time(11), [self.room2]
+        )
+
+        rows = list(TimeTable(self.day))
+        self.assertEqual(
+            [row["time"] for row in rows],
+            [
+                self._time(9),
+                self._time(10),
+                self._time(10, 30),
+                self._time(11),
+            ],
+        )
+        self.assertEqual(rows[0]["slots"], [plenary])
+        self.assertEqual(rows[1]["slots"], [talk1, talk2])
+        self.assertEqual(rows[2]["slots"], [talk3])
+        self.assertEqual(rows[3]["slots"], [])
+
+        self.assertEqual(rows[0]["slots"][0].colspan, 2)
+        self.assertEqual(rows[0]["slots"][0].rowspan, 1)
+        self.assertEqual(rows[1]["slots"][0].rowspan, 2)
+        self.assertEqual(rows[1]["slots"][1].rowspan, 1)
+        self.assertEqual(rows[1]["slots"][1].colspan, 1)
+
+    def test_rooms_are_ordered(self):
+        self._create_slot(
+            self.day, self._time(9), self._time(10), [self.room2, self.room1]
+        )
+        self.assertEqual(TimeTable(self.day).rooms(), [self.room1, self.room2])
+
+    def test_query_count_does_not_depend_on_days(self):
+        for offset in range(3):
+            day = Day.objects.create(
+                schedule=self.schedule,
+                date=self.day.date + datetime.timedelta(days=offset + 1),
+            )
+            self._create_slot(
+                day,
+                self._time(9) + datetime.timedelta(days=offset + 1),
+                self._time(10) + datetime.timedelta(days=offset + 1),
+                [self.room1, self.room2],
+            )
+
+        days = list(Day.objects.filter(schedule=self.schedule))
+        with self.assertNumQueries(2):
+            timetables = TimeTable.for_days(days)
+            for timetable in timetables:
+                timetable.rooms()
+                list(timetable)
+        self.assertEqual(len(timetables), 4)
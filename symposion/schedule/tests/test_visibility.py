@@ -0,0 +1,32 @@
+from django.test import TestCase
+
+from symposion.schedule.tests.factories import ScheduleFactory
+from symposion.schedule.visibility import (
+    any_schedule_published,
+    invalidate_published_sections,
+    published_section_pks,
+)
+
+
+class ScheduleVisibilityTestCase(TestCase):
+    def setUp(self):
+        invalidate_published_sections()
+
+    def test_published_sections_are_cached(self):
+        schedule = ScheduleFactory(published=True)
+        self.assertEqual(published_section_pks(), {schedule.section_id})
+        with self.assertNumQueries(0):
+            self.assertTrue(any_schedule_published())
+
+    def test_unpublished_schedules(self):
+        ScheduleFactory(published=False)
+        self.assertFalse(any_schedule_published())
+
+    def test_saving_schedule_clears_cache(self):
+        schedule = ScheduleFactory(published=True)
+        self.assertTrue(any_schedule_published())
+        schedule.published = False
+        schedule.save()
+        self.assertFalse(any_schedule_published())
+        schedule.delete()
+        self.assertEqual(published_section_pks(), frozenset())
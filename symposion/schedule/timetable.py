@@ -1,14 +1,58 @@
 from __future__ import unicode_literals
 import itertools
+from collections import defaultdict
 
-from django.db.models import Count, Min
+from symposion.schedule.models import Slot, SlotRoom
 
-from symposion.schedule.models import Room, Slot, SlotRoom
+
+def load_days(days):
+    """
+    Load the slots and slot rooms of several days at once.
+
+    Returns a dictionary mapping each day's primary key to a tuple of
+    (slots, slot_rooms). Two queries are run no matter how many days
+    are requested.
+    """
+    day_pks = [day.pk for day in days]
+    loaded = {day_pk: ([], []) for day_pk in day_pks}
+    if not day_pks:
+        return loaded
+
+    slots = Slot.objects.filter(day__in=day_pks).select_related(
+        "kind",
+        "content_ptr",
+        "content_ptr__speaker",
+        "content_ptr__proposal_base__kind",
+    )
+    slot_days = {}
+    for slot in slots:
+        slot_days[slot.pk] = slot.day_id
+        loaded[slot.day_id][0].append(slot)
+
+    slot_rooms = SlotRoom.objects.filter(slot__day__in=day_pks)
+    slot_rooms = slot_rooms.select_related("room").order_by("room__order")
+    for slot_room in slot_rooms:
+        loaded[slot_days[slot_room.slot_id]][1].append(slot_room)
+
+    return loaded
 
 
 class TimeTable(object):
-    def __init__(self, day):
+    def __init__(self, day, slots=None, slot_rooms=None):
         self.day = day
+        self._slots = slots
+        self._slot_rooms = slot_rooms
+
+    @classmethod
+    def for_days(cls, days):
+        """Create TimeTables for several days in a fixed number of queries."""
+        days = list(days)
+        loaded = load_days(days)
+        return [cls(day, *loaded[day.pk]) for day in days]
+
+    def _load(self):
+        if self._slots is None or self._slot_rooms is None:
+            self._slots, self._slot_rooms = load_days([self.day])[self.day.pk]
 
     def slots_qs(self):
         qs = Slot.objects.all()
@@ -16,41 +60,55 @@ class TimeTable(object):
         return qs
 
     def rooms(self):
-        qs = Room.objects.all()
-        qs = qs.filter(schedule=self.day.schedule)
-        qs = qs.filter(
-            pk__in=SlotRoom.objects.filter(
-                slot__in=self.slots_qs().values("pk")
-            ).values("room")
-        )
-        qs = qs.order_by("order")
-        return qs
+        self._load()
+        rooms = {}
+        for slot_room in self._slot_rooms:
+            room = slot_room.room
+            if room.schedule_id == self.day.schedule_id:
+                rooms[room.pk] = room
+        return sorted(rooms.values(), key=lambda room: (room.order, room.pk))
 
     def __iter__(self):
+        self._load()
+        room_counts = defaultdict(int)
+        room_orders = {}
+        for slot_room in self._slot_rooms:
+            room_counts[slot_room.slot_id] += 1
+            room_orders.setdefault(slot_room.slot_id, slot_room.room.order)
+
         times = sorted(
-            set(itertools.chain(*self.slots_qs().values_list("start", "end")))
+            set(
+                itertools.chain.from_iterable(
+                    (slot.start, slot.end) for slot in self._slots
+                )
+            )
         )
-        slots = Slot.objects.filter(pk__in=self.slots_qs().values("pk"))
-        slots = slots.annotate(
-            room_count=Count("slotroom"), order=Min("slotroom__room__order")
-        )
-        slots = slots.order_by("start", "order")
-        row = []
+        time_index = {time: index for index, time in enumerate(times)}
+
+        # Bucket slots by their start time so that each row only
+        # needs to look at its own slots.
+        slots_by_start = defaultdict(list)
+        for slot in self._slots:
+            slot.rowspan = TimeTable.rowspan(time_index, slot.start, slot.end)
+            slot.colspan = room_counts[slot.pk]
+            slots_by_start[slot.start].append(slot)
+
         for time, next_time in pairwise(times):
-            row = {"time": time, "slots": []}
-            for slot in slots:
-                if slot.start == time:
-                    slot.rowspan = TimeTable.rowspan(
-                        times, slot.start, slot.end
-                    )
-                    slot.colspan = slot.room_count
-                    row["slots"].append(slot)
+            # Slots without rooms sort after all other slots.
+            slots = sorted(
+                slots_by_start.get(time, []),
+                key=lambda slot: (
+                    slot.pk not in room_orders,
+                    room_orders.get(slot.pk, 0),
+                ),
+            )
+            row = {"time": time, "slots": slots}
             if row["slots"] or next_time is None:
                 yield row
 
     @staticmethod
-    def rowspan(times, start, end):
-        return times.index(end) - times.index(start)
+    def rowspan(time_index, start, end):
+        return time_index[end] - time_index[start]
 
 
 def pairwise(iterable):
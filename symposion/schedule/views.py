@@ -1,17 +1,18 @@
 from __future__ import unicode_literals
-import json
-
 from django.http import Http404, HttpResponse
 from django.shortcuts import render, get_object_or_404, redirect
 from django.template import loader
-from django.urls import reverse
+from django.template.loader import render_to_string
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.contrib.sites.models import Site
 
+from symposion.schedule.feed import get_schedule_json
 from symposion.schedule.forms import SlotEditForm, ScheduleSectionForm
 from symposion.schedule.models import Schedule, Day, Slot, Presentation
+from symposion.schedule.pagecache import get_cached_fragment
 from symposion.schedule.timetable import TimeTable
 
 
@@ -32,21 +33,38 @@ def fetch_schedule(slug):
 
 def schedule_conference(request):
 
-    if request.user.is_staff:
-        schedules = Schedule.objects.filter(hidden=False)
-    else:
-        schedules = Schedule.objects.filter(published=True, hidden=False)
-
-    # Sort schedules by their first day.
-    schedules = sorted(schedules, key=lambda s: s.first_date())
-
-    sections = []
-    for schedule in schedules:
-        days_qs = Day.objects.filter(schedule=schedule)
-        days = [TimeTable(day) for day in days_qs]
-        sections.append({"schedule": schedule, "days": days})
+    def render_sections():
+        if request.user.is_staff:
+            schedules = Schedule.objects.filter(hidden=False)
+        else:
+            schedules = Schedule.objects.filter(published=True, hidden=False)
+
+        # Sort schedules by their first day.
+        schedules = sorted(schedules, key=lambda s: s.first_date())
+
+        # Build every day's TimeTable at once so that the number of
+        # queries does not depend on the number of days.
+        days_qs = Day.objects.filter(schedule__in=schedules)
+        days_by_schedule = {schedule.pk: [] for schedule in schedules}
+        for timetable in TimeTable.for_days(days_qs):
+            days_by_schedule[timetable.day.schedule_id].append(timetable)
+
+        sections = []
+        for schedule in schedules:
+            sections.append(
+                {"schedule": schedule, "days": days_by_schedule[schedule.pk]}
+            )
+        return render_to_string(
+            "symposion/schedule/_schedule_conference_days.html",
+            {"sections": sections},
+            request=request,
+        )
 
-    ctx = {"sections": sections}
+    ctx = {
+        "schedule_html": get_cached_fragment(
+            request, ["conference"], render_sections
+        )
+    }
     return render(request, "symposion/schedule/schedule_conference.html", ctx)
 
 
@@ -56,10 +74,20 @@ def schedule_detail(request, slug=None):
     if not schedule.published and not request.user.is_staff:
         raise Http404()
 
-    days_qs = Day.objects.filter(schedule=schedule)
-    days = [TimeTable(day) for day in days_qs]
+    def render_days():
+        days_qs = Day.objects.filter(schedule=schedule)
+        return render_to_string(
+            "symposion/schedule/_schedule_days.html",
+            {"schedule": schedule, "days": TimeTable.for_days(days_qs)},
+            request=request,
+        )
 
-    ctx = {"schedule": schedule, "days": days}
+    ctx = {
+        "schedule": schedule,
+        "schedule_html": get_cached_fragment(
+            request, ["detail", schedule.pk], render_days
+        ),
+    }
     return render(request, "symposion/schedule/schedule_detail.html", ctx)
 
 
@@ -68,10 +96,21 @@ def schedule_list(request, slug=None):
     if not schedule.published and not request.user.is_staff:
         raise Http404()
 
-    presentations = Presentation.objects.filter(section=schedule.section)
-    presentations = presentations.exclude(cancelled=True)
+    def render_presentations():
+        presentations = Presentation.objects.filter(section=schedule.section)
+        presentations = presentations.exclude(cancelled=True)
+        return render_to_string(
+            "symposion/schedule/_schedule_list_presentations.html",
+            {"schedule": schedule, "presentations": presentations},
+            request=request,
+        )
 
-    ctx = {"schedule": schedule, "presentations": presentations}
+    ctx = {
+        "schedule": schedule,
+        "presentations_html": get_cached_fragment(
+            request, ["list", schedule.pk], render_presentations
+        ),
+    }
     return render(request, "symposion/schedule/schedule_list.html", ctx)
 
 
@@ -115,13 +154,19 @@ def schedule_edit(request, slug=None):
         if form.is_valid():
             if "submit" in form.data:
                 msg = form.build_schedule()
+                for line_number, error in form.import_errors:
+                    messages.add_message(
+                        request,
+                        messages.ERROR,
+                        "Line %s: %s" % (line_number, error),
+                    )
             elif "delete" in form.data:
                 msg = form.delete_schedule()
             messages.add_message(request, msg[0], msg[1])
     else:
         form = ScheduleSectionForm(schedule=schedule)
     days_qs = Day.objects.filter(schedule=schedule)
-    days = [TimeTable(day) for day in days_qs]
+    days = TimeTable.for_days(days_qs)
     ctx = {"schedule": schedule, "days": days, "form": form}
     return render(request, "symposion/schedule/schedule_edit.html", ctx)
 
@@ -159,63 +204,21 @@ def schedule_slot_edit(request, slug, slot_pk):
 
 
 def schedule_json(request):
-    slots = Slot.objects.filter(
-        day__schedule__published=True, day__schedule__hidden=False
-    ).order_by("start")
-
     protocol = request.META.get("HTTP_X_FORWARDED_PROTO", "http")
-    data = []
-    for slot in slots:
-        slot_data = {
-            "room": ", ".join(room["name"] for room in slot.rooms.values()),
-            "rooms": [room["name"] for room in slot.rooms.values()],
-            "start": slot.start.isoformat(),
-            "end": slot.end.isoformat(),
-            "duration": slot.length_in_minutes,
-            "kind": slot.kind.label,
-            "section": slot.day.schedule.section.slug,
-            "conf_key": slot.pk,
-            # TODO: models should be changed.
-            # these are model features from other conferences that have
-            # forked symposion these have been used almost everywhere
-            # and are good candidates for base proposals
-            "license": "",
-            "tags": "",
-            "released": True,
-            "contact": [],
-        }
-        if hasattr(slot.content, "proposal"):
-            slot_data.update(
-                {
-                    "name": slot.content.title,
-                    "authors": [s.name for s in slot.content.speakers()],
-                    "contact": [s.email for s in slot.content.speakers()]
-                    if request.user.is_staff
-                    else ["redacted"],
-                    "abstract": slot.content.abstract,
-                    "description": slot.content.description,
-                    "conf_url": "%s://%s%s"
-                    % (
-                        protocol,
-                        Site.objects.get_current().domain,
-                        reverse(
-                            "schedule_presentation_detail",
-                            args=[slot.content.pk, slot.content.slug],
-                        ),
-                    ),
-                    "cancelled": slot.content.cancelled,
-                }
-            )
-        else:
-            slot_data.update(
-                {
-                    "name": slot.content_override
-                    if slot.content_override
-                    else "Slot"
-                }
-            )
-        data.append(slot_data)
+    snapshot = get_schedule_json(request.user.is_staff, protocol)
 
-    return HttpResponse(
-        json.dumps({"schedule": data}), content_type="application/json"
+    # Clients that already have the current feed get an empty response.
+    response = get_conditional_response(
+        request,
+        etag=snapshot["etag"],
+        last_modified=snapshot["last_modified"],
     )
+    if response is None:
+        response = HttpResponse(
+            snapshot["content"], content_type="application/json"
+        )
+    response["ETag"] = snapshot["etag"]
+    response["Last-Modified"] = http_date(snapshot["last_modified"])
+    # Staff members receive a different variant of the feed.
+    patch_vary_headers(response, ["Cookie"])
+    return response
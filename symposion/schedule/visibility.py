@@ -0,0 +1,51 @@
+"""
+Whether schedule content is visible to the public.
+
+The primary keys of sections with published schedules are cached,
+and the cache is cleared whenever a schedule is saved or deleted.
+"""
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.core.cache import cache
+
+from symposion.schedule.models import Schedule
+
+
+PUBLISHED_SECTIONS_CACHE_KEY = "schedule_published_section_pks"
+
+
+def published_section_pks():
+    """Return the primary keys of sections with published schedules."""
+    section_pks = cache.get(PUBLISHED_SECTIONS_CACHE_KEY)
+    if section_pks is None:
+        section_pks = frozenset(
+            Schedule.objects.filter(published=True).values_list(
+                "section", flat=True
+            )
+        )
+        cache.set(
+            PUBLISHED_SECTIONS_CACHE_KEY,
+            section_pks,
+            settings.CACHE_TIMEOUT_LONG,
+        )
+    return section_pks
+
+
+def any_schedule_published():
+    """Determine whether any schedule has been published."""
+    return bool(published_section_pks())
+
+
+def any_presentation_published(presentations):
+    """Determine whether any presentation is in a published section."""
+    section_pks = published_section_pks()
+    return any(
+        presentation.section_id in section_pks
+        for presentation in presentations
+    )
+
+
+def invalidate_published_sections():
+    """Forget which sections have published schedules."""
+    cache.delete(PUBLISHED_SECTIONS_CACHE_KEY)
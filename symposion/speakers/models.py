@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 from django.db import models
+from django.db.models import Prefetch, Q
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -11,6 +12,32 @@ from autoslug.fields import AutoSlugField
 from symposion.markdown_parser import parse
 
 
+class SpeakerQuerySet(models.QuerySet):
+    def _presentation_model(self):
+        return self.model._meta.get_field("presentations").related_model
+
+    def with_presentations(self):
+        """Filter to speakers of at least one presentation."""
+        return self.filter(
+            Q(presentations__isnull=False) | Q(copresentations__isnull=False)
+        ).distinct()
+
+    def prefetch_presentations(self):
+        """
+        Prefetch speakers' presentations along with their kinds.
+
+        Speaker.all_presentations and not_cancelled_presentations
+        then run no further queries.
+        """
+        presentations = self._presentation_model().objects.select_related(
+            "proposal_base__kind"
+        )
+        return self.prefetch_related(
+            Prefetch("presentations", queryset=presentations),
+            Prefetch("copresentations", queryset=presentations),
+        )
+
+
 class Speaker(models.Model):
 
     SESSION_COUNT_CHOICES = [(1, "One"), (2, "Two")]
@@ -83,6 +110,14 @@ class Speaker(models.Model):
     created = models.DateTimeField(
         default=timezone.now, editable=False, verbose_name=_("Created")
     )
+    date_last_modified = models.DateTimeField(
+        auto_now=True,
+        db_index=True,
+        null=True,
+        verbose_name=_("Last modified"),
+    )
+
+    objects = SpeakerQuerySet.as_manager()
 
     class Meta:
         ordering = ["name"]
@@ -108,21 +143,25 @@ class Speaker(models.Model):
 
     @property
     def all_presentations(self):
-        presentations = []
-        if self.presentations:
-            for p in self.presentations.all():
-                presentations.append(p)
-            for p in self.copresentations.all():
-                presentations.append(p)
-        return presentations
+        return list(self.presentations.all()) + list(
+            self.copresentations.all()
+        )
 
     @property
     def not_cancelled_presentations(self):
         """Property containing non-cancelled presentations."""
-        presentations = []
-        if self.presentations:
-            for p in self.presentations.exclude(cancelled=True):
-                presentations.append(p)
-            for p in self.copresentations.exclude(cancelled=True):
-                presentations.append(p)
-        return presentations
+        return [p for p in self.all_presentations if not p.cancelled]
+
+    def get_presentations(self):
+        """
+        Return a queryset of this speaker's presentations,
+        including those with additional speakers, along with their kinds.
+        """
+        presentation_model = self.presentations.model
+        return (
+            presentation_model.objects.filter(
+                Q(speaker=self) | Q(additional_speakers=self)
+            )
+            .select_related("proposal_base__kind", "section")
+            .distinct()
+        )
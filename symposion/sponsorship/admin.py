@@ -123,8 +123,8 @@ class SponsorAdmin(admin.ModelAdmin):
 
     def save_related(self, request, form, formsets, change):
         super(SponsorAdmin, self).save_related(request, form, formsets, change)
-        obj = form.instance
-        obj.save()
+        # Inline sponsor benefits may have been changed or deleted.
+        form.instance.update_benefit_completeness()
 
 
 class BenefitAdmin(admin.ModelAdmin):
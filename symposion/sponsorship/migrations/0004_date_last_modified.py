@@ -0,0 +1,18 @@
+# Generated by Django 3.0.10 on 2026-10-18 02:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('symposion_sponsorship', '0003_language_updates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sponsor',
+            name='date_last_modified',
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True, verbose_name='Last modified'),
+        ),
+    ]
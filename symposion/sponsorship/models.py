@@ -1,5 +1,7 @@
 from __future__ import unicode_literals
 
+from collections import defaultdict
+
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
@@ -45,6 +47,7 @@ BENEFITS = [
         "column_title": _("Print Desc"),
     },
 ]
+BENEFIT_NAMES = [benefit["name"] for benefit in BENEFITS]
 
 
 class SponsorLevel(models.Model):
@@ -91,6 +94,9 @@ class Sponsor(models.Model):
         SponsorLevel, on_delete=models.CASCADE, verbose_name=_("level")
     )
     added = models.DateTimeField(_("added"), default=timezone.now)
+    date_last_modified = models.DateTimeField(
+        _("Last modified"), auto_now=True, db_index=True, null=True
+    )
     active = models.BooleanField(_("active"), default=False)
 
     # Denormalization (this assumes only one logo)
@@ -133,10 +139,7 @@ class Sponsor(models.Model):
 
     def save(self, *args, **kwargs):
         # Set fields related to benefits being complete
-        for benefit in BENEFITS:
-            field_name = benefit["field_name"]
-            benefit_name = benefit["name"]
-            setattr(self, field_name, self.benefit_is_complete(benefit_name))
+        set_benefit_completeness([self])
         super(Sponsor, self).save(*args, **kwargs)
 
     def get_absolute_url(self):
@@ -159,7 +162,9 @@ class Sponsor(models.Model):
             if benefits.count():
                 if benefits[0].upload:
                     self.sponsor_logo = benefits[0]
-                    self.save()
+                    Sponsor.objects.filter(pk=self.pk).update(
+                        sponsor_logo=self.sponsor_logo
+                    )
         if self.sponsor_logo:
             return self.sponsor_logo.upload
 
@@ -180,60 +185,141 @@ class Sponsor(models.Model):
         Reset all benefits for this sponsor to the defaults for their
         sponsorship level.
         """
-        level = None
-
-        try:
-            level = self.level
-        except SponsorLevel.DoesNotExist:
-            pass
-
-        allowed_benefits = []
-        if level:
-            for benefit_level in level.benefit_levels.all():
-                # Create all needed benefits if they don't exist already
-                sponsor_benefit, created = SponsorBenefit.objects.get_or_create(        # noqa: E501
-                    sponsor=self, benefit=benefit_level.benefit
-                )
-
-                # and set to default limits for this level.
-                sponsor_benefit.max_words = benefit_level.max_words
-                sponsor_benefit.other_limits = benefit_level.other_limits
-
-                # and set to active
-                sponsor_benefit.active = True
-
-                # @@@ We don't call sponsor_benefit.clean here. This means
-                # that if the sponsorship level for a sponsor is adjusted
-                # downwards, an existing too-long text entry can remain,
-                # and won't raise a validation error until it's next
-                # edited.
-                sponsor_benefit.save()
+        benefit_levels = []
+        if self.level_id is not None:
+            benefit_levels = list(
+                BenefitLevel.objects.filter(level_id=self.level_id)
+                .select_related("benefit")
+                .order_by("pk")
+            )
+        allowed_benefit_ids = [
+            benefit_level.benefit_id for benefit_level in benefit_levels
+        ]
+
+        existing_benefits = {}
+        for sponsor_benefit in self.sponsor_benefits.filter(
+            benefit_id__in=allowed_benefit_ids
+        ).order_by("pk"):
+            existing_benefits.setdefault(
+                sponsor_benefit.benefit_id, sponsor_benefit
+            )
 
-                allowed_benefits.append(sponsor_benefit.pk)
+        new_benefits = []
+        changed_benefits = []
+        for benefit_level in benefit_levels:
+            # Create all needed benefits if they don't exist already
+            sponsor_benefit = existing_benefits.get(benefit_level.benefit_id)
+            if sponsor_benefit is None:
+                sponsor_benefit = SponsorBenefit(sponsor=self)
+                new_benefits.append(sponsor_benefit)
+            else:
+                changed_benefits.append(sponsor_benefit)
+            sponsor_benefit.benefit = benefit_level.benefit
+
+            # and set to default limits for this level.
+            sponsor_benefit.max_words = benefit_level.max_words
+            sponsor_benefit.other_limits = benefit_level.other_limits
+
+            # and set to active
+            sponsor_benefit.active = True
+            sponsor_benefit.is_complete = sponsor_benefit._is_complete()
+
+        # @@@ Benefits are written in bulk, without calling
+        # sponsor_benefit.clean. This means that if the sponsorship level
+        # for a sponsor is adjusted downwards, an existing too-long text
+        # entry can remain, and won't raise a validation error until
+        # it's next edited.
+        if new_benefits:
+            SponsorBenefit.objects.bulk_create(new_benefits)
+        if changed_benefits:
+            SponsorBenefit.objects.bulk_update(
+                changed_benefits,
+                ["max_words", "other_limits", "active", "is_complete"],
+            )
 
         # Any remaining sponsor benefits that don't normally belong to
         # this level are set to inactive
-        self.sponsor_benefits.exclude(pk__in=allowed_benefits).update(
-            active=False, max_words=None, other_limits=""
+        self.sponsor_benefits.exclude(
+            benefit_id__in=allowed_benefit_ids
+        ).update(
+            active=False, max_words=None, other_limits="", is_complete=False
         )
 
+        self.update_benefit_completeness()
+
     def send_coordinator_emails(self):
         pass  # @@@ should this just be done centrally?
 
-    def benefit_is_complete(self, name):
-        """Return True - benefit is complete, False - benefit is not complete,
-         or None - benefit not applicable for this sponsor's level """
-        if BenefitLevel.objects.filter(
-            level=self.level, benefit__name=name
-        ).exists():
-            try:
-                benefit = self.sponsor_benefits.get(benefit__name=name)
-            except SponsorBenefit.DoesNotExist:
-                return False
+    def update_benefit_completeness(self, **fields):
+        """
+        Store this sponsor's benefit completeness and any other `fields`
+        with a single UPDATE, without saving the sponsor.
+        """
+        update_benefit_completeness([self], **fields)
+
+
+def set_benefit_completeness(sponsors):
+    """
+    Set the fields of BENEFITS on sponsors to whether each benefit is
+    complete, or to None if it is not applicable for the sponsor's level.
+
+    Benefit levels and sponsor benefits are each loaded with one query,
+    however many sponsors there are.
+    """
+    applicable_benefits = set(
+        BenefitLevel.objects.filter(
+            level_id__in=set(sponsor.level_id for sponsor in sponsors),
+            benefit__name__in=BENEFIT_NAMES,
+        ).values_list("level_id", "benefit__name")
+    )
+    sponsor_ids = [sponsor.pk for sponsor in sponsors if sponsor.pk]
+    completeness = {}
+    if sponsor_ids:
+        sponsor_benefits = (
+            SponsorBenefit.objects.filter(
+                sponsor_id__in=sponsor_ids, benefit__name__in=BENEFIT_NAMES
+            )
+            .order_by("-active", "pk")
+            .values_list("sponsor_id", "benefit__name", "is_complete")
+        )
+        for sponsor_id, benefit_name, is_complete in sponsor_benefits:
+            completeness.setdefault((sponsor_id, benefit_name), is_complete)
+
+    for sponsor in sponsors:
+        for benefit in BENEFITS:
+            if (sponsor.level_id, benefit["name"]) in applicable_benefits:
+                is_complete = completeness.get(
+                    (sponsor.pk, benefit["name"]), False
+                )
             else:
-                return benefit.is_complete
-        else:
-            return None  # Not an applicable benefit for this sponsor's level
+                # Not an applicable benefit for this sponsor's level
+                is_complete = None
+            setattr(sponsor, benefit["field_name"], is_complete)
+
+
+def update_benefit_completeness(sponsors, **fields):
+    """
+    Set and store the benefit completeness of sponsors, along with any
+    other `fields`.
+
+    Sponsors are not saved, so no signals are sent. Sponsors whose
+    benefits are equally complete are updated together.
+    """
+    set_benefit_completeness(sponsors)
+    sponsor_ids = defaultdict(list)
+    for sponsor in sponsors:
+        for name, value in fields.items():
+            setattr(sponsor, name, value)
+        completeness = tuple(
+            getattr(sponsor, benefit["field_name"]) for benefit in BENEFITS
+        )
+        sponsor_ids[completeness].append(sponsor.pk)
+    for completeness, ids in sponsor_ids.items():
+        values = dict(
+            zip([benefit["field_name"] for benefit in BENEFITS], completeness)
+        )
+        values.update(fields)
+        Sponsor.objects.filter(pk__in=ids).update(**values)
 
 
 def _store_initial_level(sender, instance, **kwargs):
@@ -411,12 +497,28 @@ class SponsorBenefit(models.Model):
         )
 
 
-def _denorm_weblogo(sender, instance, created, **kwargs):
+def _store_initial_is_complete(sender, instance, **kwargs):
+    if instance:
+        instance._initial_is_complete = instance.is_complete
+
+
+post_init.connect(_store_initial_is_complete, sender=SponsorBenefit)
+
+
+def _denorm_sponsor(sender, instance, created, **kwargs):
+    # Sponsors are updated rather than saved, so that saving them does
+    # not recompute their benefits again.
     if instance:
+        fields = {}
         if instance.benefit.type == "weblogo" and instance.upload:
-            sponsor = instance.sponsor
-            sponsor.sponsor_logo = instance
-            sponsor.save()
+            if instance.sponsor.sponsor_logo_id != instance.pk:
+                fields["sponsor_logo"] = instance
+        if fields or (
+            instance.benefit.name in BENEFIT_NAMES
+            and instance.is_complete != instance._initial_is_complete
+        ):
+            instance.sponsor.update_benefit_completeness(**fields)
+        instance._initial_is_complete = instance.is_complete
 
 
-post_save.connect(_denorm_weblogo, sender=SponsorBenefit)
+post_save.connect(_denorm_sponsor, sender=SponsorBenefit)
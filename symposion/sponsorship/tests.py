@@ -2,20 +2,23 @@ from io import BytesIO
 import os
 import shutil
 import tempfile
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.urls import reverse
 
 from symposion.conference.models import Conference
 from symposion.sponsorship.models import (
     Benefit,
+    BenefitLevel,
     Sponsor,
     SponsorBenefit,
     SponsorLevel,
+    set_benefit_completeness,
 )
 
 
@@ -63,7 +66,7 @@ class TestSponsorZipDownload(TestCase):
             'attachment; filename="sponsorlogos.zip"',
             rsp["Content-Disposition"],
         )
-        zipfile = ZipFile(BytesIO(rsp.content), "r")
+        zipfile = ZipFile(BytesIO(b"".join(rsp.streaming_content)), "r")
         # Check out the zip - testzip() returns None if no errors found
         self.assertIsNone(zipfile.testzip())
         # Compare contents to what is expected
@@ -73,6 +76,7 @@ class TestSponsorZipDownload(TestCase):
             name, size = name_and_size
             self.assertEqual(name, info.filename)
             self.assertEqual(size, info.file_size)
+        return zipfile
 
     def make_temp_file(self, name, size=0):
         # Create a temp file with the given name and size under self.temp_dir
@@ -246,6 +250,49 @@ class TestSponsorZipDownload(TestCase):
                 # Clean up any temp media files
                 shutil.rmtree(self.temp_dir)
 
+    def test_compressed_images_are_stored(self):
+        # Images that are already compressed are not deflated again
+        try:
+            self.temp_dir = tempfile.mkdtemp()
+            with override_settings(MEDIA_ROOT=self.temp_dir):
+                self.make_temp_file("logo.png", 1000)
+                SponsorBenefit.objects.create(
+                    sponsor=self.sponsor,
+                    benefit=self.weblogo_benefit,
+                    upload="logo.png",
+                )
+                self.make_temp_file("logo.eps", 1000)
+                SponsorBenefit.objects.create(
+                    sponsor=self.sponsor,
+                    benefit=self.printlogo_benefit,
+                    upload="logo.eps",
+                )
+
+                with CaptureQueriesContext(connection) as queries:
+                    rsp = self.client.get(self.url)
+                # Sponsor benefits are fetched with one query
+                sponsorship_queries = [
+                    query
+                    for query in queries
+                    if "symposion_sponsorship" in query["sql"]
+                ]
+                self.assertEqual(1, len(sponsorship_queries))
+                zipfile = self.validate_response(
+                    rsp,
+                    [
+                        ("web_logo/lead/big_daddy/logo.png", 1000),
+                        ("print_logo/lead/big_daddy/logo.eps", 1000),
+                    ],
+                )
+                stored, deflated = zipfile.infolist()
+                self.assertEqual(ZIP_STORED, stored.compress_type)
+                self.assertEqual(ZIP_DEFLATED, deflated.compress_type)
+                self.assertLess(deflated.compress_size, 1000)
+                self.assertEqual(b"x" * 1000, zipfile.read(deflated))
+        finally:
+            if hasattr(self, "temp_dir"):
+                shutil.rmtree(self.temp_dir)
+
 
 class TestBenefitValidation(TestCase):
     """
@@ -321,3 +368,104 @@ class TestBenefitValidation(TestCase):
 
     def test_simple_has_both(self):
         self.validate(True, self.simple_type, upload="filename", text="Text")
+
+
+class TestBenefitCompleteness(TestCase):
+    def setUp(self):
+        conference = Conference.objects.create()
+        self.gold_level = SponsorLevel.objects.create(
+            conference=conference, name="Gold", cost=2
+        )
+        self.silver_level = SponsorLevel.objects.create(
+            conference=conference, name="Silver", cost=1
+        )
+        self.weblogo_benefit = Benefit.objects.create(
+            name="Web logo", type="weblogo"
+        )
+        self.description_benefit = Benefit.objects.create(
+            name="Company Description", type="text"
+        )
+        for benefit in [self.weblogo_benefit, self.description_benefit]:
+            BenefitLevel.objects.create(
+                level=self.gold_level, benefit=benefit, max_words=10
+            )
+        BenefitLevel.objects.create(
+            level=self.silver_level, benefit=self.description_benefit
+        )
+        self.sponsor = Sponsor.objects.create(
+            name="Big Daddy", level=self.gold_level
+        )
+
+    def assertCompleteness(self, sponsor, web_logo, company_description):
+        sponsor.refresh_from_db()
+        self.assertEqual(web_logo, sponsor.web_logo_benefit)
+        self.assertEqual(
+            company_description, sponsor.company_description_benefit
+        )
+        self.assertIsNone(sponsor.print_logo_benefit)
+        self.assertIsNone(sponsor.print_description_benefit)
+
+    def test_new_sponsor_gets_level_benefits(self):
+        sponsor_benefits = self.sponsor.sponsor_benefits.order_by("pk")
+        self.assertEqual(
+            [(self.weblogo_benefit, 10), (self.description_benefit, 10)],
+            [
+                (sponsor_benefit.benefit, sponsor_benefit.max_words)
+                for sponsor_benefit in sponsor_benefits
+            ],
+        )
+        self.assertCompleteness(self.sponsor, False, False)
+
+    def test_completing_benefits(self):
+        description = self.sponsor.sponsor_benefits.get(
+            benefit=self.description_benefit
+        )
+        description.text = "We sponsor things."
+        description.save()
+        self.assertCompleteness(self.sponsor, False, True)
+
+        weblogo = self.sponsor.sponsor_benefits.get(
+            benefit=self.weblogo_benefit
+        )
+        weblogo.upload = "logo.png"
+        weblogo.save()
+        self.assertCompleteness(self.sponsor, True, True)
+        self.assertEqual(weblogo, self.sponsor.sponsor_logo)
+
+    def test_saving_sponsor_is_not_cascaded(self):
+        # Two queries for the benefits' completeness, one to save
+        with self.assertNumQueries(3):
+            self.sponsor.save()
+
+    def test_level_change(self):
+        self.sponsor.level = self.silver_level
+        self.sponsor.save()
+        self.assertCompleteness(self.sponsor, None, False)
+        weblogo = self.sponsor.sponsor_benefits.get(
+            benefit=self.weblogo_benefit
+        )
+        self.assertFalse(weblogo.active)
+        description = self.sponsor.sponsor_benefits.get(
+            benefit=self.description_benefit
+        )
+        self.assertTrue(description.active)
+        self.assertIsNone(description.max_words)
+
+    def test_set_benefit_completeness_of_many_sponsors(self):
+        sponsor2 = Sponsor.objects.create(
+            name="Big Mama", level=self.silver_level
+        )
+        sponsor2.sponsor_benefits.update(is_complete=True)
+        sponsors = [
+            Sponsor(pk=self.sponsor.pk, level=self.gold_level),
+            Sponsor(pk=sponsor2.pk, level=self.silver_level),
+        ]
+        with self.assertNumQueries(2):
+            set_benefit_completeness(sponsors)
+        self.assertEqual(
+            [(False, False), (None, True)],
+            [
+                (sponsor.web_logo_benefit, sponsor.company_description_benefit)
+                for sponsor in sponsors
+            ],
+        )
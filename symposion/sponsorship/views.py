@@ -1,17 +1,14 @@
 from __future__ import unicode_literals
 
-from io import BytesIO
 import itertools
 import logging
 import os
-import time
-from zipfile import ZipFile, ZipInfo
 
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
-from django.http import Http404, HttpResponse
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.utils.translation import gettext_lazy as _
 
@@ -21,12 +18,11 @@ from symposion.sponsorship.forms import (
     SponsorBenefitsFormSet,
 )
 from symposion.sponsorship.models import (
-    Benefit,
     Sponsor,
     SponsorBenefit,
-    SponsorLevel,
 )
 from symposion.utils.mail import send_email
+from symposion.utils.zipstream import stream_zip
 
 
 log = logging.getLogger(__name__)
@@ -196,55 +192,49 @@ def sponsor_export_data(request):
     return HttpResponse(data, content_type="text/plain;charset=utf-8")
 
 
+def _zip_dir_name(name):
+    return name.lower().replace(" ", "_").replace("/", "_")
+
+
+def _sponsor_zip_files(sponsor_benefits):
+    for sponsor_benefit in sponsor_benefits:
+        path = sponsor_benefit.upload.path
+        if not os.path.exists(path):
+            log.debug("No such sponsor file: %s" % path)
+            continue
+        full_dir = "/".join(
+            [
+                _zip_dir_name(sponsor_benefit.benefit.name),
+                _zip_dir_name(sponsor_benefit.sponsor.level.name),
+                _zip_dir_name(sponsor_benefit.sponsor.name),
+            ]
+        )
+        fname = os.path.split(sponsor_benefit.upload.name)[-1]
+        yield full_dir + "/" + fname, path
+
+
 @staff_member_required
 def sponsor_zip_logo_files(request):
-    """Return a zip file of sponsor web and print logos"""
-
-    zip_bytesio = BytesIO()
-    zipfile = ZipFile(zip_bytesio, "w")
-    try:
-        benefits = Benefit.objects.all()
-        for benefit in benefits:
-            dir_name = benefit.name.lower().replace(" ", "_").replace("/", "_")
-            for level in SponsorLevel.objects.all():
-                level_name = (
-                    level.name.lower().replace(" ", "_").replace("/", "_")
-                )
-                for sponsor in Sponsor.objects.filter(
-                    level=level, active=True
-                ):
-                    sponsor_name = (
-                        sponsor.name.lower()
-                        .replace(" ", "_")
-                        .replace("/", "_")
-                    )
-                    full_dir = "/".join([dir_name, level_name, sponsor_name])
-                    for sponsor_benefit in SponsorBenefit.objects.filter(
-                        benefit=benefit, sponsor=sponsor, active=True
-                    ).exclude(upload=""):
-                        if os.path.exists(sponsor_benefit.upload.path):
-                            modtime = time.gmtime(
-                                os.stat(sponsor_benefit.upload.path).st_mtime
-                            )
-                            with open(sponsor_benefit.upload.path, "rb") as f:
-                                fname = os.path.split(
-                                    sponsor_benefit.upload.name
-                                )[-1]
-                                zipinfo = ZipInfo(
-                                    filename=full_dir + "/" + fname,
-                                    date_time=modtime,
-                                )
-                                zipfile.writestr(zipinfo, f.read())
-                        else:
-                            log.debug(
-                                "No such sponsor file: %s"
-                                % sponsor_benefit.upload.path
-                            )
-    finally:
-        zipfile.close()
-
-    response = HttpResponse(
-        zip_bytesio.getvalue(), content_type="application/zip"
+    """Stream a zip file of sponsor web and print logos"""
+
+    # Files are grouped by benefit, then by sponsor level and sponsor.
+    sponsor_benefits = list(
+        SponsorBenefit.objects.filter(active=True, sponsor__active=True)
+        .exclude(upload="")
+        .select_related("benefit", "sponsor__level")
+        .order_by(
+            "benefit_id",
+            "sponsor__level__conference_id",
+            "sponsor__level__order",
+            "sponsor__level__pk",
+            "sponsor__name",
+            "sponsor_id",
+            "pk",
+        )
+    )
+    response = StreamingHttpResponse(
+        stream_zip(_sponsor_zip_files(sponsor_benefits)),
+        content_type="application/zip",
     )
     response["Content-Disposition"] = (
         'attachment; filename="sponsorlogos.zip"'
@@ -0,0 +1,75 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from symposion import markdown_parser
+from symposion.markdown_parser import (
+    markdown_cache_key,
+    parse,
+    parse_many,
+    render,
+)
+
+
+class MarkdownParserTestCase(SimpleTestCase):
+    def setUp(self):
+        markdown_parser._local_cache.clear()
+        cache.clear()
+
+    def test_parse(self):
+        self.assertEqual(parse("*Snakes*"), "<p><em>Snakes</em></p>")
+        self.assertEqual(parse(""), "")
+
+    def test_renderer_is_reset(self):
+        """Verify that reusing a renderer does not leak state."""
+        render("Text[^1]\n\n[^1]: A footnote.")
+        self.assertNotIn("footnote", render("Plain text"))
+
+    def test_rendered_html_is_cached(self):
+        parse("*Snakes*")
+        with mock.patch.object(markdown_parser, "render") as mock_render:
+            self.assertEqual(parse("*Snakes*"), "<p><em>Snakes</em></p>")
+            # Rendered HTML is shared with other processes.
+            markdown_parser._local_cache.clear()
+            self.assertEqual(parse("*Snakes*"), "<p><em>Snakes</em></p>")
+        mock_render.assert_not_called()
+        self.assertEqual(
+            cache.get(markdown_cache_key("*Snakes*")),
+            "<p><em>Snakes</em></p>",
+        )
+
+    def test_extensions_are_part_of_cache_key(self):
+        self.assertNotEqual(
+            markdown_cache_key("Text"),
+            markdown_cache_key("Text", extensions=["nl2br"]),
+        )
+        self.assertEqual(
+            parse("One\nTwo", extensions=["nl2br"]), "<p>One<br />\nTwo</p>"
+        )
+        self.assertEqual(parse("One\nTwo"), "<p>One\nTwo</p>")
+
+    def test_parse_many(self):
+        parse("*One*")
+        with mock.patch.object(
+            markdown_parser, "render", wraps=render
+        ) as mock_render:
+            self.assertEqual(
+                parse_many(["*One*", "*Two*", "*One*"]),
+                [
+                    "<p><em>One</em></p>",
+                    "<p><em>Two</em></p>",
+                    "<p><em>One</em></p>",
+                ],
+            )
+        mock_render.assert_called_once_with("*Two*", ("extra",))
+
+    def test_local_cache_is_bounded(self):
+        lru_cache = markdown_parser._LRUCache(2)
+        lru_cache.set("a", 1)
+        lru_cache.set("b", 2)
+        lru_cache.get("a")
+        lru_cache.set("c", 3)
+        self.assertIsNone(lru_cache.get("b"))
+        self.assertEqual(lru_cache.get("a"), 1)
+        self.assertEqual(lru_cache.get("c"), 3)
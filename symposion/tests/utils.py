@@ -0,0 +1,25 @@
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+@contextmanager
+def run_on_commit_callbacks(using=DEFAULT_DB_ALIAS):
+    """
+    Run the transaction.on_commit() callbacks registered in this block.
+
+    TestCase never commits its transactions, so these callbacks would
+    otherwise never run. Yields the list of callbacks, which is filled
+    in when the block exits.
+    """
+    connection = connections[using]
+    start = len(connection.run_on_commit)
+    callbacks = []
+    yield callbacks
+    # Callbacks may register further callbacks.
+    while len(connection.run_on_commit) > start:
+        run_on_commit = connection.run_on_commit[start:]
+        start = len(connection.run_on_commit)
+        for sids, callback in run_on_commit:
+            callbacks.append(callback)
+            callback()
@@ -0,0 +1,28 @@
+from django.db import connection
+
+
+def bulk_create(model, objs):
+    """
+    Insert objects in bulk, making sure that their primary keys are set.
+
+    Databases that cannot return primary keys from bulk inserts
+    (e.g. SQLite during development) insert objects one at a time.
+    """
+    if connection.features.can_return_rows_from_bulk_insert:
+        return model.objects.bulk_create(objs)
+    for obj in objs:
+        obj.save(force_insert=True)
+    return objs
+
+
+def iterate_in_chunks(queryset, chunk_size=500):
+    """
+    Yield the objects of a queryset, loading them in chunks.
+
+    Unlike QuerySet.iterator(), related objects requested with
+    prefetch_related() are loaded once for each chunk.
+    """
+    pks = list(queryset.values_list("pk", flat=True))
+    for start in range(0, len(pks), chunk_size):
+        chunk = queryset.filter(pk__in=pks[start:start + chunk_size])
+        yield from chunk
@@ -5,9 +5,15 @@ from django.utils.html import strip_tags
 
 from django.contrib.sites.models import Site
 
+from symposion.outbox.delivery import enqueue
+
 
 def send_email(to, kind, cc=[], **kwargs):
+    """
+    Render an email message and queue it for delivery.
 
+    Queued messages are sent by the send_queued_email command.
+    """
     current_site = Site.objects.get_current()
 
     ctx = {"current_site": current_site, "STATIC_URL": settings.STATIC_URL}
@@ -30,4 +36,4 @@ def send_email(to, kind, cc=[], **kwargs):
         subject, message_plaintext, from_email, to, cc=cc
     )
     email.attach_alternative(message_html, "text/html")
-    email.send()
+    enqueue(email)
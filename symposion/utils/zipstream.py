@@ -0,0 +1,80 @@
+import os
+import time
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZIP64_LIMIT, ZipFile, ZipInfo
+
+
+# Files that are already compressed gain nothing from being deflated.
+COMPRESSED_EXTENSIONS = {
+    ".gif",
+    ".gz",
+    ".jpeg",
+    ".jpg",
+    ".pdf",
+    ".png",
+    ".webp",
+    ".zip",
+}
+ZIP_CHUNK_SIZE = 64 * 1024
+
+
+class ZipStream(object):
+    """
+    A write-only file that hands over what has been written to it.
+
+    ZipFile cannot seek in it, so it writes each entry's sizes and
+    checksum after the entry's data instead of going back for them.
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def get_compress_type(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension in COMPRESSED_EXTENSIONS:
+        return ZIP_STORED
+    return ZIP_DEFLATED
+
+
+def stream_zip(files, chunk_size=ZIP_CHUNK_SIZE):
+    """
+    Yield a ZIP archive of files in chunks, as it is being written.
+
+    `files` is an iterable of (archive name, path) pairs. Files are
+    read `chunk_size` bytes at a time, so neither a whole file nor
+    the whole archive is ever held in memory.
+    """
+    return (data for data in _write_zip(files, chunk_size) if data)
+
+
+def _write_zip(files, chunk_size):
+    stream = ZipStream()
+    with ZipFile(stream, "w") as zipfile:
+        for name, path in files:
+            stat = os.stat(path)
+            zipinfo = ZipInfo(
+                filename=name, date_time=time.gmtime(stat.st_mtime)[:6]
+            )
+            zipinfo.compress_type = get_compress_type(path)
+            zipinfo.file_size = stat.st_size
+            with open(path, "rb") as f, zipfile.open(
+                zipinfo, "w", force_zip64=stat.st_size > ZIP64_LIMIT
+            ) as entry:
+                for data in iter(lambda: f.read(chunk_size), b""):
+                    entry.write(data)
+                    yield stream.pop()
+            yield stream.pop()
+    # Closing the archive writes its central directory.
+    yield stream.pop()